@@ -0,0 +1,119 @@
+import arcade
+import PIL.Image
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import resource_path
+import texture_cache
+import deck
+from fetch_utility import debug_mode
+
+""" Decodes textures on worker threads during the title sequence and hands them to the texture cache a few per frame """
+
+DECODE_WORKERS = 4
+UPLOAD_PIXELS_PER_FRAME = 2560 * 1920  # About one full screen painting, or a dozen cards, per frame
+
+## The house, the title and the menu background belong to asset_registry, which loads and prefetches them per stage.
+## What is left here is needed later on and never released: the cards, the menu icons and the loading bar.
+MENU_ICONS = {  # The options menu asks for these by name through menu_icon()
+    "checkbox_on": r"assets/original/togglecheckboxyes.png",
+    "checkbox_off": r"assets/original/togglecheckboxno.png",
+    "plus": r"assets/original/Plus.png",
+    "minus": r"assets/original/minus.png",
+}
+MENU_TEXTURE_FILES = list(MENU_ICONS.values()) + [
+    r"assets/original/pBarBackground.png",
+    r"assets/original/pBarStretch.png",
+    r"assets/original/pBarFront.png",
+    r"assets/original/pBarEnd.png",
+]
+
+
+def menu_icon(name):
+    """ A menu icon from the shared texture cache, where the preloader put it """
+    return texture_cache.get_texture(resource_path.path(MENU_ICONS[name]))
+
+
+def startup_texture_paths():
+    """ Everything the game draws after the title screen that no stage scope owns """
+    paths = deck.card_texture_paths()
+    paths += [resource_path.path(file_name) for file_name in MENU_TEXTURE_FILES]
+    return paths
+
+
+def _decode(path):
+    """ Runs on a worker thread, convert() forces PIL to decode the whole PNG here instead of on first draw """
+    return PIL.Image.open(path).convert("RGBA")
+
+
+class AssetPreloader:
+    """
+    PNG decoding happens on a thread pool, which is safe because PIL releases the GIL while inflating.
+    Everything that touches OpenGL (creating the Texture and writing it into the atlas) stays on the
+    main thread in update(), which is called once per frame and stops after UPLOAD_PIXELS_PER_FRAME.
+    """
+
+    def __init__(self, paths):
+        self.paths = [path for path in paths if path not in texture_cache.cache.textures]
+        self.total = len(self.paths)
+        self.uploaded = 0
+        self.failed = 0
+        self.pending = deque()
+        self.pool = None
+        self.started_at = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="preload")
+        for path in self.paths:
+            self.pending.append((path, self.pool.submit(_decode, path)))
+
+    @property
+    def progress(self):
+        """ Fraction of textures ready, 0.0 to 1.0 """
+        if self.total == 0:
+            return 1.0
+        return (self.uploaded + self.failed) / self.total
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def update(self):
+        """ Move decoded images into the texture cache and the GPU, oldest first, until this frame's budget is spent """
+        if not self.pending:
+            return
+
+        atlas = arcade.get_window().ctx.default_atlas
+        pixels = 0
+        while self.pending and pixels < UPLOAD_PIXELS_PER_FRAME:
+            path, future = self.pending[0]
+            if not future.done():
+                break  # Keep the order, the next texture is still decoding
+            self.pending.popleft()
+
+            if path in texture_cache.cache.textures:
+                # Something asked for it before we got here and loaded it the slow way
+                self.uploaded += 1
+                continue
+
+            try:
+                image = future.result()
+            except Exception as e:
+                # Leave it to texture_cache to load on demand and report the error there
+                self.failed += 1
+                if debug_mode:
+                    print(f"Preload failed for {path}: {e}")
+                continue
+
+            texture = arcade.Texture(path, image=image)
+            atlas.add(texture)
+            texture_cache.cache.add(path, texture)
+            pixels += image.width * image.height
+            self.uploaded += 1
+
+        if not self.pending:
+            self.pool.shutdown(wait=False)
+            self.pool = None
+            if debug_mode:
+                print(f"Preloaded {self.uploaded} textures in {time.perf_counter() - self.started_at:.2f}s ({self.failed} failed)")
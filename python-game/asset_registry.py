@@ -0,0 +1,217 @@
+import arcade
+import time
+from collections import OrderedDict
+import resource_path
+import texture_cache
+from asset_preloader import AssetPreloader
+from fetch_utility import debug_mode
+
+""" Stage scoped UI textures, loaded when a stage is entered, released under a memory budget when it is left """
+
+BUDGET_BYTES = 160 * 1024 * 1024  # Resident UI textures, about eight full screen paintings
+ATLAS_REBUILD_BYTES = 64 * 1024 * 1024  # Compact the atlas once this much of it belongs to released textures
+
+## Each scope names its textures so the draw code asks for "left" instead of a path.
+## Scopes are GameState names, plus the overlays that can open on top of any stage.
+## "common" is drawn on almost every stage and is never released.
+STAGE_ASSETS = {
+    "common": {
+        "background": r"assets/original/TableClothbiggerHueShift1.png",
+        "options_cog": r"assets/original/OptionsCog.png",
+    },
+    "TITLE": {
+        "dev_title": r"assets/original/newtitle.png",
+        "game_title": r"assets/original/TitleScreen1.png",
+        "house": r"assets/original/AnimationFrames2.1/NolaHouse2.1.1.png",
+    },
+    "OUTSIDE": {
+        "open_center": r"assets/original/AnimationFrames2.1/NolaHouse2.1.1.png",
+        "open_left": r"assets/original/AnimationFrames2.1/NolaHouse2.1.3.png",
+        "open_right": r"assets/original/AnimationFrames2.1/NolaHouse2.1.2.png",
+        "closed_center": r"assets/original/AnimationFrames2.1/house_closed_center.png",
+        "closed_left": r"assets/original/AnimationFrames2.1/house_closed_left.png",
+        "closed_right": r"assets/original/AnimationFrames2.1/house_closed_right.png",
+        "menu_background": r"assets/original/OptionMenuBackground.png",
+    },
+    "options_menu": {
+        "menu_background": r"assets/original/OptionMenuBackground.png",
+        # The checkbox and +/- icons are not here, they are preloaded once and never released (asset_preloader.menu_icon)
+    },
+    "credits": {
+        "menu_background": r"assets/original/OptionMenuBackground.png",
+    },
+    "connection_popup": {
+        "menu_background": r"assets/original/OptionMenuBackground.png",
+    },
+}
+
+PINNED_SCOPES = {"common"}
+OVERLAY_SCOPES = {"options_menu", "credits", "connection_popup"}  # Entered on first draw, left on the next stage change
+
+# Where the player can go from each stage, prefetched as soon as the stage is entered
+NEXT_STAGES = {
+    "TITLE": ["OUTSIDE"],
+    "OUTSIDE": ["INTRO"],
+    "INTRO": ["SPREAD"],
+    "HISTORY": ["READING_INTRO"],
+    "SPREAD": ["LOADING"],
+    "LOADING": ["READING_INTRO"],
+    "READING_INTRO": ["READING_CARD_1"],
+    "READING_CARD_1": ["READING_CARD_2"],
+    "READING_CARD_2": ["READING_CARD_3"],
+    "READING_CARD_3": ["READING_SUMMARY"],
+    "READING_SUMMARY": ["INTRO", "OUTSIDE"],
+}
+
+
+def texture_bytes(texture):
+    """ What a texture costs in the atlas, RGBA8 """
+    return texture.width * texture.height * 4
+
+
+class AssetRegistry:
+    """
+    Owns the UI textures per scope. enter() resolves a scope through texture_cache, exit() marks it
+    inactive, and inactive scopes are released least recently used first once the resident total goes
+    over the budget. A texture shared by several scopes (the house, the menu background) is only
+    released when no resident scope still lists it.
+    Prefetching reuses AssetPreloader, so the decode runs on worker threads and update() uploads it.
+    """
+
+    def __init__(self, budget_bytes=BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.resident = OrderedDict()  # scope -> {name: Texture}, least recently used first
+        self.active = set()
+        self.expected = set()  # Scopes the current stage is likely to lead to, kept through a trim
+        self.prefetching = {}  # scope -> AssetPreloader
+        self.atlas_freed_bytes = 0
+        self.evictions = 0
+        self.prefetched = 0
+        for scope in PINNED_SCOPES:
+            self.enter(scope)
+
+    ## -------------------- LIFECYCLE -------------------- ##
+
+    def enter(self, scope):
+        """ Make every texture in `scope` resident, loading whatever is not cached yet """
+        self.active.add(scope)
+        if scope not in self.resident:
+            self.resident[scope] = self._resolve(scope)
+        self.resident.move_to_end(scope)
+
+    def exit(self, scope):
+        if scope in PINNED_SCOPES:
+            return
+        self.active.discard(scope)
+        self.trim()
+
+    def change_stage(self, old_stage, new_stage):
+        """ Called by TarotGame whenever game.stage changes """
+        if old_stage == new_stage:
+            return
+        for scope in OVERLAY_SCOPES & self.active:
+            self.active.discard(scope)
+        if old_stage is not None:
+            self.active.discard(old_stage.name)
+        self.enter(new_stage.name)
+        self.expected = set(NEXT_STAGES.get(new_stage.name, []))
+        self.trim()
+        self.compact_atlas()
+        self.prefetch(self.expected)
+
+    def texture(self, scope, name):
+        """ The draw code's way in, enters the scope the first time it is asked for (overlays) """
+        textures = self.resident.get(scope)
+        if textures is None or scope not in self.active:
+            self.enter(scope)
+            textures = self.resident[scope]
+        return textures[name]
+
+    def _resolve(self, scope):
+        return {
+            name: texture_cache.get_texture(resource_path.path(file_name))
+            for name, file_name in STAGE_ASSETS.get(scope, {}).items()
+        }
+
+    ## -------------------- BUDGET -------------------- ##
+
+    def resident_bytes(self):
+        """ Counted once per texture, however many scopes share it """
+        unique = {}
+        for textures in self.resident.values():
+            for texture in textures.values():
+                unique[id(texture)] = texture
+        return sum(texture_bytes(texture) for texture in unique.values())
+
+    def trim(self):
+        """ Release inactive scopes, least recently used first, until we are under budget """
+        for scope in list(self.resident):
+            if self.resident_bytes() <= self.budget_bytes:
+                return
+            if scope in self.active or scope in self.expected or scope in PINNED_SCOPES:
+                continue
+            self.release(scope)
+
+    def release(self, scope):
+        textures = self.resident.pop(scope)
+        still_used = {id(texture) for other in self.resident.values() for texture in other.values()}
+        for name, texture in textures.items():
+            if id(texture) in still_used:
+                continue
+            texture_cache.cache.discard(resource_path.path(STAGE_ASSETS[scope][name]))
+            self.atlas_freed_bytes += texture_bytes(texture)
+        self.evictions += 1
+        if debug_mode:
+            print(f"Released {scope}, {self.resident_bytes() / 1e6:.1f}MB resident")
+
+    def compact_atlas(self):
+        """
+        atlas.remove() only forgets a region, the space stays allocated until the atlas is rebuilt.
+        Rebuilding re-uploads everything still in it, so we only do it on a stage change and only
+        once enough space has been freed to be worth the stall.
+        """
+        if self.atlas_freed_bytes < ATLAS_REBUILD_BYTES:
+            return
+        start = time.perf_counter()
+        arcade.get_window().ctx.default_atlas.rebuild()
+        self.atlas_freed_bytes = 0
+        if debug_mode:
+            print(f"Atlas rebuilt in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    ## -------------------- PREFETCH -------------------- ##
+
+    def prefetch(self, scopes):
+        """ Start decoding the textures of `scopes` in the background, if they are not already resident """
+        for scope in scopes:
+            if scope in self.resident or scope in self.prefetching or not STAGE_ASSETS.get(scope):
+                continue
+            paths = [resource_path.path(file_name) for file_name in STAGE_ASSETS[scope].values()]
+            preloader = AssetPreloader(paths)
+            preloader.start()
+            self.prefetching[scope] = preloader
+
+    def update(self):
+        """ Called from on_update, uploads prefetched textures and files finished scopes as resident but inactive """
+        for scope, preloader in list(self.prefetching.items()):
+            preloader.update()
+            if not preloader.done:
+                continue
+            del self.prefetching[scope]
+            if scope not in self.resident:
+                self.resident[scope] = self._resolve(scope)
+                self.prefetched += 1
+
+    def stats(self):
+        scopes = {
+            scope: sum(texture_bytes(texture) for texture in textures.values())
+            for scope, textures in self.resident.items()
+        }
+        return {
+            "resident_bytes": self.resident_bytes(),
+            "budget_bytes": self.budget_bytes,
+            "scopes": scopes,
+            "active": sorted(self.active),
+            "prefetching": sorted(self.prefetching),
+            "evictions": self.evictions,
+            "prefetched": self.prefetched,
+        }
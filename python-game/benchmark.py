@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+"""
+Headless rendering benchmark, drives TarotGame through every stage and reports frame times as JSON.
+
+Runs on a plain Linux box without a GPU, either through EGL:
+    python benchmark.py --headless --software
+or under a virtual display:
+    LIBGL_ALWAYS_SOFTWARE=1 xvfb-run -a python benchmark.py --output bench.json
+
+No network calls are made, the fortune is synthetic and the RNG is seeded so runs compare.
+"""
+
+FRAME_DT = 1 / 60
+STAGE_ORDER = [
+    "TITLE",
+    "OUTSIDE",
+    "INTRO",
+    "SPREAD",
+    "LOADING",
+    "READING_INTRO",
+    "READING_CARD_1",
+    "READING_CARD_2",
+    "READING_CARD_3",
+    "READING_SUMMARY",
+]
+
+SYNTHETIC_FORTUNE = "\n".join([
+    "Ah, cher, the cards have spoken and they speak plain. You came here with a question sitting heavy on your chest, "
+    "and the spirits have laid three cards down to answer it. Listen close now.",
+    "The first card tells of where you have been. There is a road behind you, long and winding like the river, "
+    "and you walked it with more courage than you give yourself credit for.",
+    "The second card shows where you stand today. Something is asking to be let go of, and holding on tight "
+    "only makes the knot harder to untie. Loosen your grip, child.",
+    "The third card speaks of what is coming. A door is opening that you have not noticed yet. Keep your eyes up "
+    "and your heart open and you will see it when the time is right.",
+    "Put together, the cards say this: honor the road you walked, release what weighs on you, and step through "
+    "that door when it opens. The spirits are with you, cher.",
+])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render every GameState offscreen and report frame times")
+    parser.add_argument("--frames", type=int, default=300, help="Measured frames per stage")
+    parser.add_argument("--warmup", type=int, default=10, help="Frames drawn before measuring each stage")
+    parser.add_argument("--seed", type=int, default=1234, help="RNG seed for the shuffle and card jitter")
+    parser.add_argument("--stages", nargs="*", default=STAGE_ORDER, help="Stages to run, by GameState name")
+    parser.add_argument("--output", default=None, help="Write the JSON here instead of stdout")
+    parser.add_argument("--headless", action="store_true", help="Render through EGL with no window (ARCADE_HEADLESS)")
+    parser.add_argument("--software", action="store_true", help="Force Mesa's llvmpipe software renderer")
+    return parser.parse_args()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def enter_stage(game, stage, game_state, text_utility, categories):
+    """ Put the game into `stage` with everything that stage expects, the way the clicks leading up to it would """
+    text_utility.reset_typing_state(game)
+    game.time_in_state = 0.0
+    game.hovered_button = None
+    game.hovered_card = None
+
+    needs_cards = stage in {
+        game_state.SPREAD,
+        game_state.LOADING,
+        game_state.READING_INTRO,
+        game_state.READING_CARD_1,
+        game_state.READING_CARD_2,
+        game_state.READING_CARD_3,
+        game_state.READING_SUMMARY,
+    }
+    if (needs_cards and game.deck is None) or stage == game_state.SPREAD:
+        game.set_intention(categories[0])
+    if needs_cards and stage != game_state.SPREAD:
+        game.drawn_cards = game.deck.cards[:3]
+        game.selected_cards = list(game.drawn_cards)
+
+    if stage == game_state.LOADING:
+        game.loading_progress = 0.0
+        game.frame_timer = 0
+        game.api_call_complete = False
+        game.fortune_layout = None
+        game.fortune_streaming = False
+        game.fortune_cached = False
+        game.fortune_bytes = 0
+    if stage.name.startswith("READING"):
+        from fortune_layout import layout_fortune  # Imported here like everything else that pulls in arcade
+        game.fortune = text_utility.wrap_text_paragraphs(SYNTHETIC_FORTUNE)
+        game.fortune_layout = layout_fortune(game.fortune)
+
+    game.stage = stage
+
+
+def run_stage(game, stage, args, game_state, text_utility, categories, profiler):
+    enter_stage(game, stage, game_state, text_utility, categories)
+    times = []
+    counts = {counter: 0 for counter in profiler.counters}
+
+    for frame in range(args.warmup + args.frames):
+        game.on_update(FRAME_DT)
+        game.stage = stage  # Hold the stage, the title sequence would move on by itself
+
+        before = dict(profiler.counters)
+        start = time.perf_counter()
+        game.on_draw()
+        game.ctx.finish()  # Wait for the GPU so the frame time includes the actual rendering
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if frame >= args.warmup:
+            times.append(elapsed)
+            for counter in counts:
+                counts[counter] += profiler.counters[counter] - before[counter]
+
+    ordered = sorted(times)
+    result = {
+        "frames": len(times),
+        "mean_ms": sum(times) / len(times) if times else 0.0,
+        "p50_ms": percentile(ordered, .50),
+        "p99_ms": percentile(ordered, .99),
+        "max_ms": ordered[-1] if ordered else 0.0,
+    }
+    for counter, total in counts.items():
+        result[f"{counter}_per_frame"] = total / max(len(times), 1)
+    result["resident_texture_bytes"] = game.assets.stats()["resident_bytes"]
+    return result
+
+
+def main():
+    args = parse_args()
+
+    # Both have to be set before arcade and pyglet are imported
+    if args.headless:
+        os.environ["ARCADE_HEADLESS"] = "1"
+    if args.software:
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+        os.environ["GALLIUM_DRIVER"] = "llvmpipe"
+
+    random.seed(args.seed)
+
+    import text_utility
+    from game import TarotGame, GameState, CATEGORIES
+    from profiler import profiler
+    from reading_store import ReadingStore
+
+    started = time.perf_counter()
+    game = TarotGame(fullscreen=False, reading_store=ReadingStore(":memory:"))  # Never touch the player's saved readings
+    while not game.preloader.done:
+        game.preloader.update()
+    startup_ms = (time.perf_counter() - started) * 1000
+
+    game.scheduler.enabled = False  # Draw every frame we ask for, idle skipping would hide the cost being measured
+    profiler.install()
+    profiler.counting = True
+
+    report = {
+        "meta": {
+            "seed": args.seed,
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "startup_ms": startup_ms,
+            "renderer": game.ctx.info.RENDERER,
+            "gl_version": game.ctx.gl_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "version": game.version,
+        },
+        "stages": {},
+    }
+
+    for name in args.stages:
+        stage = GameState[name]
+        report["stages"][name] = run_stage(game, stage, args, GameState, text_utility, CATEGORIES, profiler)
+
+    game.close()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as report_file:
+            report_file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,47 @@
 import arcade
 import resource_path
+import texture_cache
+
+BUTTON_TEXTURE_PATH = resource_path.path("assets/original/Purple Button Big.png")
+BUTTON_PRESSED_TEXTURE_PATH = resource_path.path("assets/original/Purple Button Pressed Big.png")
 
 class Button():
+    """
+    A retained button, built once per stage and drawn every frame with draw().
+    Both button textures come from the shared texture cache, so every Button points at the same two textures.
+    """
     def __init__(
             self,
-            game,
             name,
             copy,
             x_center,
             y_center,
             text_x_start,
-            text_y_start, 
+            text_y_start,
             width=350,
             height=200,
+            hit_box=None,
         ):
-        button_texture = arcade.load_texture(resource_path.path("assets/original/Purple Button Big.png"))
-        button_pressed_texture = arcade.load_texture(resource_path.path("assets/original/Purple Button Pressed Big.png"))
+        self.name = name
+        self.copy = copy
+        self.x_center = x_center
+        self.y_center = y_center
+        self.width = width
+        self.height = height
+        self.hovered = False
 
-        applied_text = button_pressed_texture if game.hovered_button == name else button_texture
-        
-        arcade.draw_texture_rectangle(
-            x_center,
-            y_center,
-            width,
-            height,
-            applied_text
+        # Clickable area as (left, right, bottom, top), defaults to the drawn rectangle
+        self.hit_box = hit_box or (
+            x_center - width / 2,
+            x_center + width / 2,
+            y_center - height / 2,
+            y_center + height / 2,
         )
-        
-        arcade.draw_text(
+
+        self.texture = texture_cache.get_texture(BUTTON_TEXTURE_PATH)
+        self.pressed_texture = texture_cache.get_texture(BUTTON_PRESSED_TEXTURE_PATH)
+
+        self.label = arcade.Text(
             copy,
             text_x_start,
             text_y_start,
@@ -37,3 +51,22 @@ class Button():
             align="center",
             font_name="Old School Adventures"
         )
+
+    def contains(self, x, y):
+        """ Check if a point in game coordinates is inside the button's hit box """
+        left, right, bottom, top = self.hit_box
+        return left <= x <= right and bottom <= y <= top
+
+    def draw(self, game):
+        self.hovered = game.hovered_button == self.name
+
+        arcade.draw_texture_rectangle(
+            self.x_center,
+            self.y_center,
+            self.width,
+            self.height,
+            self.pressed_texture if self.hovered else self.texture
+        )
+
+        if self.copy:
+            self.label.draw()
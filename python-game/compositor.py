@@ -0,0 +1,108 @@
+import arcade
+from fetch_utility import debug_mode
+
+""" Static parts of a stage rendered once into offscreen layers and composited as one quad each """
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 960
+MAX_LAYER_SCALE = 2  # A 2560x1920 fullscreen window gets a full resolution layer, anything bigger is upscaled
+
+
+def layer_scale():
+    """ Pixels per game unit in the window right now, so a baked layer is as sharp as drawing live """
+    _width, height = arcade.get_window().get_framebuffer_size()
+    return max(1, min(MAX_LAYER_SCALE, round(height / SCREEN_HEIGHT)))
+
+
+class Layer:
+    """
+    One screen sized texture that `paint(game)` draws into whenever the key it is drawn with changes.
+    The key is whatever the layer's picture depends on (hovered button, volume, the cards on the table),
+    so an unchanged frame costs a comparison and one textured quad.
+
+    Layers are baked over a transparent background with arcade's normal blending, which leaves the colour
+    premultiplied by alpha, so they are composited with (ONE, ONE_MINUS_SRC_ALPHA) rather than the default.
+    Translucent fills like the dark overlay behind the menus are drawn live for the same reason.
+    """
+
+    def __init__(self, name, paint):
+        self.name = name
+        self.paint = paint
+        self.scale = None
+        self.atlas = None
+        self.texture = None
+        self.sprite_list = None
+        self.key = None
+        self.valid = False
+        self.renders = 0
+        self.composites = 0
+
+    def _ensure_gl(self):
+        scale = layer_scale()
+        if self.atlas is not None and scale == self.scale:
+            return
+        # Created on first use since it needs the window's GL context, and again if the window's pixel density changes
+        self.scale = scale
+        size = (SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale)
+        self.atlas = arcade.TextureAtlas((size[0] + 2, size[1] + 2), auto_resize=False)
+        self.texture = arcade.Texture.create_empty(f"layer_{self.name}", size)
+        self.atlas.add(self.texture)
+        self.sprite_list = arcade.SpriteList(atlas=self.atlas, capacity=1)
+        sprite = arcade.Sprite(texture=self.texture, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
+        sprite.width = SCREEN_WIDTH
+        sprite.height = SCREEN_HEIGHT
+        self.sprite_list.append(sprite)
+        self.valid = False
+
+    def invalidate(self):
+        """ Repaint on the next draw whatever the key says """
+        self.valid = False
+
+    def draw(self, game, key=None):
+        self._ensure_gl()
+
+        if not self.valid or key != self.key:
+            self.atlas.fbo.clear()
+            with self.atlas.render_into(self.texture, projection=(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT)):
+                self.paint(game)
+            self.key = key
+            self.valid = True
+            self.renders += 1
+            if debug_mode:
+                print(f"Layer {self.name} repainted ({self.renders} times)")
+
+        ctx = self.sprite_list.ctx
+        self.sprite_list.draw(blend_function=(ctx.ONE, ctx.ONE_MINUS_SRC_ALPHA))
+        ctx.blend_func = ctx.BLEND_DEFAULT  # Shape drawing does not reset it, so put it back for whatever comes next
+        self.composites += 1
+
+
+class Compositor:
+    """ Named layers, each with its own painter, shared by every stage that draws them """
+
+    def __init__(self):
+        self.layers = {}
+
+    def layer(self, name, paint):
+        """ Register a painter once and get its Layer back, calling it again returns the same Layer """
+        if name not in self.layers:
+            self.layers[name] = Layer(name, paint)
+        return self.layers[name]
+
+    def draw(self, name, paint, game, key=None):
+        self.layer(name, paint).draw(game, key)
+
+    def invalidate(self, name=None):
+        """ Force a repaint of one layer, or of all of them when the window or the fonts change """
+        for layer_name, layer in self.layers.items():
+            if name is None or layer_name == name:
+                layer.invalidate()
+
+    def stats(self):
+        return {
+            name: {"renders": layer.renders, "composites": layer.composites}
+            for name, layer in self.layers.items()
+        }
+
+
+compositor = Compositor()
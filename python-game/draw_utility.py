@@ -1,9 +1,11 @@
 import arcade
 import arcade.color
+import time
 from button import Button
 import text_utility as TEXT
-import resource_path
-from game import GameState
+from hit_regions import CATEGORY_BUTTON_POSITIONS, MENU_ROWS, HISTORY_ROWS, HISTORY_ROW_X, region_boxes
+from compositor import compositor
+from asset_preloader import menu_icon
 
 DEFAULT_FONT_SIZE = 16
 SCREEN_WIDTH = 1280
@@ -20,9 +22,75 @@ INTRO_TEXT = (
 
 CATEGORIES = ["Love Life", "Professional Development", "Family and Friends", "Health", "Personal Growth", "Gain Clarity"]
 
+def build_buttons(game):
+    """
+    Build every button in the game once, keyed by where it is drawn.
+    Stages draw them with game.buttons[key].draw(game) instead of constructing new ones each frame.
+    Buttons that share a key with another stage (exit, retry, close) are the same button in the same place.
+    """
+    small_button = dict(width=350 // 2, height=200 // 2)
+    buttons = {
+        ## -------------------- OUTSIDE / CLOSED / POPUP -------------------- ##
+        "exit_game": Button("exit_game", "Exit", game.x_right_button + 200, 50,
+                            game.x_right_button + 75, 45, **small_button),
+        "credits": Button("credits", "Credits", game.x_right_button + 200, 125,
+                          game.x_right_button + 75, 115, **small_button),
+        "step_inside": Button("step_inside", "Step Inside", SCREEN_WIDTH // 2, 100,
+                              SCREEN_WIDTH // 2 - 125, 95),
+        "retry": Button("retry", "Retry Connection", SCREEN_WIDTH // 2, 100,
+                        SCREEN_WIDTH // 2 - 125, 115),
+
+        ## -------------------- SPREAD -------------------- ##
+        "pull_next": Button("pull_next", "Pull Next Card", game.x_middle_button, 100,
+                            game.x_middle_button - 125, 95),
+        "begin_reading": Button("begin_reading", "Begin Reading", game.x_middle_button, 100,
+                                game.x_middle_button - 125, 95),
+
+        ## -------------------- READING -------------------- ##
+        "reading_intro_next": Button("next_card", "First Card", game.x_middle_button, 100,
+                                     game.x_middle_button - 125, 95),
+        "reading_card_next": Button("next_card", "Next Card", game.x_right_button, 100,
+                                    game.x_right_button - 125, 95),
+        "reading_card_summary": Button("next_card", "Summary", game.x_right_button, 100,
+                                       game.x_right_button - 125, 95),
+        "reading_card_previous": Button("previous_card", "Previous Card", game.x_left_button, 100,
+                                        game.x_left_button - 125, 95),
+        "new_reading": Button("new_reading", "New Reading", game.x_middle_button, 100,
+                              game.x_middle_button - 125, 95),
+        "go_outside": Button("go_outside", "Go Outside", game.x_right_button + 100, 100,
+                             game.x_right_button - 25, 95),
+        "reading_summary_previous": Button("previous_card", "Previous", game.x_left_button - 100, 100,
+                                           game.x_left_button - 225, 95),
+
+        ## -------------------- HISTORY -------------------- ##
+        "history": Button("history", "History", 130, 900, 5, 890, **small_button),
+        "history_back": Button("history_back", "Back", game.x_left_button, 100,
+                               game.x_left_button - 125, 95),
+        "history_newer": Button("history_newer", "Newer", game.x_middle_button, 100,
+                                game.x_middle_button - 125, 95),
+        "history_older": Button("history_older", "Older", game.x_right_button, 100,
+                                game.x_right_button - 125, 95),
+
+        ## -------------------- MENUS -------------------- ##
+        "options": Button("options", "", game.x_right_button + 250, 900,
+                          game.x_right_button + 75, 545, width=200 // 2, height=200 // 2),
+        "close_menu": Button("close_menu", "Close", game.x_middle_button, 250,
+                             game.x_middle_button - 125, 245, width=195, height=115),  # Scaled down
+    }
+
+    for i, (x, y) in enumerate(CATEGORY_BUTTON_POSITIONS):
+        buttons[f"button_{i}"] = Button(f"button_{i}", CATEGORIES[i], x, y, x - 125, y)
+
+    # Hit boxes come from the same table mouse_input reads
+    boxes = region_boxes(game)
+    for key, button in buttons.items():
+        button.hit_box = boxes[key]
+
+    return buttons
+
 def draw_title_stage(game):
-    dev_title = arcade.load_texture(resource_path.path("assets/original/newtitle.png"))
-    game_title = arcade.load_texture(resource_path.path("assets/original/TitleScreen1.png"))
+    dev_title = game.assets.texture("TITLE", "dev_title")
+    game_title = game.assets.texture("TITLE", "game_title")
     
 
     fade_duration = 1.5
@@ -63,25 +131,19 @@ def draw_title_stage(game):
     # Draw images with calculated alpha values
     arcade.draw_lrwh_rectangle_textured(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, dev_title, alpha=alpha_1)
     arcade.draw_lrwh_rectangle_textured(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, game_title, alpha=alpha_2)
-    arcade.draw_lrwh_rectangle_textured(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, game.outside_frame_center, alpha=alpha_3)
+    house = game.assets.texture("TITLE", "house")
+    arcade.draw_lrwh_rectangle_textured(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, house, alpha=alpha_3)
 def draw_outside_stage(game):
     def draw_oustside_open(game):
-        game.outside_frame_center = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.1.png"))
-        game.outside_frame_left = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.3.png"))
-        game.outside_frame_right = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.2.png"))
-
-
         current_state = game.states[game.state_index]
         if current_state == "LEFT":
             
-            current_texture = game.outside_frame_left
-        elif current_state == "CENTER":
-            current_texture = game.outside_frame_center
+            current_texture = game.assets.texture("OUTSIDE", "open_left")
         elif current_state == "RIGHT":
             
-            current_texture = game.outside_frame_right
+            current_texture = game.assets.texture("OUTSIDE", "open_right")
         else:
-            current_texture = game.outside_frame_center  # fallback
+            current_texture = game.assets.texture("OUTSIDE", "open_center")  # CENTER, and the fallback
 
     
         arcade.draw_lrwh_rectangle_textured(
@@ -90,60 +152,27 @@ def draw_outside_stage(game):
             current_texture
         )
 
-        Button(
-            game=game,
-            name='exit_game',
-            copy="Exit",
-            x_center=game.x_right_button+200,
-            y_center=50,
-            width=350 //2,
-            height=200 // 2,
-            text_x_start=game.x_right_button + 75,
-            text_y_start=45,
-        )
+        game.buttons["exit_game"].draw(game)
 
         
-        Button(
-                game=game,
-                name='credits',
-                copy="Credits",
-                x_center=game.x_right_button+200,
-                y_center= 125,
-                width=350 //2,
-                height=200 // 2,
-                text_x_start=game.x_right_button + 75,
-                text_y_start=115,
-            )
-
-        Button(
-            game=game,
-            name='step_inside',
-            copy="Step Inside",
-            x_center=SCREEN_WIDTH // 2,
-            y_center=100,
-            text_x_start=SCREEN_WIDTH // 2 - 125,
-            text_y_start=95,
-        )
+        game.buttons["credits"].draw(game)
+
+        game.buttons["step_inside"].draw(game)
 
 
 
-    def draw_outside_closed(game):
-        game.outside_frame_center = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/house_closed_center.png"))
-        game.outside_frame_left = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/house_closed_left.png"))
-        game.outside_frame_right = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/house_closed_right.png"))
-        menu_background = arcade.load_texture(resource_path.path(r"assets/original/OptionMenuBackground.png"))
+    def draw_outside_closed(game, checking=False):
+        menu_background = game.assets.texture("OUTSIDE", "menu_background")
 
         current_state = game.states[game.state_index]
         if current_state == "LEFT":
             
-            current_texture = game.outside_frame_left
-        elif current_state == "CENTER":
-            current_texture = game.outside_frame_center
+            current_texture = game.assets.texture("OUTSIDE", "closed_left")
         elif current_state == "RIGHT":
             
-            current_texture = game.outside_frame_right
+            current_texture = game.assets.texture("OUTSIDE", "closed_right")
         else:
-            current_texture = game.outside_frame_center  # fallback
+            current_texture = game.assets.texture("OUTSIDE", "closed_center")  # CENTER, and the fallback
 
     
         arcade.draw_lrwh_rectangle_textured(
@@ -152,17 +181,9 @@ def draw_outside_stage(game):
             current_texture
         )
 
-        Button(
-            game=game,
-            name='exit_game',
-            copy="Exit",
-            x_center=game.x_right_button+200,
-            y_center=50,
-            width=350 //2,
-            height=200 // 2,
-            text_x_start=game.x_right_button + 75,
-            text_y_start=45,
-        )
+        game.buttons["exit_game"].draw(game)
+        if checking:
+            return  # Still waiting on check_token_usage, nothing to say yet
              
         arcade.draw_texture_rectangle(
         center_x=SCREEN_WIDTH // 2,
@@ -179,15 +200,7 @@ def draw_outside_stage(game):
             closed_text = "Sorry Cher, we are closed for now,\n\n check back on the 1st of the month"
         
         if game.connection_popup_open:
-             Button(
-            game=game,
-            name='retry',
-            copy="Retry Connection",
-            x_center=SCREEN_WIDTH // 2,
-            y_center=100,
-            text_x_start=SCREEN_WIDTH // 2 - 125,
-            text_y_start=115,
-        )
+             game.buttons["retry"].draw(game)
             
         
     #set_paragraph_typing is needed to set up what goes into typewriter_lines
@@ -205,7 +218,9 @@ def draw_outside_stage(game):
             line_height=DEFAULT_LINE_HEIGHT * 1.5,
         )
 
-    if game.has_tokens == True and game.internet_connected == True and game.server_connected == True:
+    if game.token_check_pending:
+         draw_outside_closed(game, checking=True)
+    elif game.has_tokens == True and game.internet_connected == True and game.server_connected == True:
          draw_oustside_open(game)
         #  game.has_tokens = False ##debug add this to test closed screen
     else:
@@ -233,44 +248,49 @@ def draw_intro_stage(game):
             line_height=DEFAULT_LINE_HEIGHT * 1.5,
         )
 
-        # Button positions
-        button_positions = [
-            (275, 300),  # Button 0
-            (650, 300),  # Button 1
-            (1025, 300),  # Button 2
-            (275, 150),  # Button 3
-            (650, 150),    # Button 4
-            (1025, 150)     # Button 5
-        ]
-
         # Loop through categories and draw buttons
-        for i, (x, y) in enumerate(button_positions):
-            Button(
-                game=game,
-                name=f"button_{i}",
-                copy=CATEGORIES[i],
-                x_center=x,
-                y_center=y,
-                text_x_start=x-125,
-                text_y_start=y,
-            )
+        for i in range(len(CATEGORY_BUTTON_POSITIONS)):
+            game.buttons[f"button_{i}"].draw(game)
+        game.buttons["history"].draw(game)
+def history_card_names(stored):
+    """ 'The Fool, Death (R), The Star' for a row of the history page """
+    names = []
+    for card_name in stored.card_names:
+        name, _, position = card_name.rpartition(" - ")
+        names.append(f"{name} (R)" if position == "Reversed" else name)
+    return ", ".join(names)
+
+def draw_history_stage(game):
+    """ One page of past readings from the reading store, clicking a row lays that reading out again """
+    TEXT.draw_outlined_line("Past Readings", x=SCREEN_WIDTH // 2, y=850, font_size=24, align="center")
+
+    if not game.history_page:
+        TEXT.draw_outlined_line("No readings yet, cher. The cards are waiting on you.",
+                                x=SCREEN_WIDTH // 2, y=SCREEN_HEIGHT // 2, font_size=DEFAULT_FONT_SIZE, align="center")
+
+    for i, stored in enumerate(game.history_page):
+        y = HISTORY_ROWS[i]
+        color = arcade.color.GOLD if game.hovered_button == f"history_row_{i}" else arcade.color.WHITE
+        saved_on = time.strftime("%b %d, %Y", time.localtime(stored.created_at))
+        TEXT.draw_outlined_line(f"{saved_on}   {stored.intention}", x=HISTORY_ROW_X[0], y=y,
+                                font_size=DEFAULT_FONT_SIZE, color=color)
+        TEXT.draw_outlined_line(history_card_names(stored), x=HISTORY_ROW_X[0] + 40, y=y - 30,
+                                font_size=12, color=color)
+
+    game.buttons["history_back"].draw(game)
+    if game.history_offset > 0:
+        game.buttons["history_newer"].draw(game)
+    if len(game.history_page) == len(HISTORY_ROWS):
+        game.buttons["history_older"].draw(game)
+
 def draw_spread_stage(game):
         """ Render the card spread stage with the backs of the cards. """
         if game.reveal_active and game.current_revealed_card:
             # Draw the revealed card in the center
             game.current_revealed_card.paint(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, show_front=True, is_small=False)
             button_name = "pull_next" if len(game.selected_cards) <= 2 else "begin_reading"
-            button_copy = "Pull Next Card" if len(game.selected_cards) <= 2 else "Begin Reading" 
-
-            Button(
-                game=game,
-                name=button_name,
-                copy=button_copy,
-                x_center=game.x_middle_button,
-                y_center=100,
-                text_x_start=game.x_middle_button - 125,
-                text_y_start=95,
-            )
+
+            game.buttons[button_name].draw(game)
             
          
 
@@ -318,24 +338,8 @@ def draw_spread_stage(game):
                 align="center"  
     )
 
-        # Draw the cards, with offsets and angles to make it look natural
-        card_spacing = (SCREEN_WIDTH - 300) // len(game.deck.cards)  # Dynamic spacing
-        for i, card in enumerate(game.deck.cards):
-
-            x = 150 + (i * card_spacing)
-
-            #Here we add a slight parabolic curve to the deck, I did it oriented up, to simulate someone spreading them in front of you
-            curve_height = 50
-            curve_center = len(game.deck.cards) // 2
-            y = (SCREEN_HEIGHT // 2) + curve_height * ((i - curve_center) / curve_center) ** 2
-            
-            #Here we jumnble the cards a bit
-            x += card.x_offset 
-            y += card.y_offset
-            ## x_offset and y_offset are randomly generated numbers, generated for each card, but set before it is drawn
-            ## We also added a random angle in rotation_angle that is applied to each card
-
-            card.paint(x, y, show_front=False, is_hovered=(card == game.hovered_card), is_small=True, angle=card.rotation_angle)
+        # Draw the whole fan in one batch, the layout is worked out once in TarotDeck.shuffle()
+        game.spread_renderer.draw(game.hovered_card)
 
         # Draw previously selected cards in the left corner
         for i, card in enumerate(game.selected_cards):
@@ -355,81 +359,10 @@ def draw_loading_stage(game):
     )
 
 
-    """ Progress Bar, this could be pulled out as a class for later use"""
-
-    # Progress bar dimensions
-    bar_x = 100  # Starting x position of the bar
-    bar_y = 300  # y position of the bar
-    bar_height = 65  # Height of the progress bar
-    cap_width = 35
-    total_bar_width = 1050  # Total width of the progress bar background
-    progress_width = game.loading_progress * (total_bar_width-50)  # Dynamic width of the stretchable section
-    frame_width = 3296 //4
-    frame_height = 68
-
-
-    progress_bar_sprites = arcade.load_spritesheet(resource_path.path(
-            "assets/original/pBarBackgroundSpriteSheet.png"),  # Path to the sprite sheet
-            sprite_width=frame_width,  # Width of each frame
-            sprite_height=frame_height,  # Height of each frame
-            columns=4,  # Number of columns in the sprite sheet
-            count=4  # Total number of frames
-        )
-    
-    frame_index = int(game.frame_timer // game.frame_rate) % 4 
-
-    # Load textures
-    background_texture = arcade.load_texture(resource_path.path("assets/original/pBarBackground.png"))
-    stretch_texture = arcade.load_texture(resource_path.path("assets/original/pBarStretch.png"))
-    front_texture = arcade.load_texture(resource_path.path("assets/original/pBarFront.png"))
-    end_texture = arcade.load_texture(resource_path.path("assets/original/pBarEnd.png"))
+    """ Progress Bar, built once on the first LOADING in TarotGame.stage, see progress_bar.py """
+    game.progress_bar.set_progress(game.loading_progress)
+    game.progress_bar.draw(game.frame_timer)
 
-    arcade.draw_texture_rectangle(
-        bar_x + total_bar_width // 2,  # Centered at the current progress width
-        bar_y + bar_height // 2,
-        total_bar_width,  # Dynamic width
-        bar_height,
-        progress_bar_sprites[frame_index]  # Use the correct frame
-    )
-    # Draw the static background
-    arcade.draw_texture_rectangle(
-        bar_x + total_bar_width // 2,  # Centered horizontally
-        bar_y + bar_height // 2,  # Centered vertically
-        total_bar_width,  # Full width
-        bar_height,  # Full height
-        background_texture
-    )
-
-    progress_width = game.loading_progress * (total_bar_width - 50)  # Dynamic width
-
-    arcade.draw_texture_rectangle(
-        bar_x+25,  # At the end of the progress bar
-        bar_y + bar_height // 4 + 15,
-        cap_width,  # Width of the front cap
-        bar_height -10,
-        front_texture
-    )
-    arcade.draw_texture_rectangle(
-        bar_x + progress_width + cap_width / 2,  # Position at the end of the progress
-        bar_y + bar_height // 2,
-        cap_width,  # Width of the end cap
-        bar_height-10,
-        end_texture)
-
-    # Draw the stretchable section of the progress bar
-    current_x = bar_x  # Start position for the stretchable section
-    while current_x +25 < bar_x + progress_width:  # Leave space for the front cap
-        arcade.draw_texture_rectangle(
-            current_x+cap_width,  # Centered segment
-            bar_y + bar_height // 2,
-            15,  # Width of each segment
-            bar_height-10,
-            stretch_texture
-        )
-        current_x += 10  # Move to the next segment
-
-
-  
     TEXT.draw_outlined_line(
                 "...your reading shall soon be revealed.",
                 x=SCREEN_WIDTH // 2,  
@@ -446,40 +379,45 @@ def draw_loading_stage(game):
 
     if game.connection_popup_open:
             draw_connection_popup(game)
+def draw_fortune_paragraph(game, paragraph):
+    """ Typed out the first time a reading stage is seen, drawn whole when we come back to it """
+    if game.visited_stages[game.stage]:
+        TEXT.draw_outlined_paragraph(game,
+                                     paragraph.center_x,
+                                     paragraph.start_y,
+                                     font_size=paragraph.font_size,
+                                     line_height=paragraph.line_height)
+    else:
+        TEXT.typewriter_lines(game,
+            center_x=paragraph.center_x,
+            start_y=paragraph.start_y,
+            font_size=paragraph.font_size,
+            line_height=paragraph.line_height,
+        )
+
 def draw_reading_intro(game, card_index):
 
     """ Render the intro stage with all cards shown. """
   
     game.line_spacing= 50
     
-    paragraph = game.fortune[card_index]
+    # Wrapped, measured and placed on the fetch thread, see fortune_layout.py
+    paragraph = game.fortune_layout.paragraphs[card_index]
     
-    if game.active_card_index != card_index:
-            TEXT.set_paragraph_typing(game, paragraph)
+    if game.active_card_index != card_index or game.typing_open:  # A streaming paragraph is handed over as it grows
+            TEXT.set_layout_typing(game, paragraph)
             game.active_card_index = card_index 
-    if game.visited_stages[game.stage]:
-         TEXT.draw_outlined_paragraph(game, 
-                                      SCREEN_WIDTH // 2, 
-                                      SCREEN_HEIGHT // 2 - 50)
-    else:
-        TEXT.typewriter_lines(game,
-            
-            center_x = SCREEN_WIDTH // 2, 
-            start_y=SCREEN_HEIGHT //2-50,
-            font_size=DEFAULT_FONT_SIZE,
-            line_height=DEFAULT_LINE_HEIGHT * 1.5,
-    )
+    draw_fortune_paragraph(game, paragraph)
 
-    Button(
-        game=game,
-        name="next_card",
-        copy="First Card",
-        x_center=game.x_middle_button,
-        y_center=100,
-        text_x_start=game.x_middle_button - 125,
-        text_y_start=95,
-    )
+    game.buttons["reading_intro_next"].draw(game)
+
+    compositor.draw("intro_card_row", paint_intro_card_row, game, key=card_row_key(game))
+
+def card_row_key(game):
+    """ What the card rows depend on, the cards drawn and which way up they landed """
+    return tuple((card.name, card.position) for card in game.drawn_cards)
 
+def paint_intro_card_row(game):
     for i, card in enumerate(game.drawn_cards):
         x = 350 + (i * 275)
         y = 700
@@ -493,24 +431,13 @@ def draw_reading_card(game, card_index):
         card.paint(SCREEN_WIDTH // 5.5, SCREEN_HEIGHT // 2, show_front=True)
         card_name =card.name
     
-        paragraph = game.fortune[card_index]
+        paragraph = game.fortune_layout.paragraphs[card_index]
             
-        if game.active_card_index != card_index:
-                TEXT.set_paragraph_typing(game, paragraph, width=(SCREEN_WIDTH-400))
+        if game.active_card_index != card_index or game.typing_open:
+                TEXT.set_layout_typing(game, paragraph)
                 game.active_card_index = card_index 
 
-
-        if game.visited_stages[game.stage]:
-            TEXT.draw_outlined_paragraph(game, 
-                                        SCREEN_WIDTH * 0.65, SCREEN_HEIGHT * 0.7)
-        else:
-            TEXT.typewriter_lines(game,
-                
-                center_x = SCREEN_WIDTH * .65,  
-                start_y=SCREEN_HEIGHT *.7,
-                font_size=DEFAULT_FONT_SIZE,
-                line_height=DEFAULT_LINE_HEIGHT * 1.7,          
-        )
+        draw_fortune_paragraph(game, paragraph)
 
         
         if card.position == 'Reversed':
@@ -542,99 +469,37 @@ def draw_reading_card(game, card_index):
 )
         
             
-        if card_index == 3:
-            next_card_copy = "Summary"
-        else: 
-             next_card_copy = "Next Card"
-        Button(
-            game=game,
-            name="next_card",
-            copy=next_card_copy,
-            x_center=game.x_right_button,
-            y_center=100,
-            text_x_start=game.x_right_button - 125,
-            text_y_start=95,
-        )
+        game.buttons["reading_card_summary" if card_index == 3 else "reading_card_next"].draw(game)
 
-        Button(
-            game=game,
-            name="previous_card",
-            copy="Previous Card",
-            x_center=game.x_left_button,
-            y_center=100,
-            text_x_start=game.x_left_button - 125,
-            text_y_start=95,
-        )
+        game.buttons["reading_card_previous"].draw(game)
 
 def draw_reading_summary(game, card_index):
         """ Render the summary stage with all cards and a summary. """
       
-        paragraph = game.fortune[card_index]
+        paragraph = game.fortune_layout.paragraphs[card_index]
     
-        if game.active_card_index != card_index:
-                TEXT.set_paragraph_typing(game, paragraph)
+        if game.active_card_index != card_index or game.typing_open:
+                TEXT.set_layout_typing(game, paragraph)
                 game.active_card_index = card_index 
-        if game.visited_stages[game.stage]:
-            TEXT.draw_outlined_paragraph(game, 
-                                        SCREEN_WIDTH // 2, 
-                                        SCREEN_HEIGHT // 2 + 50)
-        else:
-            TEXT.typewriter_lines(game,
-                
-                center_x = SCREEN_WIDTH // 2, 
-                start_y=SCREEN_HEIGHT //2+50,
-                font_size=DEFAULT_FONT_SIZE,            
-                line_height=DEFAULT_LINE_HEIGHT * 1.5,          
-        )
+        draw_fortune_paragraph(game, paragraph)
         
-        Button(
-            game=game,
-            name="new_reading",
-            copy="New Reading",
-            x_center=game.x_middle_button,
-            y_center=100,
-            text_x_start=game.x_middle_button - 125,
-            text_y_start=95,
-        )
+        game.buttons["new_reading"].draw(game)
 
-        Button(
-            game=game,
-            name="go_outside",
-            copy="Go Outside",
-            x_center=game.x_right_button + 100,
-            y_center=100,
-            text_x_start=game.x_right_button - 25,
-            text_y_start=95,
-        )
+        game.buttons["go_outside"].draw(game)
 
-        Button(
-            game=game,
-            name="previous_card",
-            copy="Previous",
-            x_center=game.x_left_button - 100,
-            y_center=100,
-            text_x_start=game.x_left_button - 225,
-            text_y_start=95,
-        )
+        game.buttons["reading_summary_previous"].draw(game)
+
+        compositor.draw("summary_card_row", paint_summary_card_row, game, key=card_row_key(game))
 
-        for i, card in enumerate(game.drawn_cards):
-            x = 350 + (i * 275)
-            y = 700 + 50
-            card.paint(x, y, show_front=True, scale = 1.2, is_small = True)
+def paint_summary_card_row(game):
+    for i, card in enumerate(game.drawn_cards):
+        x = 350 + (i * 275)
+        y = 700 + 50
+        card.paint(x, y, show_front=True, scale = 1.2, is_small = True)
 
 def options_button(game):
-    Button(
-        game=game,
-        name='options',
-        copy="",
-        x_center=game.x_right_button+250,
-        y_center=900,
-        width=200 //2,
-        height=200 // 2,
-        text_x_start=game.x_right_button + 75,
-        text_y_start=545,
-    )
-    cog=arcade.load_texture(resource_path.path(r"assets/original/OptionsCog.png"))
+    game.buttons["options"].draw(game)
+    cog=game.assets.texture("common", "options_cog")
     arcade.draw_texture_rectangle(
     center_x= game.x_right_button+250,
     center_y= 903,
@@ -654,12 +519,26 @@ def draw_options_menu(game):
         (0, 0, 0, 200)  # Semi-transparent overlay
     )
 
+    # Everything else is baked into a layer, repainted only when a setting or the close button's hover changes
+    sound = game.sound_manager
+    key = (
+        game.hovered_button == "close_menu",
+        sound.music_enabled,
+        sound.sfx_enabled,
+        int(sound.music_volume * 100),
+        int(sound.sfx_volume * 100),
+        game.scheduler.low_power,
+        game.scheduler.frame_cap,
+    )
+    compositor.draw("options_menu", paint_options_menu, game, key=key)
+
+def paint_options_menu(game):
     # Load UI textures
-    menu_background = arcade.load_texture(resource_path.path(r"assets/original/OptionMenuBackground.png"))
-    checkbox_on = arcade.load_texture(resource_path.path(r"assets/original/togglecheckboxyes.png"))
-    checkbox_off = arcade.load_texture(resource_path.path(r"assets/original/togglecheckboxno.png"))
-    plus_button = arcade.load_texture(resource_path.path(r"assets/original/Plus.png"))
-    minus_button = arcade.load_texture(resource_path.path(r"assets/original/minus.png"))
+    menu_background = game.assets.texture("options_menu", "menu_background")
+    checkbox_on = menu_icon("checkbox_on")
+    checkbox_off = menu_icon("checkbox_off")
+    plus_button = menu_icon("plus")
+    minus_button = menu_icon("minus")
 
     # Draw menu background
     arcade.draw_texture_rectangle(
@@ -674,109 +553,72 @@ def draw_options_menu(game):
     TEXT.draw_outlined_line("Options", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250, font_size=24, align="center")
 
     ## -------------------- CLOSE MENU BUTTON -------------------- ##
-    Button(
-        game=game,
-        name='close_menu',
-        copy="Close",
-        x_center=game.x_middle_button,
-        y_center=250,
-        width=195,  # Scaled down
-        height=115,  # Scaled down
-        text_x_start=game.x_middle_button-125,
-        text_y_start=245,
-    )
+    game.buttons["close_menu"].draw(game)
 
-    ## -------------------- MUSIC TOGGLE -------------------- ##
-    TEXT.draw_outlined_line("Toggle Music",
-                             SCREEN_WIDTH // 2 - 150, 
-                             SCREEN_HEIGHT // 2 + 140,
-                             font_size=20, align="center")
-
-    # Checkbox for Music Toggle (Uses game.sound_manager.music_enabled)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66 ,
-        center_y=SCREEN_HEIGHT // 2 + 150,
-        width=45,
-        height=45,
-        texture=checkbox_on if game.sound_manager.music_enabled else checkbox_off
-    )
+    ## Rows come from hit_regions.MENU_ROWS so the clickable boxes line up with what is drawn here
+    def row_y(row):
+        return SCREEN_HEIGHT // 2 + MENU_ROWS[row]
 
-    ## -------------------- MUSIC VOLUME -------------------- ##
-    TEXT.draw_outlined_line("Music Volume",
-                             SCREEN_WIDTH // 2-150, 
-                             SCREEN_HEIGHT // 2 + 50, 
-                             font_size=20, align="center")
+    def draw_label(text, row):
+        TEXT.draw_outlined_line(text,
+                                 SCREEN_WIDTH // 2 - 150,
+                                 row_y(row) - 10,
+                                 font_size=20, align="center")
 
-    # Decrease Music Volume (-)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66  - 76,
-        center_y=SCREEN_HEIGHT // 2 + 60,
-        width=40,
-        height=40,
-        texture=minus_button
-    )
+    def draw_checkbox(row, checked):
+        arcade.draw_texture_rectangle(
+            center_x=SCREEN_WIDTH *.66 ,
+            center_y=row_y(row),
+            width=45,
+            height=45,
+            texture=checkbox_on if checked else checkbox_off
+        )
 
-    # Increase Music Volume (+)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66  + 76,
-        center_y=SCREEN_HEIGHT // 2 + 60,
-        width=40,
-        height=40,
-        texture=plus_button
-    )
+    def draw_stepper(row, value_text):
+        # Decrease (-)
+        arcade.draw_texture_rectangle(
+            center_x=SCREEN_WIDTH *.66  - 76,
+            center_y=row_y(row),
+            width=40,
+            height=40,
+            texture=minus_button
+        )
 
-    # Display Current Music Volume
-    volume_text = f"{int(game.sound_manager.music_volume * 100)}%"
-    TEXT.draw_outlined_line(volume_text,
-                             SCREEN_WIDTH *.66 , 
-                             SCREEN_HEIGHT // 2 + 50, 
-                             font_size=20, align="center")
-    
+        # Increase (+)
+        arcade.draw_texture_rectangle(
+            center_x=SCREEN_WIDTH *.66  + 76,
+            center_y=row_y(row),
+            width=40,
+            height=40,
+            texture=plus_button
+        )
 
-    ## -------------------- SFX TOGGLE -------------------- ##
-    TEXT.draw_outlined_line("Toggle SFX",
-                             SCREEN_WIDTH // 2 - 150,
-                               SCREEN_HEIGHT // 2 - 40,
+        # Current value between the two
+        TEXT.draw_outlined_line(value_text,
+                                 SCREEN_WIDTH *.66 ,
+                                 row_y(row) - 10,
                                  font_size=20, align="center")
 
-    # Checkbox for SFX Toggle (Uses game.sound_manager.sfx_enabled)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66 ,
-        center_y=SCREEN_HEIGHT // 2 - 30,
-        width=45,
-        height=45,
-        texture=checkbox_on if game.sound_manager.sfx_enabled else checkbox_off
-    )
+    ## -------------------- MUSIC -------------------- ##
+    draw_label("Toggle Music", "music")
+    draw_checkbox("music", game.sound_manager.music_enabled)
 
-    ## -------------------- SFX VOLUME -------------------- ##
-    TEXT.draw_outlined_line("SFX Volume",
-                             SCREEN_WIDTH // 2-150, 
-                             SCREEN_HEIGHT // 2 - 140, font_size=20, align="center")
+    draw_label("Music Volume", "music_volume")
+    draw_stepper("music_volume", f"{int(game.sound_manager.music_volume * 100)}%")
 
-    # Decrease SFX Volume (-)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66  - 76,
-        center_y=SCREEN_HEIGHT // 2 - 130,
-        width=40,
-        height=40,
-        texture=minus_button
-    )
+    ## -------------------- SFX -------------------- ##
+    draw_label("Toggle SFX", "sfx")
+    draw_checkbox("sfx", game.sound_manager.sfx_enabled)
 
-    # Increase SFX Volume (+)
-    arcade.draw_texture_rectangle(
-        center_x=SCREEN_WIDTH *.66 + 76,
-        center_y=SCREEN_HEIGHT // 2 - 130,
-        width=40,
-        height=40,
-        texture=plus_button
-    )
+    draw_label("SFX Volume", "sfx_volume")
+    draw_stepper("sfx_volume", f"{int(game.sound_manager.sfx_volume * 100)}%")
 
-    # Display Current SFX Volume
-    sfx_volume_text = f"{int(game.sound_manager.sfx_volume * 100)}%"
-    TEXT.draw_outlined_line(sfx_volume_text,
-                             SCREEN_WIDTH *.66 , 
-                             SCREEN_HEIGHT // 2 - 140, 
-                             font_size=20, align="center")
+    ## -------------------- POWER -------------------- ##
+    draw_label("Low Power", "low_power")
+    draw_checkbox("low_power", game.scheduler.low_power)
+
+    draw_label("Frame Cap", "frame_cap")
+    draw_stepper("frame_cap", f"{game.scheduler.frame_cap}")
     
 def draw_credits_screen(game):
     """Draw the options menu with real UI elements like buttons, checkboxes, and volume controls."""
@@ -787,8 +629,12 @@ def draw_credits_screen(game):
         (0, 0, 0, 200)  # Semi-transparent overlay
     )
 
+    # The credits never change, the layer is only repainted when the close button's hover does
+    compositor.draw("credits", paint_credits_screen, game, key=game.hovered_button == "close_menu")
+
+def paint_credits_screen(game):
     # Load UI textures
-    menu_background = arcade.load_texture(resource_path.path(r"assets/original/OptionMenuBackground.png"))
+    menu_background = game.assets.texture("credits", "menu_background")
     
     # Draw menu background
     arcade.draw_texture_rectangle(
@@ -803,17 +649,7 @@ def draw_credits_screen(game):
     TEXT.draw_outlined_line("Credits", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250, font_size=24, align="center")
 
     ## -------------------- CLOSE MENU BUTTON -------------------- ##
-    Button(
-        game=game,
-        name='close_menu',
-        copy="Close",
-        x_center=game.x_middle_button,
-        y_center=250,
-        width=195,  # Scaled down
-        height=115,  # Scaled down
-        text_x_start=game.x_middle_button-125,
-        text_y_start=245,
-    )
+    game.buttons["close_menu"].draw(game)
 
     y_start = SCREEN_HEIGHT - 300  # "Developed By" starts at -300
 
@@ -905,7 +741,7 @@ def draw_credits_screen(game):
         color=arcade.color.GOLD
     )
 def draw_connection_popup(game):
-        menu_background = arcade.load_texture(resource_path.path(r"assets/original/OptionMenuBackground.png"))
+        menu_background = game.assets.texture("connection_popup", "menu_background")
 
         arcade.draw_lrtb_rectangle_filled(
         0, SCREEN_WIDTH, SCREEN_HEIGHT, 0, 
@@ -925,27 +761,9 @@ def draw_connection_popup(game):
             closed_text = "Sorry Cher, looks like I'm havin'\n\n trouble connecting to our server"
        
         
-        Button(
-            game=game,
-            name='retry',
-            copy="Retry Connection",
-            x_center=SCREEN_WIDTH // 2,
-            y_center=100,
-            text_x_start=SCREEN_WIDTH // 2 - 125,
-            text_y_start=115,
-        )
+        game.buttons["retry"].draw(game)
             
-        Button(
-            game=game,
-            name='exit_game',
-            copy="Exit",
-            x_center=game.x_right_button+200,
-            y_center=50,
-            width=350 //2,
-            height=200 // 2,
-            text_x_start=game.x_right_button + 75,
-            text_y_start=45,
-        )
+        game.buttons["exit_game"].draw(game)
     #set_paragraph_typing is needed to set up what goes into typewriter_lines
         if not game.lines_to_type: ## This guards against looping, could also place the line below when scene is changed
             TEXT.set_paragraph_typing(game, closed_text)  ## We did this because this is in the game's on_draw function, which calls this function every frame
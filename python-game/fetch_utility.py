@@ -1,34 +1,133 @@
 import requests
 import secrets
 import hashlib
+import json
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from text_utility import wrap_text_paragraphs
+from fortune_layout import layout_fortune
 from compiled_details import RELEVANT_HASH
 
 debug_mode = False
 
-def has_internet_connection():
-    try:
-        response = requests.get("https://health.aws.amazon.com/health/status", timeout=3)
-        if debug_mode:
-            print("Internet: Connected")
-        return response.status_code == 200
-    except requests.exceptions.RequestException:
-        if debug_mode:
-            print("Internet: Not Connected")
-        return False
+INTERNET_CHECK_URL = "https://health.aws.amazon.com/health/status"
 
-def has_server_connection():
-    try:
-        response = requests.get("https://tarot-generate-arcade.onrender.com/health", timeout=6)
-        if debug_mode:
-            print("Server: Connected")
-        return response.status_code == 200
-    except:
+## (connect, read) timeouts in seconds. Connecting is quick or not happening at all,
+## reading can be slow: the server may be waking up, and /fortune waits on the model.
+CONNECT_TIMEOUT = 3.05
+INTERNET_TIMEOUT = (CONNECT_TIMEOUT, 3)
+HEALTH_TIMEOUT = (CONNECT_TIMEOUT, 6)
+TOKEN_STATUS_TIMEOUT = (CONNECT_TIMEOUT, 10)
+FORTUNE_TIMEOUT = (CONNECT_TIMEOUT, 90)
+CONNECTIVITY_TTL = 30  # Seconds a connectivity result is trusted before it is checked again
+
+
+class ConnectionManager:
+    """
+    One pooled, keep-alive requests.Session for everything the game sends, so a reading reuses
+    the TLS connection that the health check or warm() already opened instead of handshaking again.
+
+    Connectivity is cached for CONNECTIVITY_TTL and every real request refreshes it as a side effect:
+    an answer from the server means both internet and server are up, a failed connection means
+    they need checking again. So status() only touches the network when the cache has gone stale,
+    and then asks the server first, only falling back to the internet check to say which one is down.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.session = requests.Session()
+        # A failed connect is retried for every method, POST included: the request was never sent, so a retried
+        # /fortune cannot spend tokens twice. Read errors are never retried, and a 502-504 from a waking server
+        # is only retried for idempotent GETs, since by then a POST may already have reached the server
+        retries = Retry(
+            total=2,
+            connect=2,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.lock = threading.Lock()
+        self.internet_connected = True
+        self.server_connected = True
+        self.checked_at = None  # perf_counter of the last known outcome, None until there is one
+        self.probes = 0
+        self.requests = 0
+
+    def _record(self, internet_connected, server_connected):
+        with self.lock:
+            self.internet_connected = internet_connected
+            self.server_connected = server_connected
+            self.checked_at = time.perf_counter()
+
+    def invalidate(self):
+        """ Forget the cached status, the next status() checks again """
+        with self.lock:
+            self.checked_at = None
+
+    def request(self, method, path, timeout, **kwargs):
+        """ Send a request to the server on the pooled session and let its outcome refresh the cached status """
+        self.requests += 1
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", timeout=timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.invalidate()  # Could be us or the server, status() works out which next time
+            raise
+        self._record(True, response.status_code < 500)
+        return response
+
+    def status(self, force=False):
+        """ (internet_connected, server_connected), from the cache while it is fresh """
+        with self.lock:
+            fresh = self.checked_at is not None and time.perf_counter() - self.checked_at < CONNECTIVITY_TTL
+            if fresh and not force:
+                return self.internet_connected, self.server_connected
+
+        self.probes += 1
+        try:
+            response = self.request("GET", "health", HEALTH_TIMEOUT)
+            if response.status_code == 200:
+                if debug_mode:
+                    print("Internet: Connected\nServer: Connected")
+                return True, True
+        except requests.exceptions.RequestException:
+            pass
+
+        internet_connected = self._internet_reachable()
+        self._record(internet_connected, False)
         if debug_mode:
-            print("Server: NOT Connected")
-        return False
+            print(f"Internet: {'Connected' if internet_connected else 'Not Connected'}\nServer: NOT Connected")
+        return internet_connected, False
+
+    def _internet_reachable(self):
+        try:
+            response = self.session.get(INTERNET_CHECK_URL, timeout=INTERNET_TIMEOUT)
+            return response.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
 
+    def warm(self):
+        """
+        Open the server connection in the background, before a request that has to be quick needs it.
+        Always goes to the server, a cached status says nothing about whether the pooled connection is still open.
+        """
+        threading.Thread(target=self.status, kwargs={"force": True}, daemon=True).start()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "probes": self.probes,
+            "internet_connected": self.internet_connected,
+            "server_connected": self.server_connected,
+        }
 
 
 def generate_auth_headers():
@@ -48,43 +147,122 @@ def generate_auth_headers():
         "Content-Type": "application/json"
 }
     
-def get_fortune(game, cards, intention):
-    """Send cards and intention to the Flask server to get a fortune"""
+def read_fortune_stream(game, response, request=None):
+    """
+    Read a streamed /fortune as its server-sent events arrive and return (text, complete).
+    complete is False when the stream broke off or was abandoned, so the text is not worth keeping.
+    Every time a word is finished the growing paragraph is laid out again into game.fortune_layout,
+    so the reading starts typing while the rest of the fortune is still being written.
+    """
+    response.encoding = "utf-8"  # Event streams are always UTF-8, requests would guess latin-1 for text/*
+    text = ""
+    laid_out = 0
+    event = None
+    try:
+        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+            if request is not None and game.fortune_request is not request:
+                response.close()  # The player left this reading, stop reading it
+                return text, False  # fortune_streaming now belongs to the newer request, request_fortune reset it
+            # Only set once this stream is known to be the current request, never on behalf of an abandoned one
+            game.fortune_streaming = True
+            if line.startswith("event:"):
+                event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                payload = json.loads(line[len("data:"):])
+                if event == "delta":
+                    text += payload["text"]
+                    game.fortune_bytes += len(payload["text"].encode("utf-8"))
+                    # Only lay out whole words, half a word could wrap differently once the rest of it arrives
+                    cut = max(text.rfind(" "), text.rfind("\n"))
+                    if cut > laid_out:
+                        laid_out = cut
+                        paragraphs = wrap_text_paragraphs(text[:cut])
+                        if paragraphs:
+                            game.fortune_layout = layout_fortune(paragraphs, streaming=True, previous=game.fortune_layout)
+                elif event == "error":
+                    raise RuntimeError(payload["error"])
+                elif event == "done" and debug_mode:
+                    print(f"Tokens Used: {payload['tokens_used']}")
+            elif not line:
+                event = None
+    except Exception as e:
+        if not text:
+            raise
+        # Part of the reading may be on screen already, keep it and say what went wrong after it
+        text += f"\nAPI Call Failed: {str(e)}"
+        return text, False
+    return text, True
+
+
+def get_fortune(game, cards, intention, request=None):
+    """
+    Send cards and intention to the Flask server to get a fortune, streamed when the server supports it.
+    `request` is game.fortune_request when this was started, if it has changed since the result is dropped.
+    A reading already in game.reading_store is used as it is, with no request at all.
+    """
+    card_names = [str(card) for card in cards]
+    stored = game.reading_store.lookup(card_names, intention)
+    if stored is not None:
+        if request is None or game.fortune_request is request:
+            game.fortune = stored.fortune
+            game.fortune_layout = stored.layout
+            game.fortune_cached = True
+            game.api_call_complete = True
+        return
+
     game.check_connectivity()
     headers = generate_auth_headers()
-    card_names = [str(card) for card in cards]
+    headers["Accept"] = "text/event-stream"
+    complete = False  # Only a whole fortune from the server is stored
     if game.internet_connected and game.server_connected:
         game.connection_popup_open = False
         try:
-            response = requests.post(
-                f"{game.request_url}fortune",
+            response = game.connection.request(
+                "POST",
+                "fortune",
+                FORTUNE_TIMEOUT,
                 headers=headers,
-                json={"cards": card_names, "intention": intention}
+                json={"cards": card_names, "intention": intention, "stream": True},
+                stream=True
             )
 
-            if response.status_code == 200:
+            if response.status_code == 200 and response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                fortune, complete = read_fortune_stream(game, response, request)
+
+            elif response.status_code == 200:
+                # A server without streaming answers with the whole fortune at once
                 data = response.json()
-                game.fortune = data['fortune']
+                fortune = data['fortune']
+                complete = True
 
                 if debug_mode:# # Optional: If you want to display token usage in the console
                     print(f"Tokens Used: {data['tokens_used']}")
 
             else:
                 # Handle the error if the server returns an error response
-                game.fortune = f"Error: {response.status_code} - {response.text}"
+                fortune = f"Error: {response.status_code} - {response.text}"
 
         except Exception as e:
             # Handle network errors or other unexpected exceptions
-            game.fortune = f"API Call Failed: {str(e)}"
+            fortune = f"API Call Failed: {str(e)}"
             if debug_mode:
 
-                print(game.fortune)
+                print(fortune)
     else:
+        fortune = None
         game.connection_popup_open = True
-    # Let the game know the API call is done, even if it failed
-    game.api_call_complete = True
 
-    # Wrap paragraphs if a valid fortune is returned
-    game.fortune = wrap_text_paragraphs(game.fortune)
+    if request is not None and game.fortune_request is not request:
+        return  # Started for a reading the player has since left
 
+    # Wrap paragraphs if a valid fortune is returned
+    game.fortune = wrap_text_paragraphs(fortune or "")
+    # Lay out every reading stage now, on this thread, so the render thread only ever draws.
+    # After a stream the paragraphs already laid out are kept, the one being typed just closes
+    previous = game.fortune_layout if game.fortune_streaming else None
+    game.fortune_layout = layout_fortune(game.fortune, previous=previous)
+    if complete:
+        game.reading_store.save(card_names, intention, game.fortune, game.fortune_layout)
 
+    # Let the game know the API call is done, even if it failed. Set last so the layout is always there when it is seen
+    game.api_call_complete = True
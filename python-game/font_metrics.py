@@ -0,0 +1,100 @@
+""" Glyph metrics for the bundled Old School Adventures font, so text can be measured and wrapped with plain arithmetic """
+
+FONT_NAME = "Old School Adventures"
+UNITS_PER_EM = 4096
+DPI = 96  # pyglet renders font sizes as points at 96 dpi
+
+# Advance widths in font units, grouped by width.
+# Taken from the hmtx table of assets/fonts/OldSchoolAdventures-42j9.ttf, the font has no kerning table.
+_ADVANCE_GROUPS = {
+    1170: " 'il|¦",
+    1755: "!,.1:;`¡·¹ì‘’‚‛",
+    2340: "\"[]¨°²³´íîï‹›",
+    2925: "(){}ª¸º•",
+    3510: "*+-2356789=Iabcdefghjkmnopqrstuvwxyz¢£¬\xad¯±µ¶ÌÍÎÏ×Þàáâãäåçèéêëðñòóôõö÷ùúûüýþÿź“”„†ﬁﬂ",
+    3515: "♀",
+    4095: "04¤«»",
+    4673: "♂",
+    4681: "#$%&/<>?@ABCDEFGHJKLMNOPQRSTUVWXYZ\\^_~¥§©®¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÐÑÒÓÔÕÖØÙÚÛÜÝßæøŸŹẞ—€™",
+    5266: "ỿ…",
+}
+
+# pyglet falls back to another font for characters this one lacks, assume a lowercase sized glyph
+MISSING_GLYPH_UNITS = 3510
+
+ADVANCE_UNITS = {char: units for units, chars in _ADVANCE_GROUPS.items() for char in chars}
+
+# Every size the game draws text at: DEFAULT_FONT_SIZE and its 1.3x / 1.5x / 1.8x headings, plus the menu sizes
+GAME_FONT_SIZES = (16, 16 * 1.3, 16 * 1.5, 16 * 1.8, 18, 20, 24)
+
+_advance_tables = {}
+
+
+def advance_table(font_size):
+    """
+    Pixel advance of every glyph at `font_size`, rounded per glyph the way the rasteriser lays them out.
+    The table for each size is built once and kept, the `None` key holds the advance for missing glyphs.
+    """
+    table = _advance_tables.get(font_size)
+    if table is None:
+        pixels_per_unit = font_size * DPI / 72 / UNITS_PER_EM
+        table = {char: round(units * pixels_per_unit) for char, units in ADVANCE_UNITS.items()}
+        table[None] = round(MISSING_GLYPH_UNITS * pixels_per_unit)
+        _advance_tables[font_size] = table
+    return table
+
+
+for _size in GAME_FONT_SIZES:
+    advance_table(_size)
+
+
+def line_width(text, font_size):
+    """ Width in pixels of a single line of text """
+    table = advance_table(font_size)
+    missing = table[None]
+    return sum(table.get(char, missing) for char in text)
+
+
+def wrap_text(text, max_width, font_size):
+    """
+    Greedy word wrap by pixel width. Whitespace (including newlines) is collapsed like textwrap does,
+    and a word wider than the whole line is broken across lines.
+    """
+    table = advance_table(font_size)
+    missing = table[None]
+    space = table[" "]
+
+    lines = []
+    current = []
+    current_width = 0
+    for word in text.split():
+        word_width = sum(table.get(char, missing) for char in word)
+
+        if word_width > max_width:
+            # Break an overlong word into chunks that fit
+            if current:
+                lines.append(" ".join(current))
+                current, current_width = [], 0
+            chunk, chunk_width = "", 0
+            for char in word:
+                char_width = table.get(char, missing)
+                if chunk and chunk_width + char_width > max_width:
+                    lines.append(chunk)
+                    chunk, chunk_width = "", 0
+                chunk += char
+                chunk_width += char_width
+            current, current_width = [chunk], chunk_width
+            continue
+
+        if current and current_width + space + word_width > max_width:
+            lines.append(" ".join(current))
+            current, current_width = [], 0
+
+        if current:
+            current_width += space
+        current.append(word)
+        current_width += word_width
+
+    if current:
+        lines.append(" ".join(current))
+    return lines
@@ -0,0 +1,56 @@
+from collections import namedtuple
+import text_utility as TEXT
+
+""" Wraps, measures and places every paragraph of a fortune in one go, on the thread that fetched it """
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 960
+DEFAULT_FONT_SIZE = 16
+DEFAULT_LINE_HEIGHT = 24
+
+## Where each reading stage puts its paragraph: wrap width, center x, first line y, line height.
+## Index 0 is READING_INTRO, 1-3 are the three cards and 4 is READING_SUMMARY, the same indices as game.fortune.
+READING_PLACEMENTS = (
+    (SCREEN_WIDTH - 200, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50, DEFAULT_LINE_HEIGHT * 1.5),
+    (SCREEN_WIDTH - 400, SCREEN_WIDTH * .65, SCREEN_HEIGHT * .7, DEFAULT_LINE_HEIGHT * 1.7),
+    (SCREEN_WIDTH - 400, SCREEN_WIDTH * .65, SCREEN_HEIGHT * .7, DEFAULT_LINE_HEIGHT * 1.7),
+    (SCREEN_WIDTH - 400, SCREEN_WIDTH * .65, SCREEN_HEIGHT * .7, DEFAULT_LINE_HEIGHT * 1.7),
+    (SCREEN_WIDTH - 200, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50, DEFAULT_LINE_HEIGHT * 1.5),
+)
+
+# One paragraph, ready to hand to the typewriter. Tuples all the way down so it can be shared between threads.
+# complete is False while a streamed paragraph can still grow, the typewriter waits at its end instead of finishing.
+ParagraphLayout = namedtuple(
+    "ParagraphLayout",
+    ["lines", "line_widths", "center_x", "start_y", "font_size", "line_height", "complete"],
+    defaults=(True,),
+)
+
+FortuneLayout = namedtuple("FortuneLayout", ["paragraphs"])
+
+
+def layout_paragraph(paragraph, width, center_x, start_y, line_height, font_size=DEFAULT_FONT_SIZE, complete=True):
+    lines, line_widths = TEXT.wrap_paragraph(paragraph, width, font_size)
+    if not lines:
+        lines, line_widths = [""], [0]  # The typewriter always expects a first line
+    return ParagraphLayout(tuple(lines), tuple(line_widths), center_x, start_y, font_size, line_height, complete)
+
+
+def layout_fortune(paragraphs, streaming=False, previous=None):
+    """
+    Lay out all five reading paragraphs. A short fortune (an error message is a single paragraph)
+    gets empty paragraphs for the stages it does not cover, so every reading stage has something to draw.
+
+    While a fortune is streaming in, the last paragraph received and every one after it are still open.
+    Paragraphs that were already complete in `previous` are reused as they are, so each update of
+    a stream only wraps the paragraph that is growing.
+    """
+    laid_out = []
+    for index, (width, center_x, start_y, line_height) in enumerate(READING_PLACEMENTS):
+        complete = not streaming or index < len(paragraphs) - 1
+        if complete and previous is not None and previous.paragraphs[index].complete:
+            laid_out.append(previous.paragraphs[index])
+            continue
+        paragraph = paragraphs[index] if index < len(paragraphs) else ""
+        laid_out.append(layout_paragraph(paragraph, width, center_x, start_y, line_height, complete=complete))
+    return FortuneLayout(tuple(laid_out))
@@ -1,5 +1,6 @@
 import arcade
 import threading
+import queue
 import pyglet
 import draw_utility
 import text_utility as TEXT
@@ -9,10 +10,20 @@ import random
 import os
 import resource_path
 import update_manager
-import requests
+import texture_cache
+import hit_regions
+import asset_preloader
+import sound_manifest
 from dotenv import load_dotenv
 from sound_manager import SoundManager
 from deck import TarotDeck
+from spread_renderer import SpreadRenderer
+from asset_preloader import AssetPreloader
+from asset_registry import AssetRegistry
+from profiler import profiler
+from progress_bar import ProgressBar
+from render_scheduler import RenderScheduler
+from reading_store import ReadingStore, HISTORY_PAGE_SIZE
 from fetch_utility import get_fortune, generate_auth_headers, debug_mode
 from enum import Enum
 from screen_size import init_screen, handle_resize
@@ -29,6 +40,8 @@ DEFAULT_LINE_HEIGHT = 24
 DEFAULT_FONT_SIZE = 16
 FONT_PATH = resource_path.path(r"assets/fonts/OldSchoolAdventures-42j9.ttf")
 
+STARTUP_SFX = ["button", "wind", "door", "typewriter", "card_move", "card_spread"]
+
 CATEGORIES = ["Love Life", "Professional Development", "Family and Friends", "Health", "Personal Growth", "Gain Clarity"]
 
 class GameState(Enum):
@@ -42,31 +55,54 @@ class GameState(Enum):
     READING_CARD_2 = 8
     READING_CARD_3 = 9
     READING_SUMMARY = 10
+    HISTORY = 11
+
+# Music track per stage, anything not listed plays INSIDE_MUSIC. Only one track ships today,
+# so both are "music" and the crossfade stays idle until an inside track is added to sound_manifest
+OUTSIDE_MUSIC = "music"
+INSIDE_MUSIC = "music"
+STAGE_MUSIC = {GameState.TITLE: OUTSIDE_MUSIC, GameState.OUTSIDE: OUTSIDE_MUSIC}
 
 class TarotGame(arcade.Window):
     """ Main application class. """
 
-    def __init__(self):
+    def __init__(self, fullscreen=True, reading_store=None):
         
 
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, "Voodoo Tarot GPT")
 
-        init_screen(self, fullscreen=True)
+        init_screen(self, fullscreen=fullscreen)
+        self.assets = AssetRegistry()  # UI textures per stage, entered and released by the stage setter below
+        self.scheduler = RenderScheduler()  # Skips on_draw when nothing changed, see render_scheduler.py
         self.stage = GameState.TITLE
         self.version = "v1.0.4"
 
         """ Variables for reading generation"""
         self.request_url = "http://127.0.0.1:5000/" if os.environ.get("DEPLOY_MODE") == "dev" else "https://tarot-generate-arcade.onrender.com/"
+        self.connection = fetch_utility.ConnectionManager(self.request_url)  # One keep-alive session for every request
         self.has_tokens = True
+        self.token_check_pending = False  # OUTSIDE keeps the door shut until check_token_usage answers
+        self.completed_tasks = queue.Queue()  # (callback, result) from background work, run in on_update
         self.internet_connected = True
         self.server_connected = True
         self.connection_popup_open = False
         self.intention = None
         self.drawn_cards = None
         self.fortune = None
+        self.fortune_layout = None  # Built by get_fortune on its thread, see fortune_layout.py
+        self.fortune_request = None  # (card names, intention) of the latest request, get_fortune drops results for any other
+        self.reading_store = reading_store or ReadingStore()  # Past fortunes on disk, get_fortune looks here before asking the server
+        self.history_page = []  # StoredReadings on screen in HISTORY, newest first
+        self.history_offset = 0
+        self.api_call_complete = False
+        self.fortune_streaming = False
+        self.fortune_cached = False
+        self.fortune_bytes = 0
 
         """ Variables for spread stage"""
 
+        self.deck = None
+        self.spread_renderer = None
         self.hovered_card = None
         self.current_revealed_card = None
         self.reveal_active= False
@@ -74,17 +110,16 @@ class TarotGame(arcade.Window):
         """ Varables for progress bar"""
         self.frame_timer = 0
         self.frame_rate = 0.4
+        self.progress_bar = None  # Built on the first LOADING, by then the preloader has its textures in the cache
   
         """ Global Assets """
-        self.background_image = arcade.load_texture(resource_path.path(r"assets/original/TableClothbiggerHueShift1.png"))
-        self.outside_image = arcade.load_texture(resource_path.path("assets/original/AnimationFrames2.1/NolaHouse2.1.1.png"))
+        # Everything past the title screen is decoded in the background while the title plays, see asset_preloader.py
+        self.preloader = AssetPreloader(asset_preloader.startup_texture_paths())
+        self.preloader.start()
         arcade.set_background_color(arcade.color.BLACK)
         pyglet.font.add_file(FONT_PATH)  # Load the font file
 
         """ Variables for Outside Animation"""
-        self.outside_frame_center = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.1.png"))
-        self.outside_frame_left = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.3.png"))
-        self.outside_frame_right = arcade.load_texture(resource_path.path(r"assets/original/AnimationFrames2.1/NolaHouse2.1.2.png"))
         self.states = ["START","LEFT", "CENTER", "RIGHT", "CENTER"] # this creates the order for the animation frames, below is the timing for each
         self.state_index = 0  # start at 0 => "Start"
 
@@ -110,6 +145,8 @@ class TarotGame(arcade.Window):
         self.x_left_button = SCREEN_WIDTH // 4
         self.x_right_button = SCREEN_WIDTH * .75
         self.y_bottom_button = 25
+        self.buttons = draw_utility.build_buttons(self)  # Retained buttons, built once and drawn every frame
+        self.hit_regions = hit_regions.compile_regions(self)  # Clickable regions per stage, see hit_regions.py
 
         """ Variables for typewriter Effect """
 
@@ -120,6 +157,10 @@ class TarotGame(arcade.Window):
         self.current_text = ""
         self.current_line_index = 0
         self.lines_to_type = []
+        self.line_widths = []
+        self.typing_complete = False
+        self.typing_layout = None  # The ParagraphLayout being typed, see TEXT.set_layout_typing
+        self.typing_open = False  # True while that paragraph is still streaming in
         self.visited_stages = {
                 GameState.TITLE: False,
                 GameState.OUTSIDE: False,
@@ -130,20 +171,19 @@ class TarotGame(arcade.Window):
                 GameState.READING_CARD_1: False,
                 GameState.READING_CARD_2: False,
                 GameState.READING_CARD_3: False,
-                GameState.READING_SUMMARY: False
+                GameState.READING_SUMMARY: False,
+                GameState.HISTORY: False
             }
 
         
 
         """ Variables for sound"""
-        self.sound_manager = SoundManager(resource_path.path(r"assets/sound/Pixel 1.wav"))
+        # File names come from assets/sound/manifest.json, see sound_manifest.py
+        self.sound_manager = SoundManager(sound_manifest.candidates("music"))
         self.sound_manager.load_music()
-        self.sound_manager.load_sfx("card_move", resource_path.path(r"assets/sound/JDSherbert - Tabletop Games SFX Pack - Paper Flip - 1.wav"))
-        self.sound_manager.load_sfx("card_spread", resource_path.path(r"assets/sound/JDSherbert - Tabletop Games SFX Pack - Deck Shuffle - 1.wav"))
-        self.sound_manager.load_sfx("button", resource_path.path(r"assets/sound/clonck.wav"))
-        self.sound_manager.load_sfx("door", resource_path.path(r"assets/sound/mixkit-creaky-door-open-195.wav"))
-        self.sound_manager.load_sfx("typewriter", resource_path.path(r"assets/sound/mixkit-modern-click-box-check-1120.wav"))
-        self.sound_manager.load_sfx("wind", resource_path.path(r"assets/sound/mixkit-storm-wind-2411.wav"))
+        for sfx_name in sound_manifest.sfx_names():
+            self.sound_manager.load_sfx(sfx_name, sound_manifest.candidates(sfx_name), lazy=True)
+        self.sound_manager.prefetch_sfx(STARTUP_SFX)  # Decoded in the background, in the order they are first heard
 
         """ Variables for Options Menu"""
         self.credits_open = False
@@ -154,21 +194,33 @@ class TarotGame(arcade.Window):
         """ Set up the game here. Call this function to restart the game. """
         
         self.sound_manager.play_music(volume = 0.6, loop=True)
-        self.check_token_usage()
+        self.check_token_usage()  # Answers in the background while the title plays
         if debug_mode:
             print(f"DEPLOY_MODE is: {mode}")
        
         pass
 
+    def flip(self):
+        """ Keep the last drawn frame on screen when on_draw skipped this one """
+        if self.scheduler.skipping:
+            return
+        super().flip()
+
     def on_resize(self, width, height):
         super().on_resize(width, height)
+        if hasattr(self, "scheduler"):
+            self.scheduler.mark_dirty()
         handle_resize(self, width, height)
+        if hasattr(self, "hit_regions"):  # The window can resize before __init__ has laid out the buttons
+            self.hit_regions = hit_regions.compile_regions(self)
 
     def reset_data(self):
         """ Resets the class variables for new readings """
         self.intention = None
         self.drawn_cards = None
         self.fortune = None
+        self.fortune_layout = None
+        self.fortune_request = None  # Anything still in flight is for a reading that is gone
         self.hovered_card = None
         self.hovered_button = None  
         self.clicked_button = None 
@@ -177,41 +229,72 @@ class TarotGame(arcade.Window):
         self.start_reading_button_active = False
         self.active_card_index = None
 
+    @property
+    def stage(self):
+        return self._stage
+
+    @stage.setter
+    def stage(self, new_stage):
+        """ Every stage change goes through here so the asset registry can swap textures and prefetch the next stage """
+        old_stage = getattr(self, "_stage", None)
+        self._stage = new_stage
+        self.assets.change_stage(old_stage, new_stage)
+        self.scheduler.mark_dirty()
+        if new_stage == GameState.LOADING and self.progress_bar is None:
+            self.progress_bar = ProgressBar(100, 300, frame_rate=self.frame_rate)
+        if hasattr(self, "sound_manager"):
+            self.sound_manager.play_track(STAGE_MUSIC.get(new_stage, INSIDE_MUSIC))
+
     def on_draw(self):
         """ Render the screen. """
+        if not self.scheduler.begin_frame():
+            return  # Nothing changed since the last frame, or it is too soon for the frame cap
         self.clear()
-
-        if self.stage not in [GameState.OUTSIDE, GameState.TITLE]:
-            arcade.draw_lrwh_rectangle_textured(0,0, SCREEN_WIDTH, SCREEN_HEIGHT, self.background_image)
-        if self.stage == GameState.TITLE:
-            draw_utility.draw_title_stage(self)
-        elif self.stage == GameState.OUTSIDE:
-        
-            draw_utility.draw_outside_stage(self)
-        elif self.stage == GameState.INTRO:
-            draw_utility.draw_intro_stage(self)
-        elif self.stage == GameState.SPREAD:
-            draw_utility.draw_spread_stage(self)
-        elif self.stage == GameState.LOADING:
-            draw_utility.draw_loading_stage(self)
-        elif self.stage == GameState.READING_INTRO:
-            draw_utility.draw_reading_intro(self, 0) # Stage 1: Show all cards and intro
-        elif self.stage == GameState.READING_CARD_1:
-            draw_utility.draw_reading_card(self, 1)  # Stage 2: Show card 1
-        elif self.stage == GameState.READING_CARD_2:
-            draw_utility.draw_reading_card(self, 2)  # Stage 3: Show card 2
-        elif self.stage == GameState.READING_CARD_3:
-            draw_utility.draw_reading_card(self, 3)  # Stage 4: Show card 3
-        elif self.stage == GameState.READING_SUMMARY:
-            draw_utility.draw_reading_summary(self, 4),   # Stage 5: Show all cards and summary
+        misses_before_draw = texture_cache.cache.misses
+
+        # Each block is timed and counted by the profiler overlay (F3), named after the stage being drawn
+        with profiler.section(f"draw {self.stage.name.lower()}"):
+            if self.stage not in [GameState.OUTSIDE, GameState.TITLE]:
+                arcade.draw_lrwh_rectangle_textured(0,0, SCREEN_WIDTH, SCREEN_HEIGHT, self.assets.texture("common", "background"))
+            if self.stage == GameState.TITLE:
+                draw_utility.draw_title_stage(self)
+            elif self.stage == GameState.OUTSIDE:
         
-        if self.stage != GameState.TITLE:
-            draw_utility.options_button(self)
-
-        if self.menu_open:
-            draw_utility.draw_options_menu(self)
-        if self.credits_open:
-            draw_utility.draw_credits_screen(self)
+                draw_utility.draw_outside_stage(self)
+            elif self.stage == GameState.INTRO:
+                draw_utility.draw_intro_stage(self)
+            elif self.stage == GameState.SPREAD:
+                draw_utility.draw_spread_stage(self)
+            elif self.stage == GameState.LOADING:
+                draw_utility.draw_loading_stage(self)
+            elif self.stage == GameState.READING_INTRO:
+                draw_utility.draw_reading_intro(self, 0) # Stage 1: Show all cards and intro
+            elif self.stage == GameState.READING_CARD_1:
+                draw_utility.draw_reading_card(self, 1)  # Stage 2: Show card 1
+            elif self.stage == GameState.READING_CARD_2:
+                draw_utility.draw_reading_card(self, 2)  # Stage 3: Show card 2
+            elif self.stage == GameState.READING_CARD_3:
+                draw_utility.draw_reading_card(self, 3)  # Stage 4: Show card 3
+            elif self.stage == GameState.READING_SUMMARY:
+                draw_utility.draw_reading_summary(self, 4),   # Stage 5: Show all cards and summary
+            elif self.stage == GameState.HISTORY:
+                draw_utility.draw_history_stage(self)
+
+        with profiler.section("options button"):
+            if self.stage != GameState.TITLE:
+                draw_utility.options_button(self)
+
+        with profiler.section("menus"):
+            if self.menu_open:
+                draw_utility.draw_options_menu(self)
+            if self.credits_open:
+                draw_utility.draw_credits_screen(self)
+
+        if debug_mode and texture_cache.cache.misses != misses_before_draw:
+            print(f"{texture_cache.cache.misses - misses_before_draw} texture load(s) inside on_draw during {self.stage}")
+
+        profiler.end_frame(self.stage)
+        profiler.draw_overlay()
 
         # '''For Debugging Button Hit boxes'''
         # hitbox_x = self.x_right_button + 200
@@ -231,27 +314,76 @@ class TarotGame(arcade.Window):
         # )
     def on_mouse_release(self, x, y, _button, _modifiers):
         mouse_input.handle_mouse_press(self,x,y, _button, _modifiers, GameState)
+        self.scheduler.mark_dirty()
         
     def on_mouse_motion(self, x, y, dx, dy):
-
+        hovered_before = (self.hovered_button, self.hovered_card)
         mouse_input.handle_mouse_motion(self, x, y, dx, dy, GameState)
+        if (self.hovered_button, self.hovered_card) != hovered_before:
+            self.scheduler.mark_dirty()  # The cursor is drawn by the OS, only a hover change needs a frame
 
     def on_key_press(self, key, _modifiers):
         """Window mode Button"""
         if key == arcade.key.F11:
             self.set_fullscreen(not self.fullscreen)
+        elif key == arcade.key.F3:
+            profiler.toggle()  # Frame time overlay
+        elif key == arcade.key.F4 and profiler.enabled:
+            profiler.dump_csv()
+        self.scheduler.mark_dirty()
 
        
 
     def set_intention(self, intention_text):
         """ Set the intention and transition to the spread stage. """
         self.intention = intention_text
-        self.deck = TarotDeck()  # prepare deck
-        self.deck.shuffle()
+        self.gather_deck()
         TEXT.reset_typing_state(self)  
         self.stage = GameState.SPREAD
         self.selected_cards = []  # reset selected cards for spread
 
+    def gather_deck(self):
+        if self.deck is None:
+            # Built on the first reading and kept, every reading after that just gathers the cards back up
+            self.deck = TarotDeck()
+            self.deck.reset()
+            self.spread_renderer = SpreadRenderer(self.deck)
+        else:
+            self.deck.reset()
+            self.spread_renderer.rebuild()
+
+    def open_history(self, offset=0):
+        """ Show a page of past readings from the reading store """
+        self.history_offset = max(0, offset)
+        self.history_page = self.reading_store.history(self.history_offset, HISTORY_PAGE_SIZE)
+        self.hovered_button = None
+        TEXT.reset_typing_state(self)
+        self.stage = GameState.HISTORY
+
+    def open_stored_reading(self, stored):
+        """ Lay a past reading back out on the table, straight into READING_INTRO with no request """
+        self.gather_deck()
+        cards_by_name = {card.name: card for card in self.deck.all_cards}
+        drawn_cards = []
+        for card_name in stored.card_names:
+            name, _, position = card_name.rpartition(" - ")
+            card = cards_by_name[name]
+            card.set_position(position)  # gather_deck() reshuffled, which reverses cards at random
+            drawn_cards.append(card)
+
+        self.intention = stored.intention
+        self.drawn_cards = drawn_cards
+        self.selected_cards = list(drawn_cards)
+        self.fortune_request = (tuple(stored.card_names), stored.intention)
+        self.fortune = stored.fortune
+        self.fortune_layout = stored.layout
+        self.fortune_streaming = False
+        self.api_call_complete = True
+        for key in self.visited_stages:
+            self.visited_stages[key] = False
+        TEXT.reset_typing_state(self)
+        self.stage = GameState.READING_INTRO
+
     def reveal_card(self, card):
         """ Control and save faceup cards when the use selects them """
         if card not in self.selected_cards:
@@ -259,72 +391,125 @@ class TarotGame(arcade.Window):
         self.current_revealed_card = card  # Track the card being revealed
         self.reveal_active = True  
 
-    def start_loading(self):
-        """  Begin Loading Screen, Call API and begin threading """
-        self.stage = GameState.LOADING
-        self.loading_progress = 0.0
+    def request_fortune(self):
+        """
+        Ask the server for the fortune on a background thread. Called speculatively as soon as the third card
+        is picked, while the player is still looking at its reveal, so the reading is mostly written by LOADING.
+        """
+        self.fortune_request = (tuple(str(card) for card in self.drawn_cards), self.intention)
         self.api_call_complete = False
+        self.fortune = None
+        self.fortune_layout = None  # Filled in by get_fortune, a paragraph at a time when the reply streams
+        self.fortune_streaming = False
+        self.fortune_cached = False  # Came from the reading store, no request was made
+        self.fortune_bytes = 0  # Fortune text received so far, drives the progress bar while streaming
         api_thread = threading.Thread(
             target=get_fortune,
-            args=(self, self.drawn_cards, self.intention),
+            args=(self, self.drawn_cards, self.intention, self.fortune_request),
             daemon=True  # Set as a daemon thread so it exits when the game exits
         )
         api_thread.start()
+
+    def start_loading(self, retry=False):
+        """  Begin Loading Screen, attaching to the fortune request already in flight for these cards if there is one """
+        self.stage = GameState.LOADING
+        self.loading_progress = 0.0
+        request = (tuple(str(card) for card in self.drawn_cards), self.intention)
+        if retry or self.fortune_request != request:
+            self.request_fortune()
         self.sound_manager.play_sfx("card_spread")
         
 
     def on_update(self, delta_time):
         """ Update the game state. """
+        with profiler.section("preloader"):
+            self.preloader.update()  # Hand a few decoded textures to the GPU each frame until it is done
+            self.assets.update()  # Same for whatever the next stage is prefetching
+            self.sound_manager.update()  # And for SFX the decode thread has finished, and the music crossfade
+
+        while not self.completed_tasks.empty():
+            on_done, result = self.completed_tasks.get_nowait()
+            on_done(result)
+            self.scheduler.mark_dirty()
+
+        with profiler.section("handle_animation"):
+            update_manager.handle_animation(self, delta_time, game_state = GameState)
 
-        update_manager.handle_animation(self, delta_time, game_state = GameState)
+        if profiler.enabled:
+            self.scheduler.mark_dirty()  # Keep the overlay's numbers moving
 
 
 
-    def check_connectivity(self):
+    def check_connectivity(self, force=False):
         """
         Update booleans for both internet and server connectivity.
+        Cached by the connection manager, force=True checks again (the retry button).
         """
-        self.internet_connected = fetch_utility.has_internet_connection()
-        if self.internet_connected:
-            self.server_connected = fetch_utility.has_server_connection()
-        else:
-            self.server_connected = False
+        self.internet_connected, self.server_connected = self.connection.status(force=force)
 
-    def check_token_usage(self):
+    def run_in_background(self, work, on_done, failed=None):
         """
-        Fetches the total_cost from Flask API endpoint `/token_status`.
+        Run work() on a daemon thread and hand its result to on_done(result) on the main thread, from on_update.
+        If work() raises, on_done gets `failed` instead, so the callback always runs.
         """
-        self.check_connectivity()
-        headers = generate_auth_headers()
-        if self.internet_connected and self.server_connected:
-            self.connection_popup_open = False
+        def task():
             try:
-                response = requests.get(f"{self.request_url}token_status", headers=headers)
-                data = response.json()
-
-                if 'total_cost' in data:
-                    total_cost = data['total_cost']
-
-                    if total_cost >= 4.90:
-                        if debug_mode:
-                            print(f"🚨 WARNING: Token usage is at ${total_cost:.2f}. Approaching limit!")
-                        self.has_tokens = False
-                    else:
-                        if debug_mode:
-                            print(f"Token usage is at ${total_cost}")
-                    return total_cost
-                else:
-                    if debug_mode:
-                        print("❌ Unexpected response structure:", data)
-                    return None
-
+                result = work()
             except Exception as e:
                 if debug_mode:
-                    print(f"❌ Failed to fetch token cost from server: {e}")
-                return None
-        else:
-            self.connection_popup_open = True
-        
+                    print(f"❌ Background task failed: {e}")
+                result = failed
+            self.completed_tasks.put((on_done, result))
+        threading.Thread(target=task, daemon=True).start()
+
+    def check_token_usage(self, force=False):
+        """
+        Checks connectivity and the token budget from `/token_status` in the background, so the window never waits on the network.
+        Until apply_token_status() gets the answer, OUTSIDE shows the closed house with no way in.
+        """
+        if self.token_check_pending:
+            return
+        self.token_check_pending = True
+        # A check that blows up counts as disconnected, so the retry button comes up instead of the door staying shut
+        self.run_in_background(lambda: self.fetch_token_status(force), self.apply_token_status, failed=(False, False, None))
+
+    def fetch_token_status(self, force=False):
+        """
+        Runs on the background thread and only talks to the server, the game itself is left to apply_token_status().
+        Returns (internet_connected, server_connected, total_cost), total_cost is None when it could not be read.
+        """
+        internet_connected, server_connected = self.connection.status(force=force)
+        if not (internet_connected and server_connected):
+            return internet_connected, server_connected, None
+        headers = generate_auth_headers()
+        try:
+            response = self.connection.request("GET", "token_status", fetch_utility.TOKEN_STATUS_TIMEOUT, headers=headers)
+            data = response.json()
+        except Exception as e:
+            if debug_mode:
+                print(f"❌ Failed to fetch token cost from server: {e}")
+            return True, True, None
+
+        if 'total_cost' not in data:
+            if debug_mode:
+                print("❌ Unexpected response structure:", data)
+            return True, True, None
+        return True, True, data['total_cost']
+
+    def apply_token_status(self, status):
+        """ Completion callback for check_token_usage, on the main thread """
+        self.internet_connected, self.server_connected, total_cost = status
+        self.token_check_pending = False
+        self.connection_popup_open = not (self.internet_connected and self.server_connected)
+
+        if total_cost is not None:
+            if total_cost >= 4.90:
+                if debug_mode:
+                    print(f"🚨 WARNING: Token usage is at ${total_cost:.2f}. Approaching limit!")
+                self.has_tokens = False
+            else:
+                if debug_mode:
+                    print(f"Token usage is at ${total_cost}")
 
 
 
@@ -336,4 +521,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
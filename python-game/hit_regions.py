@@ -0,0 +1,252 @@
+import screen_size
+
+""" Declarative hit regions for everything clickable, shared by the Buttons that draw them and by mouse_input """
+
+SCREEN_WIDTH = screen_size.TARGET_WIDTH
+SCREEN_HEIGHT = screen_size.TARGET_HEIGHT
+
+# Intention buttons on the INTRO stage
+CATEGORY_BUTTON_POSITIONS = [
+    (275, 300),  # Button 0
+    (650, 300),  # Button 1
+    (1025, 300),  # Button 2
+    (275, 150),  # Button 3
+    (650, 150),    # Button 4
+    (1025, 150)     # Button 5
+]
+
+# Rows of the HISTORY stage, the y of each row's first line, drawn by draw_utility.draw_history_stage at the same heights
+HISTORY_ROWS = [760 - i * 95 for i in range(6)]  # One per reading_store.HISTORY_PAGE_SIZE
+HISTORY_ROW_X = (140, SCREEN_WIDTH - 140)
+
+# Options menu rows, as offsets from the middle of the screen, drawn by draw_utility.paint_options_menu at the same heights
+MENU_ROWS = {
+    "music": 180,
+    "music_volume": 117,
+    "sfx": 54,
+    "sfx_volume": -9,
+    "low_power": -72,
+    "frame_cap": -135,
+}
+
+## Each context lists its regions as (key, hover name, action) or (key, hover name, action, value).
+## The key matches game.buttons and region_boxes(), the hover name is what Button.draw() compares
+## game.hovered_button against, and the action is looked up in mouse_input.ACTIONS.
+STAGE_REGIONS = {
+    "outside": (
+        ("exit_game", "exit_game", "quit"),
+        ("credits", "credits", "open_credits"),
+        ("step_inside", "step_inside", "step_inside"),
+    ),
+    "outside_closed": (
+        ("exit_game", "exit_game", "quit"),
+    ),
+    "outside_checking": (
+        ("exit_game", "exit_game", "quit"),
+    ),
+    "outside_retry": (
+        ("exit_game", "exit_game", "quit"),
+        ("retry", "retry", "check_tokens"),
+    ),
+    "intro": tuple(
+        (f"button_{i}", f"button_{i}", "choose_intention", i) for i in range(len(CATEGORY_BUTTON_POSITIONS))
+    ) + (
+        ("history", "history", "open_history"),
+    ),
+    "history": tuple(
+        (f"history_row_{i}", f"history_row_{i}", "open_stored_reading", i) for i in range(len(HISTORY_ROWS))
+    ) + (
+        ("history_back", "history_back", "close_history"),
+        ("history_newer", "history_newer", "history_newer"),
+        ("history_older", "history_older", "history_older"),
+    ),
+    "spread": (),
+    "spread_pull": (
+        ("pull_next", "pull_next", "dismiss_reveal"),
+    ),
+    "spread_begin": (
+        ("begin_reading", "begin_reading", "dismiss_reveal"),
+    ),
+    "loading": (),
+    "loading_popup": (
+        ("retry", "retry", "start_loading"),
+        ("exit_game", "exit_game", "quit"),
+    ),
+    "reading_intro": (
+        ("reading_intro_next", "next_card", "next_stage"),
+    ),
+    "reading_cards": (
+        ("reading_card_next", "next_card", "next_stage"),
+        ("reading_card_previous", "previous_card", "previous_stage"),
+    ),
+    "reading_summary": (
+        ("new_reading", "new_reading", "new_reading"),
+        ("reading_summary_previous", "previous_card", "previous_stage"),
+        ("go_outside", "go_outside", "go_outside"),
+    ),
+    "menu": (
+        ("close_menu", "close_menu", "close_menu"),
+        ("toggle_music", "toggle_music", "toggle_music"),
+        ("music_down", "music_down", "music_down"),
+        ("music_up", "music_up", "music_up"),
+        ("toggle_sfx", "toggle_sfx", "toggle_sfx"),
+        ("sfx_down", "sfx_down", "sfx_down"),
+        ("sfx_up", "sfx_up", "sfx_up"),
+        ("toggle_low_power", "toggle_low_power", "toggle_low_power"),
+        ("fps_down", "fps_down", "fps_down"),
+        ("fps_up", "fps_up", "fps_up"),
+    ),
+    "credits": (
+        ("close_menu", "close_menu", "close_credits"),
+    ),
+}
+
+# Contexts where the options cog is not clickable
+NO_OPTIONS_BUTTON = {"menu"}
+
+
+class Region:
+    """ One clickable rectangle, compiled from the table """
+    def __init__(self, key, name, action, box, value=None):
+        self.key = key
+        self.name = name
+        self.action = action
+        self.left, self.right, self.bottom, self.top = box
+        self.value = value
+
+    def contains(self, x, y):
+        return self.left <= x <= self.right and self.bottom <= y <= self.top
+
+
+def region_boxes(game):
+    """
+    Every clickable rectangle as (left, right, bottom, top) in game coordinates, keyed like game.buttons.
+    Hit boxes are a bit more generous than the drawn buttons, same as they have always been.
+    """
+    box_width = game.button_clickbox_width
+    box_height = game.button_clickbox_height
+    bottom = game.y_bottom_button
+
+    def bottom_row(x):
+        return (x - box_width, x + box_width, bottom, bottom + box_height)
+
+    corner_x = game.x_right_button + 200
+    menu_x = SCREEN_WIDTH * 0.66
+    menu_y = SCREEN_HEIGHT // 2
+
+    def menu_box(x, y, half_size):
+        return (x - half_size, x + half_size, y - half_size, y + half_size)
+
+    boxes = {
+        ## -------------------- OUTSIDE / CLOSED / POPUP -------------------- ##
+        "exit_game": (corner_x - box_width // 2, corner_x + box_width // 2, bottom - 95, bottom - 75 + box_height),
+        "credits": (corner_x - box_width // 2, corner_x + box_width // 2, bottom + 75, bottom + 25 + box_height),
+        "step_inside": bottom_row(game.x_middle_button),
+        "retry": bottom_row(game.x_middle_button),
+
+        ## -------------------- SPREAD -------------------- ##
+        "pull_next": bottom_row(game.x_middle_button),
+        "begin_reading": bottom_row(game.x_middle_button),
+
+        ## -------------------- READING -------------------- ##
+        "reading_intro_next": bottom_row(game.x_middle_button),
+        "reading_card_next": bottom_row(game.x_right_button),
+        "reading_card_summary": bottom_row(game.x_right_button),
+        "reading_card_previous": bottom_row(game.x_left_button),
+        "new_reading": bottom_row(game.x_middle_button),
+        "go_outside": bottom_row(game.x_right_button + 100),
+        "reading_summary_previous": bottom_row(game.x_left_button - 100),
+
+        ## -------------------- HISTORY -------------------- ##
+        "history": (130 - 87, 130 + 87, 900 - 50, 900 + 50),
+        "history_back": bottom_row(game.x_left_button),
+        "history_newer": bottom_row(game.x_middle_button),
+        "history_older": bottom_row(game.x_right_button),
+
+        ## -------------------- MENUS -------------------- ##
+        "options": (game.x_right_button + 250 - 100, game.x_right_button + 250 + 100, 900 - 20, 900 - 50 + 100),
+        "close_menu": (game.x_middle_button - 97, game.x_middle_button + 97, 250 - 57, 250 + 57),
+        "toggle_music": menu_box(menu_x, menu_y + MENU_ROWS["music"], 22),
+        "music_down": menu_box(menu_x - 76, menu_y + MENU_ROWS["music_volume"], 20),
+        "music_up": menu_box(menu_x + 76, menu_y + MENU_ROWS["music_volume"], 20),
+        "toggle_sfx": menu_box(menu_x, menu_y + MENU_ROWS["sfx"], 22),
+        "sfx_down": menu_box(menu_x - 76, menu_y + MENU_ROWS["sfx_volume"], 20),
+        "sfx_up": menu_box(menu_x + 76, menu_y + MENU_ROWS["sfx_volume"], 20),
+        "toggle_low_power": menu_box(menu_x, menu_y + MENU_ROWS["low_power"], 22),
+        "fps_down": menu_box(menu_x - 76, menu_y + MENU_ROWS["frame_cap"], 20),
+        "fps_up": menu_box(menu_x + 76, menu_y + MENU_ROWS["frame_cap"], 20),
+    }
+
+    for i, (x, y) in enumerate(CATEGORY_BUTTON_POSITIONS):
+        boxes[f"button_{i}"] = (x - box_width, x + box_width, y - 50, y + 100)
+
+    for i, y in enumerate(HISTORY_ROWS):
+        boxes[f"history_row_{i}"] = (HISTORY_ROW_X[0], HISTORY_ROW_X[1], y - 45, y + 30)
+
+    return boxes
+
+
+def compile_regions(game):
+    """
+    Turn the table into a list of Regions per context, called once at startup and again on resize.
+    The options cog goes last in every context that has it, so stage buttons win any overlap.
+    """
+    boxes = region_boxes(game)
+    compiled = {}
+    for context, entries in STAGE_REGIONS.items():
+        regions = []
+        for entry in entries:
+            key, name, action = entry[:3]
+            value = entry[3] if len(entry) > 3 else None
+            regions.append(Region(key, name, action, boxes[key], value))
+        if context not in NO_OPTIONS_BUTTON:
+            regions.append(Region("options", "options", "open_menu", boxes["options"]))
+        compiled[context] = regions
+    return compiled
+
+
+def current_context(game, game_state):
+    """ Which set of regions is live right now, or None when nothing on screen is clickable """
+    if game.menu_open:
+        return "menu"
+    if game.stage == game_state.OUTSIDE:
+        if game.credits_open:
+            return "credits"
+        if game.token_check_pending:
+            return "outside_checking"
+        if game.has_tokens and game.internet_connected and game.server_connected:
+            return "outside"
+        return "outside_retry" if game.connection_popup_open else "outside_closed"
+    if game.stage == game_state.INTRO:
+        return "intro"
+    if game.stage == game_state.SPREAD:
+        if not game.reveal_active:
+            return "spread"
+        # Same test draw_spread_stage uses to pick the button
+        return "spread_pull" if len(game.selected_cards) <= 2 else "spread_begin"
+    if game.stage == game_state.LOADING:
+        return "loading_popup" if game.connection_popup_open else "loading"
+    if game.stage == game_state.READING_INTRO:
+        return "reading_intro"
+    if game.stage in {
+        game_state.READING_CARD_1,
+        game_state.READING_CARD_2,
+        game_state.READING_CARD_3,
+    }:
+        return "reading_cards"
+    if game.stage == game_state.READING_SUMMARY:
+        return "reading_summary"
+    if game.stage == game_state.HISTORY:
+        return "history"
+    return None
+
+
+def region_at(game, game_x, game_y, game_state):
+    """ Return the Region under the point for the current context, or None """
+    context = current_context(game, game_state)
+    if context is None:
+        return None
+    for region in game.hit_regions[context]:
+        if region.contains(game_x, game_y):
+            return region
+    return None
@@ -3,6 +3,8 @@ from enum import Enum
 from fetch_utility import debug_mode
 import text_utility as TEXT
 import screen_size
+import hit_regions
+from reading_store import HISTORY_PAGE_SIZE
 SCREEN_WIDTH = screen_size.TARGET_WIDTH
 SCREEN_HEIGHT = screen_size.TARGET_HEIGHT
 
@@ -17,177 +19,113 @@ CATEGORIES = ["Love Life", "Professional Development", "Family and Friends", "He
 
 """"""
 
-def handle_mouse_press(game, x, y, _button, _modifiers, game_state):
-    
+def to_game_coords(game, x, y):
+    """ Convert window (x, y) to game (game_x, game_y) through the letterboxed viewport """
     left, right, bottom, top = arcade.get_viewport()
-    
-    # Convert window (x, y) to game (game_x, game_y)
     game_x = left + (x / game.width) * (right - left)
     game_y = bottom + (y / game.height) * (top - bottom)
+    return game_x, game_y
 
-    if game.menu_open:
-         mouse_press_options_menu(game, game_x,game_y)
-    else:
-        if game.stage == game_state.OUTSIDE:
-            if game.credits_open:
-                mouse_press_options_menu(game,game_x,game_y)
-            else:    
-                mouse_press_outside(game, game_x,game_y, game_state)
-        elif game.stage == game_state.INTRO:
-            mouse_press_intro(game,game_x,game_y,game_state)
-        elif game.stage == game_state.SPREAD:
-            mouse_press_spread(game,game_x,game_y,game_state)
-        elif game.stage == game_state.LOADING:
-            if game.connection_popup_open:
-                mouse_press_connection_popup(game,game_x,game_y, game_state)
-        elif game.stage == game_state.READING_INTRO:
-
-            mouse_press_reading_intro(game,game_x,game_y,game_state)
-        elif game.stage in {
-            game_state.READING_CARD_1,
-            game_state.READING_CARD_2,
-            game_state.READING_CARD_3,
-        }:
-            mouse_press_reading_cards(game,game_x,game_y,game_state)
-        elif game.stage == game_state.READING_SUMMARY:
-            mouse_press_reading_summary(game,game_x,game_y,game_state)
-
-        if game.stage != game_state.TITLE:
-             mouse_press_option_button(game, game_x,game_y, game_state)
-    
+def handle_mouse_press(game, x, y, _button, _modifiers, game_state):
+    game_x, game_y = to_game_coords(game, x, y)
 
+    # One lookup in the current stage's hit regions, see hit_regions.py
+    region = hit_regions.region_at(game, game_x, game_y, game_state)
+    if region:
+        ACTIONS[region.action](game, game_state, region)
+    elif game.stage == game_state.SPREAD and not game.reveal_active and not game.menu_open:
+        mouse_press_spread(game, game_x, game_y)
 
-def mouse_press_outside(game, game_x,game_y, game_state):
-    # print(f"Mouse clicked at ({x}, {y})")
-    # print(f"game_state is {game.stage}")
-         
 
-    if (game.x_right_button + 200) - (game.button_clickbox_width // 2)  <= game_x <= game.x_right_button + 200 + (game.button_clickbox_width //2) and \
-        game.y_bottom_button-95 <= game_y <= game.y_bottom_button - 75 + (game.button_clickbox_height):
-        game.sound_manager.play_sfx("button")
-        game.close()
-        return
-    ##Credits button
-    if game.x_right_button + 200 - game.button_clickbox_width // 2 <= game_x <= game.x_right_button + 200 + game.button_clickbox_width // 2 and \
-            game.y_bottom_button+75 <= game_y <= game.y_bottom_button +25 + game.button_clickbox_height:
-        game.credits_open = True
-        game.sound_manager.play_sfx("button")
-        
-        return
-    if game.has_tokens:
-        if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-                game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            if game.connection_popup_open:
-                game.sound_manager.play_sfx("button")
-                game.check_token_usage()
-            else:
-                game.sound_manager.play_sfx("door")
-                game.stage = game_state.INTRO
-
-def mouse_press_intro(game, game_x,game_y, _game_state):
-            button_positions = [
-                (275, 300),  # Button 0
-                (650, 300),  # Button 1
-                (1025, 300),  # Button 2
-                (275, 150),  # Button 3
-                (650, 150),  # Button 4
-                (1025, 150)  # Button 5
-            ]
-
-            # Check if a button is clicked
-            for i, (bx, by) in enumerate(button_positions):
-                if bx - game.button_clickbox_width <= game_x <= bx + game.button_clickbox_width and by - (game.button_clickbox_height // 2) <= game_y <= by + game.button_clickbox_height:  # Button bounds
-                    game.clicked_button = f"button_{i}"
-                    game.sound_manager.play_sfx("button")
-                    game.set_intention(CATEGORIES[i])  # Set intention based on button index
-                    return
-
-def mouse_press_connection_popup(game,game_x,game_y,game_state):
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-                    game.sound_manager.play_sfx("button")
-                    game.start_loading()
-            
+def mouse_press_spread(game, game_x,game_y):
+    card = game.spread_renderer.card_at(game_x,game_y)
+    if card:
+        game.deck.remove(card)
+        game.spread_renderer.remove(card)
+        game.sound_manager.play_sfx("card_move")
+        game.reveal_card(card) 
+        # Trigger popup for selected card
+        if len(game.selected_cards) == 3:
+            # Cards and intention are final now, start on the fortune while the reveal is on screen
+            game.drawn_cards = game.selected_cards
+            game.request_fortune()
+
+
+""" Actions, looked up by the action name in hit_regions.STAGE_REGIONS """
+
+def quit_game(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    game.close()
+
+def open_credits(game, game_state, region):
+    game.credits_open = True
+    game.sound_manager.play_sfx("button")
+
+def close_credits(game, game_state, region):
+    game.credits_open = False
+    game.sound_manager.play_sfx("button")
+
+def step_inside(game, game_state, region):
+    game.sound_manager.play_sfx("door")
+    game.stage = game_state.INTRO
+    game.connection.warm()  # Have the server connection open by the time the reading is asked for
+
+def check_tokens(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    game.check_token_usage(force=True)  # The player asked, so don't answer from the cache
+
+def choose_intention(game, game_state, region):
+    game.clicked_button = region.name
+    game.sound_manager.play_sfx("button")
+    game.set_intention(CATEGORIES[region.value])  # Set intention based on button index
+    game.connection.warm()  # Fresh connection for the fortune request, which goes out on the third card
+
+def dismiss_reveal(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    # Dismiss popup and place the revealed card in the corner
+    game.reveal_active = False
+
+    game.current_revealed_card = None
+    if len(game.selected_cards) == 2:
+        game.start_reading_button_active = True
+        if debug_mode:
+            print(f"is start reading active: {game.start_reading_button_active}")
+    if len(game.selected_cards) == 3:
+        game.drawn_cards = game.selected_cards
+        game.start_loading()
+        game.start_reading_button_active = False
+        if debug_mode:
+            print(f"is start reading active: {game.start_reading_button_active}")
+
+def retry_loading(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    game.connection.invalidate()  # Check again rather than repeat the cached failure
+    game.start_loading(retry=True)
+
+def next_stage(game, game_state, region):
+    advance_reading_stage(game, game_state)
+
+def previous_stage(game, game_state, region):
+    previous_reading_stage(game, game_state)
+
+def new_reading(game, game_state, region):
+    game.reset_data()
+    TEXT.reset_typing_state(game) 
+    for key in game.visited_stages:
+        game.visited_stages[key] = False
+    game.sound_manager.play_sfx("button")
     
-    elif (game.x_right_button + 200) - (game.button_clickbox_width // 2)  <= game_x <= game.x_right_button + 200 + (game.button_clickbox_width //2) and \
-        game.y_bottom_button-95 <= game_y <= game.y_bottom_button - 75 + (game.button_clickbox_height):
-                    game.sound_manager.play_sfx("button")
-                    game.close()             
+    game.stage = game_state.INTRO
 
-def mouse_press_spread(game, game_x,game_y, _game_state):
-            if game.reveal_active:
-                if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and game.y_bottom_button  <= game_y <= game.y_bottom_button  + game.button_clickbox_height:
-                    game.sound_manager.play_sfx("button")
-                    # Dismiss popup and place the revealed card in the corner
-                    game.reveal_active = False
-
-                    game.current_revealed_card = None
-                    if len(game.selected_cards) == 2:
-                        game.start_reading_button_active = True
-                        if debug_mode:
-                            print(f"is start reading active: {game.start_reading_button_active}")
-                    if len(game.selected_cards) == 3:
-                        game.drawn_cards = game.selected_cards
-                        game.start_loading()
-                        game.start_reading_button_active = False
-                        if debug_mode:
-                            print(f"is start reading active: {game.start_reading_button_active}")
-                    return
-                    
-        
-            if not game.reveal_active:
-                for card in reversed(game.deck.cards):
-                    if card.is_clicked(game_x,game_y):
-                        game.deck.cards.remove(card)
-                        game.sound_manager.play_sfx("card_move")
-                        game.reveal_card(card) 
-                        # Trigger popup for selected card
-                        return    
-
-def mouse_press_reading_intro(game,game_x,game_y,game_state):
-            
-            if game.x_middle_button-game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-                advance_reading_stage(game, game_state)
-                return
-            
-
-        
-def mouse_press_reading_cards(game,game_x,game_y,game_state):
-                
-    if game.x_right_button-game.button_clickbox_width <= game_x <= game.x_right_button + game.button_clickbox_width and game.y_bottom_button  <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-        advance_reading_stage(game,game_state)
-        return
-    if game.x_left_button - game.button_clickbox_width <= game_x <= game.x_left_button + game.button_clickbox_width and game.y_bottom_button <= game_y <= game.y_bottom_button +game.button_clickbox_height:
-        previous_reading_stage(game,game_state)
-        return
-
-def mouse_press_reading_summary(game,game_x,game_y, game_state):
-    
-    
-    
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and game.y_bottom_button  <= game_y <= game.y_bottom_button +game.button_clickbox_height:
-        game.reset_data()
-        TEXT.reset_typing_state(game) 
-        for key in game.visited_stages:
-            game.visited_stages[key] = False
-        game.sound_manager.play_sfx("button")
-        
-        game.stage = game_state.INTRO
-    if game.x_left_button - 100 - game.button_clickbox_width <= game_x <= game.x_left_button- 100 + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-        previous_reading_stage(game, game_state)
-        return
-    if game.x_right_button+100 - game.button_clickbox_width <= game_x <= game.x_right_button+100 + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-        game.reset_data()
-        TEXT.reset_typing_state(game) 
-       
-        for key in game.visited_stages:
-            game.visited_stages[key] = False
-
-        game.sound_manager.play_sfx("door")
-        game.stage = game_state.OUTSIDE
+def go_outside(game, game_state, region):
+    game.reset_data()
+    TEXT.reset_typing_state(game) 
+   
+    for key in game.visited_stages:
+        game.visited_stages[key] = False
 
+    game.sound_manager.play_sfx("door")
+    game.stage = game_state.OUTSIDE
 
 def advance_reading_stage(game, game_state):
         """ Advance to the next reading stage. """
@@ -239,62 +177,105 @@ def previous_reading_stage(game, game_state):
         game.sound_manager.play_sfx("card_move")
         TEXT.reset_typing_state(game) 
 
-def mouse_press_option_button(game, game_x,game_y, game_state):
-     if game.x_right_button + 250 - 100 <=game_x<= game.x_right_button + 250 + 100 and \
-            900 -20 <= game_y <= 900 - 50 + 100:
-        game.menu_open = True
-        game.sound_manager.play_sfx("button")
+def open_history(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    game.open_history()
 
-def mouse_press_options_menu(game, game_x,game_y):
-    
-    
-    
-    if game.menu_open:
-        ## -------------------- CLOSE MENU BUTTON -------------------- ##
-        if (game.x_middle_button - 97 <= game_x <= game.x_middle_button + 97 and
-            250 - 57 <= game_y <= 250 + 57):
-            game.menu_open = False
-            game.sound_manager.play_sfx("button")
-
-        ## -------------------- TOGGLE MUSIC -------------------- ##
-        elif (SCREEN_WIDTH * 0.66 - 22 <= game_x <= SCREEN_WIDTH * 0.66 + 22 and
-              SCREEN_HEIGHT // 2 + 150 - 22 <= game_y <= SCREEN_HEIGHT // 2 + 150 + 22):
-            game.sound_manager.toggle_music()
-            game.sound_manager.play_sfx("button")
-
-        ## -------------------- MUSIC VOLUME -------------------- ##
-        elif (SCREEN_WIDTH * 0.66 - 76 - 20 <= game_x <= SCREEN_WIDTH * 0.66 - 76 + 20 and
-              SCREEN_HEIGHT // 2 + 60 - 20 <= game_y <= SCREEN_HEIGHT // 2 + 60 + 20):  # Decrease (-)
-            game.sound_manager.change_music_volume(-0.1)
-            game.sound_manager.play_sfx("button")
-
-        elif (SCREEN_WIDTH * 0.66 + 76 - 20 <= game_x <= SCREEN_WIDTH * 0.66 + 76 + 20 and
-              SCREEN_HEIGHT // 2 + 60 - 20 <= game_y <= SCREEN_HEIGHT // 2 + 60 + 20):  # Increase (+)
-            game.sound_manager.change_music_volume(0.1)
-            game.sound_manager.play_sfx("button")
-
-        ## -------------------- TOGGLE SFX -------------------- ##
-        elif (SCREEN_WIDTH * 0.66 - 22 <= game_x <= SCREEN_WIDTH * 0.66 + 22 and
-              SCREEN_HEIGHT // 2 - 30 - 22 <= game_y <= SCREEN_HEIGHT // 2 - 30 + 22):
-            game.sound_manager.toggle_sfx()
-            game.sound_manager.play_sfx("button")
-
-        ## -------------------- SFX VOLUME -------------------- ##
-        elif (SCREEN_WIDTH * 0.66 - 76 - 20 <= game_x <= SCREEN_WIDTH * 0.66 - 76 + 20 and
-              SCREEN_HEIGHT // 2 - 130 - 20 <= game_y <= SCREEN_HEIGHT // 2 - 130 + 20):  # Decrease (-)
-            game.sound_manager.change_sfx_volume(-0.1)
-            game.sound_manager.play_sfx("button")
-
-        elif (SCREEN_WIDTH * 0.66 + 76 - 20 <= game_x <= SCREEN_WIDTH * 0.66 + 76 + 20 and
-              SCREEN_HEIGHT // 2 - 130 - 20 <= game_y <= SCREEN_HEIGHT // 2 - 130 + 20):  # Increase (+)
-            game.sound_manager.change_sfx_volume(0.1)
-            game.sound_manager.play_sfx("button")
-    if game.credits_open:
-          if (game.x_middle_button - 97 <= game_x <= game.x_middle_button + 97 and
-            250 - 57 <= game_y <= 250 + 57):
-            game.credits_open = False
-            game.sound_manager.play_sfx("button")
-         
+def close_history(game, game_state, region):
+    game.sound_manager.play_sfx("button")
+    game.stage = game_state.INTRO
+
+def history_newer(game, game_state, region):
+    if game.history_offset > 0:
+        game.sound_manager.play_sfx("card_move")
+        game.open_history(game.history_offset - HISTORY_PAGE_SIZE)
+
+def history_older(game, game_state, region):
+    if len(game.history_page) == HISTORY_PAGE_SIZE:
+        game.sound_manager.play_sfx("card_move")
+        game.open_history(game.history_offset + HISTORY_PAGE_SIZE)
+
+def open_stored_reading(game, game_state, region):
+    if region.value < len(game.history_page):  # The last page can have empty rows
+        game.sound_manager.play_sfx("card_spread")
+        game.open_stored_reading(game.history_page[region.value])
+
+def open_menu(game, game_state, region):
+    game.menu_open = True
+    game.sound_manager.play_sfx("button")
+
+def close_menu(game, game_state, region):
+    game.menu_open = False
+    game.sound_manager.play_sfx("button")
+
+def toggle_music(game, game_state, region):
+    game.sound_manager.toggle_music()
+    game.sound_manager.play_sfx("button")
+
+def music_down(game, game_state, region):
+    game.sound_manager.change_music_volume(-0.1)
+    game.sound_manager.play_sfx("button")
+
+def music_up(game, game_state, region):
+    game.sound_manager.change_music_volume(0.1)
+    game.sound_manager.play_sfx("button")
+
+def toggle_sfx(game, game_state, region):
+    game.sound_manager.toggle_sfx()
+    game.sound_manager.play_sfx("button")
+
+def sfx_down(game, game_state, region):
+    game.sound_manager.change_sfx_volume(-0.1)
+    game.sound_manager.play_sfx("button")
+
+def sfx_up(game, game_state, region):
+    game.sound_manager.change_sfx_volume(0.1)
+    game.sound_manager.play_sfx("button")
+
+def toggle_low_power(game, game_state, region):
+    game.scheduler.toggle_low_power()
+    game.set_update_rate(game.scheduler.update_rate)
+    game.sound_manager.play_sfx("button")
+
+def fps_down(game, game_state, region):
+    game.scheduler.step_fps_cap(-1)
+    game.sound_manager.play_sfx("button")
+
+def fps_up(game, game_state, region):
+    game.scheduler.step_fps_cap(1)
+    game.sound_manager.play_sfx("button")
+
+
+ACTIONS = {
+    "quit": quit_game,
+    "open_credits": open_credits,
+    "close_credits": close_credits,
+    "step_inside": step_inside,
+    "check_tokens": check_tokens,
+    "choose_intention": choose_intention,
+    "dismiss_reveal": dismiss_reveal,
+    "start_loading": retry_loading,
+    "next_stage": next_stage,
+    "previous_stage": previous_stage,
+    "new_reading": new_reading,
+    "go_outside": go_outside,
+    "open_menu": open_menu,
+    "open_history": open_history,
+    "close_history": close_history,
+    "history_newer": history_newer,
+    "history_older": history_older,
+    "open_stored_reading": open_stored_reading,
+    "close_menu": close_menu,
+    "toggle_music": toggle_music,
+    "music_down": music_down,
+    "music_up": music_up,
+    "toggle_sfx": toggle_sfx,
+    "sfx_down": sfx_down,
+    "sfx_up": sfx_up,
+    "toggle_low_power": toggle_low_power,
+    "fps_down": fps_down,
+    "fps_up": fps_up,
+}
 
 
 
@@ -310,171 +291,14 @@ def mouse_press_options_menu(game, game_x,game_y):
 
 
 def handle_mouse_motion(game, x, y, _dx, _dy, game_state):
+        game_x, game_y = to_game_coords(game, x, y)
 
-        left, right, bottom, top = arcade.get_viewport()
-        game_x = left + (x / game.width) * (right - left)
-        game_y = bottom + (y / game.height) * (top - bottom)
-
-        if game.menu_open:
-            mouse_motion_options_menu(game, game_x,game_y, game_state)
-        else:    
-            if game.stage == game_state.OUTSIDE:
-                if game.credits_open:
-                    mouse_motion_options_menu(game, game_x,game_y, game_state)
-                else:
-                    mouse_motion_outside(game,game_x,game_y, game_state)
-            if game.stage == game_state.INTRO:
-                mouse_motion_intro(game,game_x,game_y, game_state)
-            if game.stage == game_state.SPREAD:
-                mouse_motion_spread(game,game_x,game_y, game_state)
-            if game.stage == game_state.LOADING:
-                 if game.connection_popup_open:
-                      mouse_motion_connection_popup(game, game_x,game_y, game_state)
-            if game.stage == game_state.READING_INTRO:
-                mouse_motion_reading_intro(game,game_x,game_y, game_state)
-            if game.stage in {
-                game_state.READING_CARD_1,
-                game_state.READING_CARD_2,
-                game_state.READING_CARD_3,
-            }:
-                mouse_motion_reading_cards(game,game_x,game_y,game_state)
-            if game.stage == game_state.READING_SUMMARY:
-                mouse_motion_reading_summary(game,game_x,game_y,game_state)
-
-            if game.stage != game_state.TITLE:
-                mouse_motion_option_button(game, game_x,game_y, game_state)
-
-        
-        
-    
+        region = hit_regions.region_at(game, game_x, game_y, game_state)
+        game.hovered_button = region.name if region else None
 
-def mouse_motion_outside(game,game_x,game_y,game_state):
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            if game.connection_popup_open:
-                game.hovered_button = "retry"
+        if game.stage == game_state.SPREAD and not game.menu_open:
+            if game.reveal_active:
+                game.hovered_card = None  # Ensure no card is hovered when revealing
             else:
-                game.hovered_button = "step_inside"
-    
-    elif (game.x_right_button + 200) - (game.button_clickbox_width // 2)  <= game_x <= game.x_right_button + 200 + (game.button_clickbox_width //2) and \
-        game.y_bottom_button-95 <= game_y <= game.y_bottom_button - 75 + (game.button_clickbox_height):
-            game.hovered_button = "exit_game"
-
-    elif game.x_right_button + 200 - game.button_clickbox_width // 2 <= game_x <= game.x_right_button + 200 + game.button_clickbox_width // 2 and \
-            game.y_bottom_button+75 <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "credits"
-        
-    else:
-            
-            game.hovered_button = None
-
-
-
-
-def mouse_motion_intro(game,game_x,game_y,game_state):
-    # Loop through button positions and detect hover
-    for i, (bx, by) in enumerate([
-        (275, 300),  # Button 0
-        (650, 300),  # Button 1
-        (1025, 300),  # Button 2
-        (275, 150),  # Button 3
-        (650, 150),  # Button 4
-        (1025, 150)  # Button 5
-    ]):
-        # Check if the mouse is within the button's bounds
-        if bx - game.button_clickbox_width <= game_x <= bx + game.button_clickbox_width and by - 50 <= game_y <= by + 100:
-            game.hovered_button = f"button_{i}"
-            break
-        else:
-            game.hovered_button = None
-
-    # do reverse for topmost card
-
-def mouse_motion_spread(game,game_x,game_y,game_state):
-
-    if game.reveal_active and not game.start_reading_button_active:
-        game.hovered_card = None  # Ensure no card is hovered when revealing
-        if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "pull_next"
-        else:
-            game.hovered_button = None  # Reset hover state if not within bounds
-        return
-    elif game.reveal_active and game.start_reading_button_active:
-        game.hovered_card = None
-        if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "begin_reading"
-
-        else:
-            game.hovered_button = None  # Reset hover state if not within bounds
-        return
-# Normal hover behavior
-    game.hovered_card = None
-    game.hovered_button = None
-
-    for card in reversed(game.deck.cards):
-        
-        if card.is_clicked(game_x,game_y): 
-            game.hovered_card = card
-            
-            break
-
-def mouse_motion_connection_popup(game,game_x,game_y,game_state):
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-                game.hovered_button = "retry"
-            
-    
-    elif (game.x_right_button + 200) - (game.button_clickbox_width // 2)  <= game_x <= game.x_right_button + 200 + (game.button_clickbox_width //2) and \
-        game.y_bottom_button-95 <= game_y <= game.y_bottom_button - 75 + (game.button_clickbox_height):
-            game.hovered_button = "exit_game"
-
-    else:
-            game.hovered_button = None
-
-def mouse_motion_reading_intro(game,game_x,game_y,game_state):
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "next_card"
-    else:
-         game.hovered_button = None
-def mouse_motion_reading_cards(game,game_x,game_y,game_state):
-    if game.x_left_button - game.button_clickbox_width <= game_x <= game.x_left_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "previous_card"
-   
-    elif game.x_right_button - game.button_clickbox_width <= game_x <= game.x_right_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "next_card"
-    else:
-         game.hovered_button = None        
-def mouse_motion_reading_summary(game,game_x,game_y,game_state):
-    if game.x_middle_button - game.button_clickbox_width <= game_x <= game.x_middle_button + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "new_reading"
-    
-    elif game.x_left_button - 100 - game.button_clickbox_width <= game_x <= game.x_left_button- 100 + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "previous_card"
-  
-    elif game.x_right_button+100 - game.button_clickbox_width <= game_x <= game.x_right_button+100 + game.button_clickbox_width and \
-        game.y_bottom_button <= game_y <= game.y_bottom_button + game.button_clickbox_height:
-            game.hovered_button = "go_outside"
-    else:
-         game.hovered_button = None
-    # Check if hovering over "Begin Reading" button
-
-def mouse_motion_option_button(game, game_x,game_y, game_state):
-    if game.x_right_button + 250 - 100 <= game_x <= game.x_right_button + 250 + 100 and \
-            900-20 <= game_y <= 900 - 50 + 100:
-        
-        game.hovered_button = "options"
-    
-def mouse_motion_options_menu(game, game_x,game_y, game_state):
-    if game.x_middle_button - (195 // 2) <= game_x <= game.x_middle_button + (195 // 2) and \
-        250 - (115 // 2) <= game_y <= 250 + (115 // 2):
-        game.hovered_button = "close_menu"
-    else: 
-         
-        game.hovered_button = None
+                # Topmost card from the renderer's column index, instead of testing the whole deck
+                game.hovered_card = game.spread_renderer.card_at(game_x,game_y)
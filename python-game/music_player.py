@@ -0,0 +1,143 @@
+import time
+import pyglet.media as media
+from pyglet.media.codecs.base import SourceGroup
+from fetch_utility import debug_mode
+
+""" Streaming music: gapless loops, a crossfade when the track changes, and the same small footprint for any track length """
+
+CROSSFADE_SECONDS = 2.0
+
+
+def open_stream(paths):
+    """ The first candidate that opens as a streaming source """
+    error = None
+    for path in paths:
+        try:
+            return media.load(path, streaming=True)
+        except Exception as e:
+            error = e
+    raise error or FileNotFoundError("No music file to open")
+
+
+class MusicStream:
+    """
+    One playing track. Its player reads from a SourceGroup, which moves from one source to the next without a gap,
+    and update() keeps exactly one more copy of the track queued behind the one playing, using only the group's
+    public add() and has_next(). Each copy is a streaming source that decodes a chunk at a time, and the group
+    drops a copy once it has played. Streaming is what keeps memory flat: a static source would hold the whole
+    decoded track, tens of MB for a few minutes of stereo, for every copy queued.
+    """
+
+    def __init__(self, name, paths, loop=True):
+        self.name = name
+        self.paths = paths
+        self.loop = loop
+        self.group = SourceGroup()
+        self.group.add(open_stream(paths))
+        if loop:
+            self.group.add(open_stream(paths))
+        self.player = media.Player()
+        self.player.queue(self.group)
+        self.gain = 1.0  # Crossfade position, multiplied by the music volume
+        self.target_gain = 1.0
+        self.loops = 0
+
+    def play(self):
+        self.player.play()  # How much audio the driver queues ahead is left to pyglet
+
+    def pause(self):
+        self.player.pause()
+
+    def update(self):
+        if self.loop and not self.group.has_next():
+            # The last copy started playing, queue the next one behind it
+            self.group.add(open_stream(self.paths))
+            self.loops += 1
+
+    def delete(self):
+        self.player.pause()
+        self.player.delete()
+
+
+class MusicPlayer:
+    """
+    Owns every MusicStream. play() fades the current track out and the new one in over CROSSFADE_SECONDS,
+    pause() and resume() act on the same players so nothing is rebuilt, and update() runs the fades.
+    """
+
+    def __init__(self, volume=.8):
+        self.volume = volume
+        self.streams = []
+        self.current = None
+        self.paused = False
+        self.fade = CROSSFADE_SECONDS
+        self.last_update = None
+
+    @property
+    def started(self):
+        return self.current is not None
+
+    def play(self, name, paths, fade=CROSSFADE_SECONDS):
+        if self.current and self.current.name == name:
+            self.resume()
+            return
+        try:
+            stream = MusicStream(name, paths)
+        except Exception as e:
+            if debug_mode:
+                print(f"Failed to open music '{name}': {e}")
+            return
+
+        if self.current and fade:
+            stream.gain = 0.0
+        for old_stream in self.streams:
+            old_stream.target_gain = 0.0
+        self.streams.append(stream)
+        self.current = stream
+        self.fade = fade
+        self._apply_volume(stream)
+        if not self.paused:
+            stream.play()
+
+    def pause(self):
+        self.paused = True
+        for stream in self.streams:
+            stream.pause()
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        self.last_update = None
+        for stream in self.streams:
+            stream.play()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for stream in self.streams:
+            self._apply_volume(stream)
+
+    def _apply_volume(self, stream):
+        stream.player.volume = self.volume * stream.gain
+
+    def update(self):
+        """ Called once a frame: advance the crossfade and keep every loop topped up """
+        now = time.perf_counter()
+        delta_time = now - self.last_update if self.last_update is not None else 0.0
+        self.last_update = now
+        if self.paused:
+            return
+
+        step = delta_time / self.fade if self.fade else 1.0
+        for stream in list(self.streams):
+            if stream.gain < stream.target_gain:
+                stream.gain = min(stream.target_gain, stream.gain + step)
+            elif stream.gain > stream.target_gain:
+                stream.gain = max(stream.target_gain, stream.gain - step)
+            self._apply_volume(stream)
+
+            if stream.gain == 0.0 and stream.target_gain == 0.0:
+                stream.delete()
+                self.streams.remove(stream)
+            else:
+                stream.update()
@@ -0,0 +1,211 @@
+import arcade
+import arcade.gl.vertex_array
+import csv
+import os
+import texture_cache
+import time
+from collections import deque, defaultdict
+from contextlib import contextmanager
+from fetch_utility import debug_mode
+from reading_store import user_data_dir
+
+""" Frame time profiler, F3 toggles the overlay and F4 writes the recorded frames to a CSV file """
+
+ROLLING_FRAMES = 240  # Frames the overlay's numbers are worked out over
+HISTORY_FRAMES = 36000  # Frames kept for the CSV dump, about ten minutes at 60fps
+COUNTERS = ("draw_calls", "texture_loads", "text_draws")
+
+
+def percentile(sorted_values, fraction):
+    """ Nearest rank percentile of an already sorted list """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class FrameProfiler:
+    """
+    Times named sections of on_draw and on_update and counts what each one asks of arcade.
+    Counting works by wrapping arcade.load_texture, texture_cache.load_image, arcade.draw_text, arcade.Text.draw and Geometry.render
+    the first time the profiler is switched on, so a normal run pays nothing for it.
+    draw_calls are arcade's own GL draws, text goes through pyglet and is counted separately in text_draws.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.installed = False
+        self.counting = False
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.sections = {}  # section name -> [ms] + counters, for the frame in progress
+        self.frames = deque(maxlen=HISTORY_FRAMES)
+        self.section_names = []  # Every section seen, in first seen order, for the CSV columns
+        self.last_frame_end = None
+        self.overlay_text = None
+        self.status = ""
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.install()
+            self.frames.clear()
+            self.last_frame_end = None
+        self.counting = self.enabled
+        self.sections = {}
+
+    ## -------------------- COUNTING -------------------- ##
+
+    def install(self):
+        """ Wrap the arcade calls we count, once """
+        if self.installed:
+            return
+        self.installed = True
+        profiler = self
+
+        def counted(function, counter):
+            def wrapper(*args, **kwargs):
+                if profiler.counting:
+                    profiler.counters[counter] += 1
+                return function(*args, **kwargs)
+            wrapper.__wrapped__ = function
+            return wrapper
+
+        arcade.load_texture = counted(arcade.load_texture, "texture_loads")
+        texture_cache.load_image = counted(texture_cache.load_image, "texture_loads")
+        arcade.draw_text = counted(arcade.draw_text, "text_draws")
+        arcade.Text.draw = counted(arcade.Text.draw, "text_draws")
+        geometry = arcade.gl.vertex_array.Geometry
+        geometry.render = counted(geometry.render, "draw_calls")
+
+    @contextmanager
+    def section(self, name):
+        """ Time a block and charge the counters it bumps to `name` """
+        if not self.enabled:
+            yield
+            return
+        before = dict(self.counters)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            totals = self.sections.setdefault(name, [0.0] + [0] * len(COUNTERS))
+            totals[0] += elapsed
+            for i, counter in enumerate(COUNTERS, start=1):
+                totals[i] += self.counters[counter] - before[counter]
+            if name not in self.section_names:
+                self.section_names.append(name)
+
+    def end_frame(self, stage):
+        """ Close the frame at the end of on_draw and record it """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        frame = {
+            "time": now,
+            "stage": stage.name,
+            "frame_ms": (now - self.last_frame_end) * 1000 if self.last_frame_end else 0.0,
+            "work_ms": sum(totals[0] for totals in self.sections.values()),
+            "sections": self.sections,
+        }
+        for i, counter in enumerate(COUNTERS, start=1):
+            frame[counter] = sum(totals[i] for totals in self.sections.values())
+        self.frames.append(frame)
+        self.sections = {}
+        self.last_frame_end = now
+
+    ## -------------------- REPORTING -------------------- ##
+
+    def summary(self):
+        """ Rolling numbers for the overlay """
+        recent = list(self.frames)[-ROLLING_FRAMES:]
+        frame_times = sorted(frame["frame_ms"] for frame in recent if frame["frame_ms"])
+        work_times = sorted(frame["work_ms"] for frame in recent)
+        count = max(len(recent), 1)
+
+        per_section = defaultdict(lambda: [0.0] + [0] * len(COUNTERS))
+        for frame in recent:
+            for name, totals in frame["sections"].items():
+                for i, value in enumerate(totals):
+                    per_section[name][i] += value
+
+        per_stage = defaultdict(list)
+        for frame in recent:
+            per_stage[frame["stage"]].append(frame["work_ms"])
+
+        return {
+            "frame_mean": sum(frame_times) / len(frame_times) if frame_times else 0.0,
+            "work_p50": percentile(work_times, .50),
+            "work_p95": percentile(work_times, .95),
+            "work_p99": percentile(work_times, .99),
+            "counters": {counter: sum(frame[counter] for frame in recent) / count for counter in COUNTERS},
+            "sections": {name: [value / count for value in totals] for name, totals in per_section.items()},
+            "stages": {stage: sum(times) / len(times) for stage, times in per_stage.items()},
+        }
+
+    def overlay_lines(self):
+        stats = self.summary()
+        counters = stats["counters"]
+        lines = [
+            f"frame {stats['frame_mean']:.2f} ms   work p50 {stats['work_p50']:.2f}  p95 {stats['work_p95']:.2f}  p99 {stats['work_p99']:.2f}",
+            f"draw calls {counters['draw_calls']:.0f}   texture loads {counters['texture_loads']:.1f}   text draws {counters['text_draws']:.0f}",
+            "",
+            "section              ms   draws  loads  text",
+        ]
+        for name, (ms, draws, loads, texts) in stats["sections"].items():
+            lines.append(f"{name:<18} {ms:6.2f} {draws:7.0f} {loads:6.1f} {texts:5.0f}")
+        lines.append("")
+        lines.append("stage work (ms)")
+        for stage, ms in stats["stages"].items():
+            lines.append(f"{stage:<18} {ms:6.2f}")
+        if self.status:
+            lines.append("")
+            lines.append(self.status)
+        return lines
+
+    def draw_overlay(self):
+        """ Draw the numbers in the top left corner, without counting the overlay's own draws """
+        if not self.enabled:
+            return
+        self.counting = False
+        lines = self.overlay_lines()
+        if self.overlay_text is None:
+            self.overlay_text = arcade.Text(
+                "", 20, 940, arcade.color.WHITE, 10,
+                width=620, multiline=True, anchor_y="top", font_name="Courier New",
+            )
+        self.overlay_text.text = "\n".join(lines)
+        height = self.overlay_text.content_height + 20
+        arcade.draw_lrtb_rectangle_filled(10, 650, 950, 950 - height, (0, 0, 0, 180))
+        self.overlay_text.draw()
+        self.counting = True
+
+    def dump_csv(self, path=None):
+        """ Write every recorded frame, one row each, so two builds can be compared. Returns the path, or None if it could not be written """
+        if path is None:
+            path = os.path.join(user_data_dir(), time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+        columns = ["frame", "stage", "frame_ms", "work_ms"] + list(COUNTERS)
+        for name in self.section_names:
+            columns.append(f"{name}_ms")
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", newline="") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(columns)
+                for index, frame in enumerate(self.frames):
+                    row = [index, frame["stage"], f"{frame['frame_ms']:.3f}", f"{frame['work_ms']:.3f}"]
+                    row += [frame[counter] for counter in COUNTERS]
+                    for name in self.section_names:
+                        totals = frame["sections"].get(name)
+                        row.append(f"{totals[0]:.3f}" if totals else "")
+                    writer.writerow(row)
+        except OSError as e:
+            self.status = f"could not save {os.path.basename(path)}: {e.strerror or e}"
+            if debug_mode:
+                print(f"Failed to write profiler CSV to {path}: {e}")
+            return None
+        self.status = f"saved {len(self.frames)} frames to {path}"
+        if debug_mode:
+            print(f"Profiler CSV written to {path}")
+        return path
+
+profiler = FrameProfiler()
@@ -0,0 +1,106 @@
+import arcade
+import resource_path
+import texture_cache
+
+""" Loading bar for the LOADING stage, built once and drawn with a fixed handful of quads """
+
+BACKGROUND_SHEET_PATH = resource_path.path("assets/original/pBarBackgroundSpriteSheet.png")
+BACKGROUND_PATH = resource_path.path("assets/original/pBarBackground.png")
+STRETCH_PATH = resource_path.path("assets/original/pBarStretch.png")
+FRONT_PATH = resource_path.path("assets/original/pBarFront.png")
+END_PATH = resource_path.path("assets/original/pBarEnd.png")
+
+BACKGROUND_FRAMES = 4
+BACKGROUND_FRAME_WIDTH = 3296 // 4
+BACKGROUND_FRAME_HEIGHT = 68
+
+# pBarStretch.png is one colour column repeated across, with a 4px transparent border left and right.
+# Cropping the border off lets one stretched quad look the same as the old row of 15px segments.
+STRETCH_CROP_X = 4
+STRETCH_CROP_WIDTH = 756 - 8
+STRETCH_HEIGHT = 60
+SEGMENT_WIDTH = 15  # The old segments, kept so the fill ends where it always has
+SEGMENT_STEP = 10
+
+
+class ProgressBar:
+    """
+    Animated background, static frame, front and end caps, and a single stretched quad for the fill.
+    Every texture is resolved in __init__, so draw() is always five draw calls whatever the progress.
+    """
+
+    def __init__(self, x, y, width=1050, height=65, cap_width=35, frame_rate=0.4):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.cap_width = cap_width
+        self.frame_rate = frame_rate
+        self.progress = 0.0
+
+        self.background_frames = arcade.load_spritesheet(
+            BACKGROUND_SHEET_PATH,
+            sprite_width=BACKGROUND_FRAME_WIDTH,
+            sprite_height=BACKGROUND_FRAME_HEIGHT,
+            columns=BACKGROUND_FRAMES,
+            count=BACKGROUND_FRAMES,
+        )
+        self.background_texture = texture_cache.get_texture(BACKGROUND_PATH)
+        self.front_texture = texture_cache.get_texture(FRONT_PATH)
+        self.end_texture = texture_cache.get_texture(END_PATH)
+        self.stretch_texture = arcade.load_texture(
+            STRETCH_PATH, x=STRETCH_CROP_X, y=0, width=STRETCH_CROP_WIDTH, height=STRETCH_HEIGHT
+        )
+
+    def set_progress(self, progress):
+        """ Progress from 0.0 to 1.0 """
+        self.progress = max(0.0, min(1.0, progress))
+
+    def fill_span(self):
+        """
+        Left edge and width of the fill, matching where the old segment loop started and stopped:
+        one 15px segment every 10px while it stayed 25px short of the progress point.
+        """
+        progress_width = self.progress * (self.width - 50)
+        segments = 0
+        if progress_width > 25:
+            segments = int((progress_width - 25 - 1e-9) // SEGMENT_STEP) + 1
+        if segments == 0:
+            return None
+        left = self.x + self.cap_width - SEGMENT_WIDTH / 2
+        return left, SEGMENT_STEP * (segments - 1) + SEGMENT_WIDTH
+
+    def draw(self, frame_timer):
+        center_x = self.x + self.width // 2
+        center_y = self.y + self.height // 2
+        frame_index = int(frame_timer // self.frame_rate) % BACKGROUND_FRAMES
+
+        arcade.draw_texture_rectangle(center_x, center_y, self.width, self.height, self.background_frames[frame_index])
+        arcade.draw_texture_rectangle(center_x, center_y, self.width, self.height, self.background_texture)
+
+        progress_width = self.progress * (self.width - 50)
+        arcade.draw_texture_rectangle(
+            self.x + 25,
+            self.y + self.height // 4 + 15,
+            self.cap_width,
+            self.height - 10,
+            self.front_texture,
+        )
+        arcade.draw_texture_rectangle(
+            self.x + progress_width + self.cap_width / 2,  # Position at the end of the progress
+            center_y,
+            self.cap_width,
+            self.height - 10,
+            self.end_texture,
+        )
+
+        span = self.fill_span()
+        if span:
+            left, fill_width = span
+            arcade.draw_texture_rectangle(
+                left + fill_width / 2,
+                center_y,
+                fill_width,
+                self.height - 10,
+                self.stretch_texture,
+            )
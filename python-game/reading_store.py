@@ -0,0 +1,177 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from fortune_layout import FortuneLayout, ParagraphLayout, layout_fortune
+from fetch_utility import debug_mode
+
+"""
+Every fortune the server has written, kept on disk so a repeated reading or a look back through the history
+costs no request and no tokens. One SQLite file in the user's data directory, keyed by the three cards
+(name and orientation, in spread order) and the intention.
+"""
+
+APP_DIR_NAME = "VoodooTarotGPT"
+DB_FILE_NAME = "readings.sqlite3"
+HISTORY_PAGE_SIZE = 6
+LAYOUT_VERSION = 1  # Bump when fortune_layout places text differently, stored layouts from older versions are rebuilt
+
+
+def user_data_dir():
+    """ Where the game may keep files between runs, per platform """
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def reading_key(card_names, intention):
+    """ card_names are str(card), which already carries the orientation, e.g. 'The Fool - Reversed' """
+    return json.dumps([list(card_names), intention])
+
+
+def layout_to_json(layout):
+    return json.dumps({"version": LAYOUT_VERSION, "paragraphs": [list(paragraph) for paragraph in layout.paragraphs]})
+
+
+def layout_from_json(text):
+    """ The stored FortuneLayout, or None if it was made by another version of the layout code """
+    data = json.loads(text)
+    if data.get("version") != LAYOUT_VERSION:
+        return None
+    paragraphs = []
+    for lines, line_widths, *placement in data["paragraphs"]:
+        paragraphs.append(ParagraphLayout(tuple(lines), tuple(line_widths), *placement))
+    return FortuneLayout(tuple(paragraphs))
+
+
+class StoredReading:
+    def __init__(self, row_id, card_names, intention, fortune, layout, created_at):
+        self.id = row_id
+        self.card_names = card_names
+        self.intention = intention
+        self.fortune = fortune  # Paragraphs, as game.fortune holds them
+        self.layout = layout
+        self.created_at = created_at
+
+
+class ReadingStore:
+    """
+    The fortunes table plus an index on when each was saved, which the history browser pages through newest first.
+    get_fortune reads and writes it from its own thread, so one connection is shared behind a lock.
+    If the data directory cannot be written the store stays empty and every reading goes to the server as before.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(user_data_dir(), DB_FILE_NAME)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.connection = None
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:  # ":memory:" and bare file names have none
+                os.makedirs(directory, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS readings (
+                    id INTEGER PRIMARY KEY,
+                    reading_key TEXT NOT NULL UNIQUE,
+                    cards TEXT NOT NULL,
+                    intention TEXT NOT NULL,
+                    fortune TEXT NOT NULL,
+                    layout TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS readings_by_time ON readings (created_at);
+            """)
+            self.connection.commit()
+        except (OSError, sqlite3.Error) as e:
+            self.connection = None
+            if debug_mode:
+                print(f"Reading store unavailable at {self.path}: {e}")
+
+    def _reading(self, row):
+        row_id, cards, intention, fortune, layout, created_at = row
+        fortune = json.loads(fortune)
+        return StoredReading(
+            row_id,
+            json.loads(cards),
+            intention,
+            fortune,
+            layout_from_json(layout) or layout_fortune(fortune),
+            created_at,
+        )
+
+    def lookup(self, card_names, intention):
+        """ The stored reading for these cards and intention, or None """
+        if self.connection is None:
+            return None
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    "SELECT id, cards, intention, fortune, layout, created_at FROM readings WHERE reading_key = ?",
+                    (reading_key(card_names, intention),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            if debug_mode:
+                print(f"Failed to look up reading: {e}")
+            return None
+        if row is None:
+            return None
+        self.hits += 1
+        return self._reading(row)
+
+    def save(self, card_names, intention, fortune, layout):
+        if self.connection is None:
+            return
+        try:
+            with self.lock:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO readings (reading_key, cards, intention, fortune, layout, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        reading_key(card_names, intention),
+                        json.dumps(list(card_names)),
+                        intention,
+                        json.dumps(list(fortune)),
+                        layout_to_json(layout),
+                        time.time(),
+                    ),
+                )
+                self.connection.commit()
+        except sqlite3.Error as e:
+            if debug_mode:
+                print(f"Failed to save reading: {e}")
+
+    def history(self, offset=0, limit=HISTORY_PAGE_SIZE):
+        """ One page of past readings, newest first """
+        if self.connection is None:
+            return []
+        try:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT id, cards, intention, fortune, layout, created_at FROM readings "
+                    "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (limit, offset),
+                ).fetchall()
+        except sqlite3.Error as e:
+            if debug_mode:
+                print(f"Failed to read reading history: {e}")
+            return []
+        return [self._reading(row) for row in rows]
+
+    def count(self):
+        if self.connection is None:
+            return 0
+        try:
+            with self.lock:
+                return self.connection.execute("SELECT COUNT(*) FROM readings").fetchone()[0]
+        except sqlite3.Error as e:
+            if debug_mode:
+                print(f"Failed to count readings: {e}")
+            return 0
@@ -0,0 +1,81 @@
+import time
+
+""" Decides which frames are worth drawing, so a reading that has finished typing stops redrawing at 60fps """
+
+FPS_CAPS = (24, 30, 45, 60)  # Choices offered in the options menu, pyglet asks for a frame every 1/60s so 60 is the top
+DEFAULT_FPS_CAP = 60
+LOW_POWER_FPS_CAP = 30
+NORMAL_UPDATE_RATE = 1 / 60
+LOW_POWER_UPDATE_RATE = 1 / 30
+TIMING_SLACK = 0.002  # pyglet's clock is a little early now and then, don't drop a frame over it
+
+
+class RenderScheduler:
+    """
+    A dirty flag plus a frame cap. Anything that changes what is on screen calls mark_dirty():
+    input, the typewriter, the animations in update_manager, stage changes.
+    on_draw asks begin_frame() first and returns straight away when it says no, and TarotGame.flip()
+    skips the buffer swap for that frame, so the last frame we drew stays on screen.
+    """
+
+    def __init__(self, fps_cap=DEFAULT_FPS_CAP):
+        self.enabled = True  # The benchmark turns this off so every on_draw it asks for is drawn
+        self.fps_cap = fps_cap
+        self.low_power = False
+        self.dirty = True
+        self.skipping = False
+        self.last_draw = None
+        self.drawn = 0
+        self.skipped = 0
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    @property
+    def frame_cap(self):
+        """ The cap actually in force, low power mode never goes above LOW_POWER_FPS_CAP """
+        if self.low_power:
+            return min(self.fps_cap, LOW_POWER_FPS_CAP)
+        return self.fps_cap
+
+    @property
+    def update_rate(self):
+        return LOW_POWER_UPDATE_RATE if self.low_power else NORMAL_UPDATE_RATE
+
+    def begin_frame(self):
+        """ Called at the top of on_draw, False means keep what is on screen and draw nothing """
+        now = time.perf_counter()
+        if self.enabled:
+            too_soon = self.last_draw is not None and now - self.last_draw < 1 / self.frame_cap - TIMING_SLACK
+            if not self.dirty or too_soon:
+                self.skipping = True
+                self.skipped += 1
+                return False
+        self.skipping = False
+        self.dirty = False  # Anything marked dirty while this frame draws gets the next one
+        self.last_draw = now
+        self.drawn += 1
+        return True
+
+    ## -------------------- SETTINGS -------------------- ##
+
+    def step_fps_cap(self, direction):
+        """ Move one step through FPS_CAPS, -1 for lower and 1 for higher """
+        index = FPS_CAPS.index(self.fps_cap) if self.fps_cap in FPS_CAPS else len(FPS_CAPS) - 1
+        index = max(0, min(len(FPS_CAPS) - 1, index + direction))
+        self.fps_cap = FPS_CAPS[index]
+        self.dirty = True
+
+    def toggle_low_power(self):
+        self.low_power = not self.low_power
+        self.dirty = True
+
+    def stats(self):
+        total = self.drawn + self.skipped
+        return {
+            "drawn": self.drawn,
+            "skipped": self.skipped,
+            "skipped_fraction": self.skipped / total if total else 0.0,
+            "frame_cap": self.frame_cap,
+            "low_power": self.low_power,
+        }
@@ -1,13 +1,172 @@
 import arcade
+import sys
+try:
+    import audioop  # Deprecated since 3.11 and gone in 3.13, pitched_variants falls back to Player.pitch without it
+except ImportError:
+    audioop = None
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+import pyglet.media as media
+from pyglet.media.codecs.base import StaticMemorySource
 import resource_path
 from fetch_utility import debug_mode
+from music_player import MusicPlayer
+
+DEFAULT_VOICES = 2  # Players kept per SFX, most sounds never overlap themselves
+VOICE_LIMITS = {
+    "typewriter": 4,  # A click is ~0.24s and one starts every other letter, so about four overlap
+    "card_move": 3,
+}
+READ_CHUNK_BYTES = 1 << 16  # Bytes asked of a queue source at a time when reading a sound back for pitching
+PITCH_VARIANTS = {
+    "typewriter": (.95, .975, 1.0, 1.025, 1.05),  # The range text_utility picks each click's speed from
+}
+PCM_BUDGET_BYTES = 2 * 1024 * 1024  # Decoded SFX kept in memory, the least recently played go first past this.
+                                    # Today's SFX come to about 1.5MB with the typewriter's pitched copies
+DECODE_WORKERS = 1  # One is plenty, the point is only to keep decoding off the main thread
+
+
+class VoicePlayer(media.Player):
+    """ A pyglet Player that rewinds and waits at the end of its sound instead of tearing its driver voice down """
+
+    def on_eos(self):
+        self.pause()
+        self.seek(0.0)
+
+
+class Voice:
+    def __init__(self):
+        self.player = VoicePlayer()
+        self.source = None
+        self.started = 0.0
+
+    @property
+    def busy(self):
+        return self.player.playing
+
+    def play(self, source, volume, pitch=1.0):
+        player = self.player
+        if self.source is not source:
+            # Swap the sound in, with the same audio format pyglet keeps the driver voice and just refills it
+            player.queue(source)
+            if self.source is not None:
+                player.next_source()
+            self.source = source
+        else:
+            player.seek(0.0)
+        player.volume = volume
+        player.pitch = pitch
+        player.play()
+        self.started = time.perf_counter()
+
+
+class SfxBank:
+    """
+    One SFX: its decoded sound, any pre-pitched copies, and a fixed pool of voices to play them on.
+    When every voice is busy the one that started longest ago is stolen, it is the closest to finishing.
+    """
+
+    def __init__(self, sound, variants=None, voices=DEFAULT_VOICES):
+        self.sound = sound
+        self.variants = variants or {}
+        self.voices = [Voice() for _ in range(voices)]
+        self.plays = 0
+        self.steals = 0
+
+    @property
+    def pcm_bytes(self):
+        """ Decoded audio held by this bank, the original plus every pitched copy """
+        sources = [self.sound.source] + [source for source in self.variants.values() if source is not self.sound.source]
+        return sum(len(source._data or b"") for source in sources if isinstance(source, media.StaticSource))
+
+    @property
+    def busy(self):
+        return any(voice.busy for voice in self.voices)
+
+    def delete(self):
+        for voice in self.voices:
+            voice.player.delete()
+        self.voices = []
+
+    def play(self, volume, speed=1.0):
+        voice = next((voice for voice in self.voices if not voice.busy), None)
+        if voice is None:
+            voice = min(self.voices, key=lambda voice: voice.started)
+            self.steals += 1
+        if self.variants:
+            nearest = min(self.variants, key=lambda pitch: abs(pitch - speed))
+            voice.play(self.variants[nearest], volume)
+        else:
+            voice.play(self.sound.source, volume, pitch=speed)
+        self.plays += 1
+
+
+def pitched_variants(source, pitches):
+    """
+    Resample a decoded 16 bit sound to each pitch once, at load time, with audioop's linear rate conversion.
+    Every copy keeps the original audio format, so a voice can switch between them without pyglet
+    rebuilding its driver player. Anything but 16 bit PCM, or a Python without audioop, is left to Player.pitch instead.
+    """
+    audio_format = source.audio_format
+    if audioop is None or audio_format is None or audio_format.sample_size != 16 or not isinstance(source, media.StaticSource):
+        return {}
+
+    # Read the samples back the way a Player would, through a fresh queue source
+    queue_source = source.get_queue_source()
+    if queue_source is None:
+        return {}
+    chunks = []
+    while True:
+        audio_data = queue_source.get_audio_data(READ_CHUNK_BYTES)
+        if not audio_data:
+            break
+        chunks.append(audio_data.get_string_data())
+    data = b"".join(chunks)
+    if sys.byteorder == "big":
+        data = audioop.byteswap(data, 2)  # WAV data is little endian, audioop works in native order
+
+    variants = {}
+    for pitch in pitches:
+        if pitch == 1.0:
+            variants[pitch] = source
+            continue
+        # Playing pitch * 1000 input frames in the time of 1000 output frames raises the pitch by `pitch`
+        out, _ = audioop.ratecv(data, 2, audio_format.channels, round(pitch * 1000), 1000, None)
+        if sys.byteorder == "big":
+            out = audioop.byteswap(out, 2)
+        variants[pitch] = StaticMemorySource(out, audio_format)
+    return variants
+
+
+def decode_sfx(sfx_name, paths):
+    """
+    Runs on the decode thread: load the first candidate that decodes and pitch it.
+    Nothing here touches the audio driver, the voices are made on the main thread when the bank is installed.
+    """
+    error = None
+    for path in paths:
+        try:
+            sound = arcade.load_sound(path)
+        except Exception as e:
+            error = e
+            continue
+        pitches = PITCH_VARIANTS.get(sfx_name)
+        return sound, pitched_variants(sound.source, pitches) if pitches else {}
+    raise error or FileNotFoundError(f"No audio file for '{sfx_name}'")
+
 
 class SoundManager:
     def __init__(self, music_file_path):
         self.music_file_path = music_file_path
-        self.music = None
-        self.music_player = None
-        self.sfx_sounds={}
+        self.music_tracks = {}  # track name -> candidate paths, best first
+        self.music_track = "music"  # The track the current stage wants, played once music is on
+        self.music_player = MusicPlayer()
+        self.sfx_paths = {}  # name -> candidate paths, best first, for every SFX we know about
+        self.sfx_sounds = OrderedDict()  # name -> SfxBank for the decoded ones, least recently played first
+        self.pending = {}  # name -> Future from the decode thread
+        self.decoder = None
+        self.evictions = 0
 
         self.music_enabled = True
         self.music_volume = .8
@@ -16,61 +175,130 @@ class SoundManager:
         self.sfx_volume = 1.0
         
 
-    def load_music(self):
-        """Load the music file."""
-     
-        self.music = arcade.Sound(self.music_file_path,streaming=True)
+    def load_music(self, track_name="music", file_path=None):
+        """Register a music track. Nothing is decoded here, MusicPlayer streams it once it plays."""
+        file_path = self.music_file_path if file_path is None else file_path
+        paths = [file_path] if isinstance(file_path, str) else list(file_path)
+        self.music_tracks[track_name] = [resource_path.path(path) for path in paths]
 
 
     def play_music(self, volume=0.5, loop=True):
-        """Play the loaded music at specified volume, optionally looping."""
-        
-        if self.music_player:
-            self.music_player.play()  # Resume music if it's paused??
-        else:
-            self.music_player = self.music.play(volume=volume, loop=loop)
+        """Start the current track at specified volume, or resume it where it was paused."""
+        if self.music_player.started:
+            self.music_player.resume()
+        elif self.music_track in self.music_tracks:
+            self.music_player.set_volume(volume)
+            self.music_player.play(self.music_track, self.music_tracks[self.music_track], fade=0)
+
+    def play_track(self, track_name):
+        """Crossfade to another registered track. With music off it is remembered and played when music comes back."""
+        self.music_track = track_name
+        if self.music_enabled and self.music_player.started and track_name in self.music_tracks:
+            self.music_player.play(track_name, self.music_tracks[track_name])
 
     def pause_music(self):
         """Stop the music."""
-        if self.music_player:
-            self.music_player.pause()
+        self.music_player.pause()
 
 
     def toggle_music(self):
-        if self.music_player:
+        if self.music_player.started:
             if self.music_enabled:
                 self.pause_music()
                 self.music_enabled = False
             else:
-                self.play_music()
                 self.music_enabled = True
+                self.play_music()
+                self.play_track(self.music_track)  # The stage may have changed while it was off
     
     def change_music_volume(self, amount):
         self.music_volume = max(0.0, min(1.0, self.music_volume + amount))
-        if self.music_player:
-            self.music_player.volume = self.music_volume
+        self.music_player.set_volume(self.music_volume)
         if debug_mode:
             print(f"New volume: {self.music_volume}") 
 
     
-    def load_sfx(self, sfx_name, file_path):
+    def load_sfx(self, sfx_name, file_path, lazy=False):
         """
-        Load an SFX sound into the dictionary.
+        Register an SFX under a name.
         sfx_name (str): A key, e.g. 'card_draw'
-        file_path (str): Path to the audio file, e.g. 'assets/sfx/card_draw.wav'
+        file_path (str or list): Path to the audio file, or candidates best first, e.g. from sound_manifest
+        lazy (bool): Only remember the path. It is decoded by prefetch_sfx() or on the first play_sfx()
         """
+        paths = [file_path] if isinstance(file_path, str) else list(file_path)
+        self.sfx_paths[sfx_name] = [resource_path.path(path) for path in paths]
+        if not lazy:
+            self._decode_now(sfx_name)
+
+    def prefetch_sfx(self, sfx_names):
+        """ Decode SFX on the background thread, in the order given """
+        if self.decoder is None:
+            self.decoder = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="sfx")
+        for sfx_name in sfx_names:
+            if sfx_name in self.sfx_paths and sfx_name not in self.sfx_sounds and sfx_name not in self.pending:
+                self.pending[sfx_name] = self.decoder.submit(decode_sfx, sfx_name, self.sfx_paths[sfx_name])
+
+    def update(self):
+        """ Called once a frame, installs whatever the decode thread has finished and steps the music """
+        self.music_player.update()
+        for sfx_name, future in list(self.pending.items()):
+            if future.done():
+                self._install(sfx_name, future)
+
+    def _decode_now(self, sfx_name):
+        """ First use before the background decode got to it, wait for it or decode here """
+        future = self.pending.get(sfx_name)
+        if future is not None:
+            wait([future])
+            self._install(sfx_name, future)
+            return
         try:
-            sfx_sound = arcade.load_sound(resource_path.path(file_path))
-            self.sfx_sounds[sfx_name] = sfx_sound
+            self._add_bank(sfx_name, *decode_sfx(sfx_name, self.sfx_paths[sfx_name]))
         except Exception as e:
             if debug_mode:
                 print(f"Failed to load SFX '{sfx_name}': {e}")
 
+    def _install(self, sfx_name, future):
+        del self.pending[sfx_name]
+        try:
+            sound, variants = future.result()
+        except Exception as e:
+            if debug_mode:
+                print(f"Failed to load SFX '{sfx_name}': {e}")
+            return
+        self._add_bank(sfx_name, sound, variants)
+
+    def _add_bank(self, sfx_name, sound, variants):
+        self.sfx_sounds[sfx_name] = SfxBank(sound, variants, voices=VOICE_LIMITS.get(sfx_name, DEFAULT_VOICES))
+        self._trim(keep=sfx_name)
+
+    def _trim(self, keep=None):
+        """ Drop the least recently played SFX until the decoded audio fits the budget, they reload on their next play """
+        for sfx_name in list(self.sfx_sounds):
+            if self.pcm_bytes() <= PCM_BUDGET_BYTES:
+                return
+            bank = self.sfx_sounds[sfx_name]
+            if sfx_name == keep or bank.busy:
+                continue
+            bank.delete()
+            del self.sfx_sounds[sfx_name]
+            self.evictions += 1
+            if debug_mode:
+                print(f"Evicted SFX '{sfx_name}', {self.pcm_bytes() / 1024:.0f}KB resident")
+
+    def pcm_bytes(self):
+        return sum(bank.pcm_bytes for bank in self.sfx_sounds.values())
+
     def play_sfx(self, sfx_name, volume=None, speed=1.0):
-        """Play a loaded SFX by name."""
-        if sfx_name in self.sfx_sounds and self.sfx_enabled:
+        """Play an SFX by name, on one of its pooled voices, decoding it first if it is not resident."""
+        if not self.sfx_enabled:
+            return
+        if sfx_name not in self.sfx_sounds and sfx_name in self.sfx_paths:
+            self._decode_now(sfx_name)
+        if sfx_name in self.sfx_sounds:
             volume=self.sfx_volume if volume is None else volume 
-            arcade.play_sound(self.sfx_sounds[sfx_name], volume=volume, speed=speed)
+            self.sfx_sounds.move_to_end(sfx_name)  # Most recently played go last, so they are evicted last
+            self.sfx_sounds[sfx_name].play(volume, speed=speed)
         else:
             if debug_mode:
                 print(f"SFX '{sfx_name}' not found. Make sure you've loaded it.")
@@ -86,4 +314,16 @@ class SoundManager:
         self.sfx_volume = max(0.0, min(1.0, self.sfx_volume + amount))
         if debug_mode:
             print(f"New SFX volume: {self.sfx_volume}")
-    
+
+    def sfx_stats(self):
+        """ Plays, voice steals and decoded size per resident SFX """
+        return {
+            "pcm_bytes": self.pcm_bytes(),
+            "budget_bytes": PCM_BUDGET_BYTES,
+            "evictions": self.evictions,
+            "pending": sorted(self.pending),
+            "sounds": {
+                name: {"plays": bank.plays, "steals": bank.steals, "pcm_bytes": bank.pcm_bytes}
+                for name, bank in self.sfx_sounds.items()
+            },
+        }
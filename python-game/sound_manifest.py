@@ -0,0 +1,86 @@
+import json
+import os
+import resource_path
+
+"""
+Maps the game's logical sound names to the files that ship in assets/sound.
+
+Run before packaging to refresh the manifest that gets bundled with the assets:
+    python sound_manifest.py
+At runtime the manifest is read once, and if it is missing the same scan is done in memory.
+"""
+
+SOUND_DIR = r"assets/sound"
+MANIFEST_PATH = r"assets/sound/manifest.json"
+
+# Logical name -> (file name without extension, kind)
+SOUNDS = {
+    "music": ("Pixel 1", "music"),
+    "card_move": ("JDSherbert - Tabletop Games SFX Pack - Paper Flip - 1", "sfx"),
+    "card_spread": ("JDSherbert - Tabletop Games SFX Pack - Deck Shuffle - 1", "sfx"),
+    "button": ("clonck", "sfx"),
+    "door": ("mixkit-creaky-door-open-195", "sfx"),
+    "typewriter": ("mixkit-modern-click-box-check-1120", "sfx"),
+    "wind": ("mixkit-storm-wind-2411", "sfx"),
+}
+
+## Best encoding first. SFX are decoded whole into memory, so a WAV that needs no decoding wins.
+## Music is streamed, so the smaller compressed file wins and is decoded a little at a time.
+FORMAT_PREFERENCE = {
+    "sfx": (".wav", ".ogg", ".mp3"),
+    "music": (".ogg", ".mp3", ".wav"),
+}
+
+_manifest = None
+
+
+def build_manifest(sound_dir=None):
+    """ Every logical sound with the files that exist for it, best first """
+    sound_dir = sound_dir or resource_path.path(SOUND_DIR)
+    available = set(os.listdir(sound_dir)) if os.path.isdir(sound_dir) else set()
+    manifest = {}
+    for name, (stem, kind) in SOUNDS.items():
+        candidates = []
+        for extension in FORMAT_PREFERENCE[kind]:
+            file_name = stem + extension
+            if file_name in available:
+                candidates.append({
+                    "path": f"{SOUND_DIR}/{file_name}",
+                    "bytes": os.path.getsize(os.path.join(sound_dir, file_name)),
+                })
+        manifest[name] = {"kind": kind, "candidates": candidates}
+    return manifest
+
+
+def write_manifest():
+    manifest = build_manifest()
+    with open(resource_path.path(MANIFEST_PATH), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(resource_path.path(MANIFEST_PATH)) as manifest_file:
+                _manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            _manifest = build_manifest()
+    return _manifest
+
+
+def candidates(name):
+    """ Absolute paths for a logical sound, best first. SoundManager falls back down the list if one will not decode """
+    entry = load_manifest().get(name, {})
+    return [resource_path.path(candidate["path"]) for candidate in entry.get("candidates", [])]
+
+
+def sfx_names():
+    return [name for name, entry in load_manifest().items() if entry["kind"] == "sfx"]
+
+
+if __name__ == "__main__":
+    for name, entry in write_manifest().items():
+        best = entry["candidates"][0]["path"] if entry["candidates"] else "MISSING"
+        print(f"{name:<12} {best}")
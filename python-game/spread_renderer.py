@@ -0,0 +1,143 @@
+import arcade
+import math
+
+""" Retained renderer for the 78 card fan in the SPREAD stage """
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 960
+SPREAD_SCALE = .9 / 2  # Same size Card.paint() gives with is_small=True
+HOVER_LIFT = 30
+CURVE_HEIGHT = 50
+INDEX_CELL_WIDTH = 32  # Width of one column of the hover index, in game pixels
+
+
+def compute_spread_layout(cards):
+    """
+    Work out where every card of the fan sits, once per shuffle.
+    Returns three lists (x, y, angle) indexed by the card's slot in the shuffled deck,
+    and stamps each card with its slot so the layout survives cards being pulled from the deck.
+    """
+    xs = []
+    ys = []
+    angles = []
+    if not cards:
+        return xs, ys, angles
+
+    card_spacing = (SCREEN_WIDTH - 300) // len(cards)  # Dynamic spacing
+    curve_center = max(len(cards) // 2, 1)
+    for i, card in enumerate(cards):
+        #Here we add a slight parabolic curve to the deck, oriented up, to simulate someone spreading them in front of you
+        x = 150 + (i * card_spacing)
+        y = (SCREEN_HEIGHT // 2) + CURVE_HEIGHT * ((i - curve_center) / curve_center) ** 2
+
+        #Here we jumble the cards a bit with the offsets and angle pre-generated for each card
+        xs.append(x + card.x_offset)
+        ys.append(y + card.y_offset)
+        angles.append(card.rotation_angle + (180 if card.position == "Reversed" else 0))
+        card.spread_slot = i
+
+    return xs, ys, angles
+
+
+class SpreadRenderer:
+    """
+    Holds one sprite per card in a single SpriteList, so the whole fan is one batched draw.
+    All sprites share the deck's back texture. Hovering and pulling a card only touch that card's sprite.
+    It also keeps a column index over the fan so mouse lookups only test the few cards under the cursor.
+    """
+
+    def __init__(self, deck):
+        self.deck = deck
+        self.sprite_list = arcade.SpriteList()
+        self.card_sprites = {}  # One sprite per card for the life of the deck, reused on every rebuild
+        self.sprites = {}  # The cards currently in the fan
+        self.index = {}
+        self.hovered_card = None
+        self.rebuild()
+
+    def rebuild(self):
+        """ Lay the sprites out from the deck's current layout, called after a shuffle or reset """
+        self.sprite_list.clear()
+        self.sprites = {}
+        self.hovered_card = None
+        xs, ys, angles = self.deck.spread_layout
+
+        for card in self.deck.cards:
+            slot = card.spread_slot
+            sprite = self.card_sprites.get(card)
+            if sprite is None:
+                sprite = arcade.Sprite(texture=self.deck.back_texture, scale=SPREAD_SCALE)
+                self.card_sprites[card] = sprite
+            sprite.center_x = xs[slot]
+            sprite.center_y = ys[slot]
+            sprite.angle = angles[slot]
+            # is_clicked() reads the card position, which paint() no longer sets for the fan
+            card.x = xs[slot]
+            card.y = ys[slot]
+            self.sprites[card] = sprite
+            self.sprite_list.append(sprite)
+
+        self.build_index()
+
+    def _index_columns(self, card):
+        """ Columns of the index a card can cover, tilted and all """
+        radians = math.radians(card.rotation_angle)
+        reach = (abs(card.width * math.cos(radians)) + abs(card.height * math.sin(radians))) * SPREAD_SCALE / 2
+        return range(int((card.x - reach) // INDEX_CELL_WIDTH), int((card.x + reach) // INDEX_CELL_WIDTH) + 1)
+
+    def build_index(self):
+        """
+        Bucket every card into the fixed width columns its x-range touches.
+        Cards go in deck order, so the last card in a column is the one drawn on top.
+        """
+        self.index = {}
+        for card in self.deck.cards:
+            for column in self._index_columns(card):
+                self.index.setdefault(column, []).append(card)
+
+    def card_at(self, x, y):
+        """ Return the topmost card under (x, y), or None """
+        for card in reversed(self.index.get(int(x // INDEX_CELL_WIDTH), ())):
+            lift = HOVER_LIFT if card is self.hovered_card else 0
+            if card.is_clicked(x, y, scale=SPREAD_SCALE, angle=card.rotation_angle, lift=lift):
+                return card
+        return None
+
+    def remove(self, card):
+        """ Drop a pulled card from the fan """
+        if card is self.hovered_card:
+            self.hovered_card = None
+        sprite = self.sprites.pop(card, None)
+        if sprite:
+            sprite.remove_from_sprite_lists()
+        for column in self._index_columns(card):
+            if card in self.index.get(column, ()):
+                self.index[column].remove(card)
+
+    def set_hovered(self, card):
+        """ Lift the hovered card and drop the previous one back into place """
+        if card is self.hovered_card:
+            return
+        if self.hovered_card in self.sprites:
+            self.sprites[self.hovered_card].center_y -= HOVER_LIFT
+        self.hovered_card = card if card in self.sprites else None
+        if self.hovered_card:
+            self.sprites[self.hovered_card].center_y += HOVER_LIFT
+
+    def draw(self, hovered_card=None):
+        self.set_hovered(hovered_card)
+
+        # The outline goes down first, as Card.paint() does, so the hovered card sits on top of it
+        if self.hovered_card:
+            sprite = self.sprites[self.hovered_card]
+            arcade.draw_rectangle_outline(
+                center_x=sprite.center_x,
+                center_y=sprite.center_y,
+                width=self.hovered_card.width * SPREAD_SCALE * .98,
+                height=self.hovered_card.height * SPREAD_SCALE * .98,
+                color=arcade.color.LIGHT_BLUE,
+                border_width=5,
+                tilt_angle=self.hovered_card.rotation_angle,  # Rotate the outline to match the card
+            )
+
+        self.sprite_list.draw()
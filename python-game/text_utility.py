@@ -1,12 +1,16 @@
 import arcade
+import math
+import pyglet
 import random
-import textwrap
+import font_metrics
+from collections import OrderedDict
+from pyglet.image.atlas import AllocatorException
 
-speed = random.uniform(.95,1.05)
 DEFAULT_FONT_SIZE = 16
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 960
 DEFAULT_LINE_HEIGHT = 24
+OUTLINED_TEXT_CACHE_SIZE = 128
 
 def typewriter_lines(
     game,
@@ -39,45 +43,44 @@ def typewriter_lines(
     #         line_width = text_image.width * 1.5
     #         game.line_widths.append(line_width)  # Store width
 
-    for i, line in enumerate(game.lines_to_type):
+    ## Fully typed lines are baked into paragraph_layer once, so they cost a single quad per frame.
+    ## Only the line that is still typing (game.displayed_text) is drawn live.
+    completed_lines = game.current_line_index + (1 if game.typing_complete else 0)
+    paragraph_layer.draw(
+        game,
+        center_x,
+        start_y,
+        completed_lines,
+        font_size=font_size,
+        font_name=font_name,
+        color=color,
+        outline_color=outline_color,
+        outline_thickness=outline_thickness,
+        line_height=line_height
+    )
+
+    i = game.current_line_index
+    if completed_lines <= i < len(game.lines_to_type) and game.displayed_text:
         # Calculate where the line should go vertically
         y = start_y - (i * line_height)
 
         # Get the pre-calculated width for this line, this is calculated below in set_paragraph_typing()
         line_width = game.line_widths[i]
-        
+
         # Calculate the left-aligned starting position from the center line
         adjusted_x = center_x - (line_width // 2)
 
-        
-
-        ## Determine which line is fully typed vs. the current typing line
-        ## This keeps fully typed lines static, while moving to the next one, instead of printing each line over and over again, often times at the same time
-        if i < game.current_line_index:
-            # Fully typed line
-            draw_outlined_line(
-                line=line,
-                x=adjusted_x,
-                y=y,
-                font_size=font_size,
-                font_name=font_name,
-                color=color,
-                outline_color=outline_color,
-                outline_thickness=outline_thickness
-            )
-        elif i == game.current_line_index:
-            # Current line in the process of typing (game.displayed_text)
-            draw_outlined_line(
-                line=game.displayed_text,
-                x=adjusted_x,
-                y=y,
-                font_size=font_size,
-                font_name=font_name,
-                color=color,
-                outline_color=outline_color,
-                outline_thickness=outline_thickness
-            )
-        # else: future lines after current_line_index remain unrendered (or blank)
+        # Current line in the process of typing, it changes every few frames so it skips the text cache
+        _draw_outline_passes(
+            game.displayed_text,
+            adjusted_x,
+            y,
+            font_size,
+            font_name,
+            color,
+            outline_color,
+            outline_thickness
+        )
 
         ## This is my debug tool for measuring the font's actual size, in set_paragraph_typing(), I set the line_width here, line_width = text_image.width * 1.5
         ## This helps us see where the actualy visual of the text box lies, because the internal measurement of the line_width is set for a standard, smaller font
@@ -93,6 +96,228 @@ def typewriter_lines(
             # )
 
 
+def _outline_offsets(outline_thickness):
+    return [
+        (-outline_thickness, 0),
+        (outline_thickness, 0),
+        (0, -outline_thickness),
+        (0, outline_thickness),
+        (-outline_thickness, -outline_thickness),
+        (-outline_thickness, outline_thickness),
+        (outline_thickness, -outline_thickness),
+        (outline_thickness, outline_thickness),
+    ]
+
+
+def _draw_outline_passes(line, x, y, font_size, font_name, color, outline_color, outline_thickness, align="left"):
+    """The raw nine pass outline: eight offset copies in the outline color, then the fill on top."""
+
+    # Draw outline by offsetting in all directions
+    for dx, dy in _outline_offsets(outline_thickness):
+        arcade.draw_text(
+            text=line,
+            start_x=x + dx,
+            start_y=y + dy,
+            color=outline_color,
+            font_size=font_size,
+            anchor_x=align,
+            font_name=font_name
+        )
+
+    # Draw the main text on top
+    arcade.draw_text(
+        text=line,
+        start_x=x,
+        start_y=y,
+        color=color,
+        font_size=font_size,
+        anchor_x=align,
+        font_name=font_name
+    )
+
+
+class OutlinedTextCache:
+    """
+    Bounded LRU of outlined lines that have already been rasterised.
+    The first time a line is asked for, its nine outline passes are rendered once into a region of
+    a private texture atlas. After that the line is drawn as a single textured quad.
+    """
+
+    def __init__(self, max_entries=OUTLINED_TEXT_CACHE_SIZE, atlas_size=(2048, 2048)):
+        self.max_entries = max_entries
+        self.atlas_size = atlas_size
+        self.entries = OrderedDict()  # key -> (texture, center offset x, center offset y)
+        self.atlas = None
+        self.sprite_list = None
+        self.stamp = None
+        self.texture_count = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.flushes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "flushes": self.flushes,
+        }
+
+    def draw(self, line, x, y, font_size, font_name, color, outline_color, outline_thickness, align="left"):
+        if not line:
+            return
+
+        key = (line, font_name, font_size, tuple(color), tuple(outline_color), outline_thickness, align)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._bake(key)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        texture, offset_x, offset_y = entry
+        # One stamp sprite is moved around and re-textured, the same trick arcade uses for draw_texture_rectangle
+        if self.stamp is None:
+            self.stamp = arcade.Sprite(texture=texture)
+            self.sprite_list.append(self.stamp)
+        else:
+            self.stamp.texture = texture
+        self.stamp.center_x = x + offset_x
+        self.stamp.center_y = y + offset_y
+        self.sprite_list.draw()
+
+    def _bake(self, key):
+        line, font_name, font_size, color, outline_color, outline_thickness, align = key
+
+        if self.atlas is None:
+            # Created on first use since it needs the window's GL context
+            self.atlas = arcade.TextureAtlas(self.atlas_size, auto_resize=False)
+            self.sprite_list = arcade.SpriteList(atlas=self.atlas, capacity=1)
+
+        # Measure the line the same way pyglet lays it out, baseline sits `descent` above the bottom
+        label = arcade.Text(line, 0, 0, color, font_size, font_name=font_name)
+        text_width = label.content_width
+        descent = -pyglet.font.load(font_name, font_size).descent
+        pad = math.ceil(outline_thickness) + 1
+        width = math.ceil(text_width) + pad * 2
+        height = math.ceil(label.content_height) + pad * 2
+
+        self.texture_count += 1
+        texture = arcade.Texture.create_empty(f"outlined_text_{self.texture_count}", (width, height))
+
+        while len(self.entries) >= self.max_entries:
+            self._evict()
+        try:
+            self.atlas.add(texture)
+        except AllocatorException:
+            # Evicted regions are not reclaimed by the atlas allocator, so start over with an empty atlas
+            self.flush()
+            self.atlas.add(texture)
+
+        # The region starts out transparent since atlas.add() uploads the empty image, so no clear is needed
+        with self.atlas.render_into(texture):
+            _draw_outline_passes(line, pad, pad + descent, font_size, font_name, color, outline_color, outline_thickness)
+
+        # Where the quad's center sits relative to the anchor point the caller passes in
+        anchor_shift = {"left": 0, "center": text_width / 2, "right": text_width}[align]
+        offset_x = width / 2 - pad - anchor_shift
+        offset_y = height / 2 - pad - descent
+
+        entry = (texture, offset_x, offset_y)
+        self.entries[key] = entry
+        return entry
+
+    def _evict(self):
+        _key, (texture, _x, _y) = self.entries.popitem(last=False)
+        self.atlas.remove(texture)
+        self.evictions += 1
+
+    def flush(self):
+        """Drop every cached line and empty the atlas."""
+        self.entries.clear()
+        if self.stamp is not None:
+            self.stamp.remove_from_sprite_lists()
+            self.stamp = None
+        if self.atlas is not None:
+            self.atlas.clear()
+        self.flushes += 1
+
+
+outlined_text_cache = OutlinedTextCache()
+
+
+class ParagraphLayer:
+    """
+    A screen sized texture that typewriter lines are baked into as they finish typing.
+    The layer remembers how many lines it already holds and only renders the new ones,
+    so a paragraph costs one quad per frame no matter how many lines are on screen.
+    """
+
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.size = size
+        self.atlas = None
+        self.texture = None
+        self.sprite_list = None
+        self.lines = None
+        self.settings = None
+        self.baked_lines = 0
+
+    def _ensure_gl(self):
+        if self.atlas is None:
+            # Created on first use since it needs the window's GL context
+            self.atlas = arcade.TextureAtlas((self.size[0] + 2, self.size[1] + 2), auto_resize=False)
+            self.texture = arcade.Texture.create_empty("paragraph_layer", self.size)
+            self.atlas.add(self.texture)
+            self.sprite_list = arcade.SpriteList(atlas=self.atlas, capacity=1)
+            self.sprite_list.append(arcade.Sprite(
+                texture=self.texture,
+                center_x=self.size[0] / 2,
+                center_y=self.size[1] / 2
+            ))
+
+    def invalidate(self):
+        """Forget the baked lines, the next draw starts from an empty layer."""
+        self.lines = None
+        self.settings = None
+        self.baked_lines = 0
+
+    def draw(self, game, center_x, start_y, completed_lines, font_size, font_name, color, outline_color, outline_thickness, line_height):
+        self._ensure_gl()
+
+        settings = (center_x, start_y, font_size, font_name, tuple(color), tuple(outline_color), outline_thickness, line_height)
+        if self.lines is not game.lines_to_type and self.settings == settings and self.lines is not None \
+                and tuple(game.lines_to_type[:self.baked_lines]) == tuple(self.lines[:self.baked_lines]):
+            self.lines = game.lines_to_type  # The same paragraph with more streamed in, what is baked stays
+        if self.lines is not game.lines_to_type or self.settings != settings:
+            # New paragraph (set_paragraph_typing always builds a new list) or it moved, start over
+            self.atlas.fbo.clear()
+            self.lines = game.lines_to_type
+            self.settings = settings
+            self.baked_lines = 0
+
+        completed_lines = min(completed_lines, len(self.lines))
+        if completed_lines > self.baked_lines:
+            with self.atlas.render_into(self.texture):
+                for i in range(self.baked_lines, completed_lines):
+                    line = self.lines[i]
+                    if not line:
+                        continue
+                    y = start_y - (i * line_height)
+                    adjusted_x = center_x - (game.line_widths[i] // 2)
+                    _draw_outline_passes(line, adjusted_x, y, font_size, font_name, color, outline_color, outline_thickness)
+            self.baked_lines = completed_lines
+
+        if self.baked_lines:
+            self.sprite_list.draw()
+
+
+paragraph_layer = ParagraphLayer()
+
+
 def draw_outlined_line(
         line,
         x,
@@ -106,41 +331,19 @@ def draw_outlined_line(
     ):
         
 
-        """Draw a single line of text with an outline, at a fixed position."""
-
-
-        offsets = [
-            (-outline_thickness, 0),
-            (outline_thickness, 0),
-            (0, -outline_thickness),
-            (0, outline_thickness),
-            (-outline_thickness, -outline_thickness),
-            (-outline_thickness, outline_thickness),
-            (outline_thickness, -outline_thickness),
-            (outline_thickness, outline_thickness),
-        ]
-
-        # Draw outline by offsetting in all directions
-        for dx, dy in offsets:
-            arcade.draw_text(
-                text=line,
-                start_x=x + dx,
-                start_y=y + dy,
-                color=outline_color,
-                font_size=font_size,
-                anchor_x=align,
-                font_name=font_name
-            )
-
-        # Draw the main text on top
-        arcade.draw_text(
-            text=line,
-            start_x=x,
-            start_y=y,
-            color=color,
+        """Draw a single line of text with an outline, at a fixed position.
+        The outline is baked once by `outlined_text_cache` and drawn as one quad after that."""
+
+        outlined_text_cache.draw(
+            line,
+            x,
+            y,
             font_size=font_size,
-            anchor_x=align,
-            font_name=font_name
+            font_name=font_name,
+            color=color,
+            outline_color=outline_color,
+            outline_thickness=outline_thickness,
+            align=align
         )
 
 
@@ -157,36 +360,66 @@ def set_typing_text(game, new_text):
         game.typing_timer = 0  
 
 
-def set_paragraph_typing(game, paragraph, font_size=18, font_name = "Old School Adventures", color=arcade.color.WHITE, width =(SCREEN_WIDTH-200)):
+def set_paragraph_typing(game, paragraph, font_size=DEFAULT_FONT_SIZE, font_name = "Old School Adventures", color=arcade.color.WHITE, width =(SCREEN_WIDTH-200)):
     """
     Sets up the typing effect for a multi-line paragraph.
+    Lines are wrapped to `width` pixels and measured with the font_metrics table, so this is plain arithmetic.
+    font_size needs to match the size the paragraph is drawn at for the centering to line up.
     """
     
     if not game.lines_to_type or game.current_text != paragraph:  # Prevent resetting
-        lines = []
-        for block in paragraph.split("\n\n"):  # Split into paragraphs
-            wrapped_lines = textwrap.wrap(block, width= width // font_size)
-            lines.extend(wrapped_lines + [""])  # Add wrapped lines and an empty line for spacing
+        lines, line_widths = wrap_paragraph(paragraph, width, font_size)
+        game.typing_open = False
 
         game.lines_to_type = lines  # Store all lines
         game.current_line_index = 0  # Start from the first line
-        game.line_widths = []
-        for line in game.lines_to_type:  ## This measure the pixel width of each line dynamically
-            text_image = arcade.create_text_image(
-                text=line,
-                font_size=font_size,
-                font_name=font_name,
-                text_color=color,
-                align= "center"
-            )
-            line_width = text_image.width * 1.5 ##Account for the fonts larger size and glyph boxes
-          
-            game.line_widths.append(line_width) 
-            
+        game.typing_complete = False
+        ## Pixel width of each line, typewriter_lines uses it to center the left aligned typing
+        game.line_widths = line_widths
         
         set_typing_text(game, game.lines_to_type[0])  
 
 
+def wrap_paragraph(paragraph, width, font_size=DEFAULT_FONT_SIZE):
+    """
+    Wrap a paragraph to `width` pixels and measure every line, returns (lines, line_widths).
+    Blocks separated by a blank line keep an empty line between them. Plain arithmetic, safe off the main thread.
+    """
+    lines = []
+    for block in paragraph.split("\n\n"):  # Split into paragraphs
+        wrapped_lines = font_metrics.wrap_text(block, width, font_size)
+        lines.extend(wrapped_lines + [""])  # Add wrapped lines and an empty line for spacing
+    return lines, [font_metrics.line_width(line, font_size) for line in lines]
+
+
+def set_layout_typing(game, layout):
+    """
+    set_paragraph_typing() for a paragraph fortune_layout has already wrapped and measured,
+    so starting a reading stage does no text work at all.
+    A streamed paragraph comes back here each time it grows, and typing carries on where it was.
+    """
+    if game.lines_to_type is layout.lines:
+        return
+    previous = game.typing_layout
+    if previous is not None and not previous.complete and game.lines_to_type is previous.lines:
+        # More of the paragraph we are typing arrived. Words are only ever added at the end,
+        # so the typed lines are unchanged and the line being typed can only get longer
+        game.lines_to_type = layout.lines
+        game.line_widths = layout.line_widths
+        game.current_line_index = min(game.current_line_index, len(layout.lines) - 1)
+        game.current_text = layout.lines[game.current_line_index]
+        game.typing_complete = False
+    else:
+        game.lines_to_type = layout.lines
+        game.line_widths = layout.line_widths
+        game.current_line_index = 0
+        game.typing_complete = False
+
+        set_typing_text(game, layout.lines[0])
+    game.typing_layout = layout
+    game.typing_open = not layout.complete
+
+
 def draw_outlined_paragraph(
     game,
     center_x,
@@ -203,23 +436,19 @@ def draw_outlined_paragraph(
     if not game.lines_to_type:
         return  # Prevent drawing if there's no text
 
-    for i, line in enumerate(game.lines_to_type):  
-        y = start_y - (i * line_height)
-
-        # Ensure width is calculated the same way as in set_paragraph_typing()
-        line_width = game.line_widths[i]  # Use pre-stored widths
-        adjusted_x = center_x - (line_width // 2)
-
-        draw_outlined_line(
-            line=line,
-            x=adjusted_x,
-            y=y,
-            font_size=font_size,
-            font_name=font_name,
-            color=color,
-            outline_color=outline_color,
-            outline_thickness=outline_thickness
-        )
+    # Every line is already typed, so the whole paragraph gets baked into the layer at once
+    paragraph_layer.draw(
+        game,
+        center_x,
+        start_y,
+        len(game.lines_to_type),
+        font_size=font_size,
+        font_name=font_name,
+        color=color,
+        outline_color=outline_color,
+        outline_thickness=outline_thickness,
+        line_height=line_height
+    )
 
 def update_typing_effect(game, delta_time):
     """
@@ -236,12 +465,14 @@ def update_typing_effect(game, delta_time):
             if hasattr(game, "sound_manager"):
                         if not game.visited_stages[game.stage]:
                             if game.text_index % 2 == 0:
-                                    game.sound_manager.play_sfx("typewriter", volume=.5, speed = speed)
+                                    game.sound_manager.play_sfx("typewriter", volume=.5, speed = random.uniform(.95,1.05))  # Snapped to a pre-pitched click
 
 
             game.typing_timer = 0
         else:  # Current line is finished
-            if game.current_line_index < len(game.lines_to_type) - 1:
+            # A paragraph that is still streaming ends in a spacer line, wait on the last real line for more text
+            last_line = len(game.lines_to_type) - (2 if game.typing_open else 1)
+            if game.current_line_index < last_line:
                 # Move to the next line
                 
                 game.current_line_index += 1
@@ -251,7 +482,7 @@ def update_typing_effect(game, delta_time):
                 #     debug_x_list.append((SCREEN_WIDTH //2)- (line //2))
                     # print(f"{debug_x_list}")
                 set_typing_text(game, game.lines_to_type[game.current_line_index])
-            else:
+            elif not game.typing_open:
                 # All lines are finished
                 
                 game.typing_complete = True
@@ -267,20 +498,13 @@ def reset_typing_state(game):
     game.current_text = ""
     game.displayed_text = ""
     game.typing_complete = False
+    game.typing_layout = None
+    game.typing_open = False
 
 def wrap_text_paragraphs(text):
-    """Split and wrap the text text into paragraphs."""
+    """Split the text into paragraphs.
+    Wrapping happens later by pixel width in set_paragraph_typing(), so the paragraphs are only trimmed here."""
 
     paragraphs = text.split('\n')  # Split the text into paragraphs
 
-    # Handle wrapping logic
-    default_width = 40
-    last_paragraph_width = 55
-    last_index = len(paragraphs) - 1
-    wrapped_paragraphs = [
-        textwrap.fill(p.strip(), width=last_paragraph_width if i == last_index else default_width)
-        for i, p in enumerate(paragraphs) if p.strip()
-    ]
-
-    return wrapped_paragraphs
-
+    return [p.strip() for p in paragraphs if p.strip()]
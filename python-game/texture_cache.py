@@ -0,0 +1,74 @@
+import arcade
+import PIL.Image
+from fetch_utility import debug_mode
+
+""" Shared texture cache, every texture is resolved from disk once and handed out by reference """
+
+
+def load_image(path):
+    """ Decode a file into the RGBA image a Texture is built from, the profiler counts calls to this as texture loads """
+    return PIL.Image.open(path).convert("RGBA")
+
+
+class TextureCache:
+    def __init__(self):
+        self.textures = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """
+        Return the Texture for `path`, loading it only the first time it is asked for.
+        Every lookup counts as a hit or a miss so we can check nothing loads inside on_draw.
+        """
+        texture = self.textures.get(path)
+        if texture is None:
+            self.misses += 1
+            # Built from the image directly, as the preloader does. arcade.load_texture keeps every Texture and image
+            # in its own module cache even with can_cache=False, and then discard() could never free anything
+            texture = arcade.Texture(path, image=load_image(path))
+            self.textures[path] = texture
+            if debug_mode:
+                print(f"Texture loaded: {path}")
+        else:
+            self.hits += 1
+        return texture
+
+    def add(self, path, texture):
+        """ Store a texture that was loaded somewhere else, like the asset preloader """
+        self.textures[path] = texture
+
+    def discard(self, path):
+        """
+        Forget a texture and take it out of the default atlas, so the next get() loads it again.
+        Textures here never go through arcade.load_texture, so its module cache holds no copy, and once
+        the caller lets go the Texture, its PIL image and the SpriteList draw_sized made for it are freed together.
+        """
+        texture = self.textures.pop(path, None)
+        if texture is None:
+            return
+        atlas = arcade.get_window().ctx.default_atlas
+        if atlas.has_texture(texture):
+            atlas.remove(texture)
+        if debug_mode:
+            print(f"Texture released: {path}")
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "resident": len(self.textures),
+            "resident_bytes": sum(texture.width * texture.height * 4 for texture in self.textures.values()),
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+
+cache = TextureCache()
+
+
+def get_texture(path):
+    """ Shortcut for cache.get(path) """
+    return cache.get(path)
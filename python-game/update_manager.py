@@ -2,15 +2,21 @@ import text_utility as TEXT
 
 """ Updates game each frame and hold timer logics """
 
+EXPECTED_FORTUNE_BYTES = 1800  # About five paragraphs of three or four sentences, for the streaming progress bar
+
 def handle_animation(game, delta_time, game_state):
     if game.menu_open: # This freezes/pauses the game if the options menu is open
         return 
     else:
 
+        typing_before = (game.displayed_text, game.current_line_index, game.typing_complete)
         TEXT.update_typing_effect(game, delta_time) ## This is a key time calculation for the Typewriter effect
+        if (game.displayed_text, game.current_line_index, game.typing_complete) != typing_before:
+            game.scheduler.mark_dirty()  # A new letter, redraw. Once typing is done the reading stages sit idle
 
             ##----Tracks Title Screen transitions----#
         if game.stage == game_state.TITLE:
+            game.scheduler.mark_dirty()  # Fading the whole time
             game.time_in_state += delta_time
             if game.time_in_state > 14:
                 game.stage = game_state.OUTSIDE
@@ -30,6 +36,7 @@ def handle_animation(game, delta_time, game_state):
 
                 # Reset the time in the new state
                 game.time_in_state = 0.0
+                game.scheduler.mark_dirty()  # The house only changes when the frame does
 
                 new_state = game.states[game.state_index]
 
@@ -45,19 +52,27 @@ def handle_animation(game, delta_time, game_state):
 
             ## ---- Handles Progress Bar ---- ##
         if game.stage == game_state.LOADING:
+            game.scheduler.mark_dirty()  # Animated bar background and a moving progress bar
             
             game.frame_timer += delta_time
 
             if game.frame_timer >game.frame_rate *4:
                 game.frame_timer -= game.frame_rate *4
 
-            if not game.api_call_complete:
-                # load progress bar with api is called
-                game.loading_progress += delta_time / 5  # adjust speed
+            # A streamed fortune can start once its first paragraph is whole, until then the bar follows the bytes
+            layout = game.fortune_layout
+            text_ready = game.api_call_complete or (layout is not None and bool(layout.paragraphs) and layout.paragraphs[0].complete)
+            if not text_ready:
+                if game.fortune_streaming:
+                    # Real progress, the bytes of fortune received so far
+                    game.loading_progress = max(game.loading_progress, game.fortune_bytes / EXPECTED_FORTUNE_BYTES)
+                else:
+                    # load progress bar with api is called
+                    game.loading_progress += delta_time / 5  # adjust speed
                 game.loading_progress = min(game.loading_progress, 0.95)  # cap at 95%
             else:
-                # finish progress bar if api is done loading first
-                game.loading_progress += delta_time / 2  
+                # finish progress bar if api is done loading first, quickly when the reading is already arriving or was stored
+                game.loading_progress += delta_time * 4 if game.fortune_streaming or game.fortune_cached else delta_time / 2
                 if game.loading_progress >= 1.0:
                     game.loading_progress = 1.0
                     if not game.connection_popup_open:
@@ -1,5 +1,5 @@
 import os
-from flask import Flask, jsonify, request, json, abort
+from flask import Flask, jsonify, request, json, abort, Response, stream_with_context
 from verify_request import verify_input 
 import hashlib
 import psycopg2
@@ -38,6 +38,20 @@ def verify_authentication():
     except: 
         abort(403)
 
+FORTUNE_MODEL = "gpt-5-mini"
+FORTUNE_PROMPT = """
+                        You are a voodoo practicing witch in New Orleans who provides customers fortunes using a traditional tarot card deck.
+                        The customer will tell you what type of information they are seeking and will set an intention with you. 
+                        They will then pull three tarot cards, one representing the past, one the present, and the last the message of the future.
+                        You will provide back a concise, spooky, and extreme fortune using a bayou witch accent.
+                        You will break down each card reading into separate 3-4 sentence paragraphs, and add a final paragraph summarizing the reading and how the cards relate to each other.
+                        Generate the fortune as plain paragraphs with no titles or headers, there should only be four line breaks.
+                        There will be 5 Paragraphs.
+                        Paragraph 1 should be a 2-sentence introduction or overview, ideally mentioning the intention.
+                        Paragraph 2-4 should be the readings for each card.
+                        Paragraph 5 should be the summarization of the reading and should be no more than 360 characters long.
+                    """
+
 def get_db_connection():
     DB_CONNECTION_URL = os.environ.get('DB_CONNECTION_URL')
     conn = psycopg2.connect(DB_CONNECTION_URL)
@@ -58,68 +72,30 @@ def fortune():
     if not verify_input(cards, intention):
         abort(422, "Parameters are not valid")
 
+    messages = build_messages(cards, intention)
+    request_info = {
+        "ip": request.remote_addr,
+        "user_agent": request.headers.get('User-Agent'),
+        "path": request.path,
+        "method": request.method,
+    }
+
+    # The game asks for a stream so it can start typing the first paragraph while the rest is written
+    if data.get('stream') or request.accept_mimetypes.best == "text/event-stream":
+        return stream_fortune(messages, cards, intention, request_info)
+
     try:
         # === 1. CALL OPENAI API ===
         openai_client = openai.Client(api_key=os.getenv('OPENAI_API_KEY'))
         resp = openai_client.chat.completions.create(
-            model="gpt-5-mini",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": """
-                        You are a voodoo practicing witch in New Orleans who provides customers fortunes using a traditional tarot card deck.
-                        The customer will tell you what type of information they are seeking and will set an intention with you. 
-                        They will then pull three tarot cards, one representing the past, one the present, and the last the message of the future.
-                        You will provide back a concise, spooky, and extreme fortune using a bayou witch accent.
-                        You will break down each card reading into separate 3-4 sentence paragraphs, and add a final paragraph summarizing the reading and how the cards relate to each other.
-                        Generate the fortune as plain paragraphs with no titles or headers, there should only be four line breaks.
-                        There will be 5 Paragraphs.
-                        Paragraph 1 should be a 2-sentence introduction or overview, ideally mentioning the intention.
-                        Paragraph 2-4 should be the readings for each card.
-                        Paragraph 5 should be the summarization of the reading and should be no more than 360 characters long.
-                    """
-                },
-                {
-                    "role": "user",
-                    "content": f"My intention is {intention} and the three cards I drew were {cards[0]}, {cards[1]}, and {cards[2]}."
-                }
-            ],
+            model=FORTUNE_MODEL,
+            messages=messages,
         )
 
         fortune_text = resp.choices[0].message.content
 
-        # === 2. TOKEN USAGE DATA ===
-        input_rate = 0.15 / 1000000
-        cached_input_rate = 0.075 / 1000000
-        output_rate = 0.6 / 1000000
-
-        cached_tokens = resp.usage.prompt_tokens_details.cached_tokens if hasattr(resp.usage, 'prompt_tokens_details') else 0
-        input_cost = (resp.usage.prompt_tokens - cached_tokens) * input_rate
-        cached_input_cost = cached_tokens * cached_input_rate
-        output_cost = resp.usage.completion_tokens * output_rate
-        total_cost = cached_input_cost + input_cost + output_cost
-
-        update_token_tracking(total_cost)
-
-        # === SERVER TERMINAL LOGGING ===
-        print("\n🔮 Token Usage for This Reading:")
-        print(f"Prompt tokens: {resp.usage.prompt_tokens}")
-        print(f"Cached Prompt tokens: {cached_tokens}")
-        print(f"Completion tokens: {resp.usage.completion_tokens}")
-        print(f"Total tokens: {resp.usage.total_tokens}")
-        print(f"💰 Token Costs: ${total_cost:.6f}")
-
-        # === 3. UPDATE USER REQUEST LOG ===
-        log_user_request(
-            ip=request.remote_addr,
-            user_agent=request.headers.get('User-Agent'),
-            path=request.path,
-            method=request.method,
-            payload={'cards': cards, 'intention': intention},
-            tokens_used=resp.usage.total_tokens,
-            cost=total_cost
-        )
-
+        # === 2. TOKEN USAGE DATA AND USER REQUEST LOG ===
+        total_cost = record_usage(resp.usage, cards, intention, request_info)
 
         # === RETURN DATA TO GAME ===
         return jsonify({
@@ -131,6 +107,96 @@ def fortune():
     except Exception as e:
         print(f"OpenAI API Call Failed: {e}")
         return jsonify({"error": f"OpenAI API Call Failed: {str(e)}"}), 50
+
+
+def build_messages(cards, intention):
+    return [
+        {
+            "role": "system", 
+            "content": FORTUNE_PROMPT
+        },
+        {
+            "role": "user",
+            "content": f"My intention is {intention} and the three cards I drew were {cards[0]}, {cards[1]}, and {cards[2]}."
+        }
+    ]
+
+
+def record_usage(usage, cards, intention, request_info):
+    """Price a completion's token usage, add it to token_tracking and log the request. Returns the cost."""
+    input_rate = 0.15 / 1000000
+    cached_input_rate = 0.075 / 1000000
+    output_rate = 0.6 / 1000000
+
+    cached_tokens = usage.prompt_tokens_details.cached_tokens if getattr(usage, 'prompt_tokens_details', None) else 0
+    input_cost = (usage.prompt_tokens - cached_tokens) * input_rate
+    cached_input_cost = cached_tokens * cached_input_rate
+    output_cost = usage.completion_tokens * output_rate
+    total_cost = cached_input_cost + input_cost + output_cost
+
+    update_token_tracking(total_cost)
+
+    # === SERVER TERMINAL LOGGING ===
+    print("\n🔮 Token Usage for This Reading:")
+    print(f"Prompt tokens: {usage.prompt_tokens}")
+    print(f"Cached Prompt tokens: {cached_tokens}")
+    print(f"Completion tokens: {usage.completion_tokens}")
+    print(f"Total tokens: {usage.total_tokens}")
+    print(f"💰 Token Costs: ${total_cost:.6f}")
+
+    # === UPDATE USER REQUEST LOG ===
+    log_user_request(
+        ip=request_info["ip"],
+        user_agent=request_info["user_agent"],
+        path=request_info["path"],
+        method=request_info["method"],
+        payload={'cards': cards, 'intention': intention},
+        tokens_used=usage.total_tokens,
+        cost=total_cost
+    )
+    return total_cost
+
+
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+def stream_fortune(messages, cards, intention, request_info):
+    """
+    Server-sent events straight from the OpenAI stream:
+        event: delta   data: {"text": "..."}                       as each piece of the fortune arrives
+        event: done    data: {"tokens_used": 123, "cost": 0.0001}  once it is complete and billed
+        event: error   data: {"error": "..."}                      if the completion fails part way
+    """
+    def generate():
+        try:
+            openai_client = openai.Client(api_key=os.getenv('OPENAI_API_KEY'))
+            stream = openai_client.chat.completions.create(
+                model=FORTUNE_MODEL,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},  # The last chunk carries the usage for billing
+            )
+            usage = None
+            for chunk in stream:
+                if chunk.usage:
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield sse_event("delta", {"text": chunk.choices[0].delta.content})
+
+            total_cost = record_usage(usage, cards, intention, request_info) if usage else 0.0
+            yield sse_event("done", {"tokens_used": usage.total_tokens if usage else 0, "cost": total_cost})
+
+        except Exception as e:
+            print(f"OpenAI API Call Failed: {e}")
+            yield sse_event("error", {"error": f"OpenAI API Call Failed: {str(e)}"})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},  # Keep proxies from holding the stream back
+    )
+
     
 def update_token_tracking(cost):
     """Increment request_count and add cost to total_cost in token_tracking table."""